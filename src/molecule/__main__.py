@@ -19,8 +19,22 @@
 #  DEALINGS IN THE SOFTWARE.
 """Molecule CLI main entry point."""
 
-from molecule.shell import main
+import sys
+
+from molecule import daemon
+
+
+def main() -> None:
+    """Run Molecule, through the daemon started by ``molecule serve`` if any."""
+    code = daemon.forward(sys.argv)
+    if code is not None:
+        sys.exit(code)
+
+    # Imported here, as forwarded commands do not need it.
+    from molecule.shell import main as shell_main  # noqa: PLC0415
+
+    shell_main()  # pylint: disable=no-value-for-parameter
 
 
 if __name__ == "__main__":
-    main()  # pylint: disable=no-value-for-parameter
+    main()
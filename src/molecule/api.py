@@ -1,20 +1,49 @@
 """Molecule API Module."""
 
+from __future__ import annotations
+
 import logging
+import os
+import subprocess
 import traceback
 
 from collections import UserList
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pluggy
 
 from ansible_compat.ports import cache
 
-from molecule.driver.base import Driver  # noqa: F401
-from molecule.verifier.base import Verifier  # noqa: F401
-
+from molecule import results
+from molecule.driver.base import Driver
+from molecule.exceptions import ActionError, ConfigError, MoleculeError, MoleculeExit, RunError
+from molecule.results import ActionResult, RunResult
+from molecule.verifier.base import Verifier
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+__all__ = (
+    "ActionError",
+    "ActionResult",
+    "ConfigError",
+    "Driver",
+    "IncompatibleMoleculeRuntimeWarning",
+    "MoleculeError",
+    "MoleculeRuntimeWarning",
+    "RunError",
+    "RunResult",
+    "UserListMap",
+    "Verifier",
+    "drivers",
+    "run",
+    "verifiers",
+)
 
 LOG = logging.getLogger(__name__)
+GLOBAL_OPTIONS = frozenset(("debug", "verbose", "base_config", "env_file"))
 
 
 class UserListMap(UserList):  # type: ignore[type-arg]
@@ -48,13 +77,26 @@ class IncompatibleMoleculeRuntimeWarning(MoleculeRuntimeWarning):
     """A warning noting an unsupported runtime environment."""
 
 
-@cache
 def drivers(config: Any | None = None) -> UserListMap:  # noqa: ANN401
     """Return list of active drivers.
 
+    Only drivers not bound to a config are cached.  A config keeps its own
+    driver, which is released along with it.
+
     Args:
         config: plugin config
     """
+    if config is None:
+        return _unbound_drivers()
+    return _load_drivers(config)
+
+
+@cache
+def _unbound_drivers() -> UserListMap:
+    return _load_drivers(None)
+
+
+def _load_drivers(config: Any | None) -> UserListMap:  # noqa: ANN401
     plugins = UserListMap()
     pm = pluggy.PluginManager("molecule.driver")
     try:
@@ -72,9 +114,19 @@ def drivers(config: Any | None = None) -> UserListMap:  # noqa: ANN401
     return plugins
 
 
-@cache
 def verifiers(config=None) -> UserListMap:  # type: ignore[no-untyped-def]  # noqa: ANN001
     """Return list of active verifiers."""
+    if config is None:
+        return _unbound_verifiers()
+    return _load_verifiers(config)
+
+
+@cache
+def _unbound_verifiers() -> UserListMap:
+    return _load_verifiers(None)
+
+
+def _load_verifiers(config: Any | None) -> UserListMap:  # noqa: ANN401
     plugins = UserListMap()
     pm = pluggy.PluginManager("molecule.verifier")
     try:
@@ -90,3 +142,82 @@ def verifiers(config=None) -> UserListMap:  # type: ignore[no-untyped-def]  # no
             LOG.error("Failed to load %s driver: %s", pm.get_name(p), str(e))  # noqa: TRY400
     plugins.sort()
     return plugins
+
+
+def run(
+    scenario_paths: Iterable[str],
+    sequence: str,
+    options: Mapping[str, Any] | None = None,
+) -> RunResult:
+    """Run a sequence of scenarios, as ``molecule <sequence>`` does.
+
+    Unlike the command line, failures raise errors instead of exiting, so
+    that a program can run scenarios any number of times.  Like the command
+    line, every run records the durations of its scenarios, which sharding
+    and ordering read.
+
+    Args:
+        scenario_paths: Paths to the ``molecule.yml`` of the scenarios, or to
+            their directories.
+        sequence: Name of the sequence to run, such as ``test`` or ``converge``.
+        options: Options of the command by the name of its argument, such as
+            ``{"destroy": "always", "jobs": 2}``, along with the global options
+            ``debug``, ``verbose``, ``base_config`` and ``env_file``, the
+            ``scenario_name`` to select and the ``ansible_args`` to pass to
+            ``ansible-playbook``.
+
+    Returns:
+        The results of the actions executed.
+
+    Raises:
+        ConfigError: When no scenario is given, or they could not be selected.
+        ActionError: When an action failed.
+        RunError: When the run failed otherwise, such as a background destroy.
+    """
+    # Imported here as molecule.command.base and molecule.scenario import this module.
+    from molecule import durations  # noqa: PLC0415
+    from molecule.command import base  # noqa: PLC0415
+
+    options = dict(options or {})
+    scenario_name = options.pop("scenario_name", None)
+    ansible_args = tuple(options.pop("ansible_args", ()))
+    args = {key: options.pop(key) for key in GLOBAL_OPTIONS.intersection(options)}
+    command_args = {**options, "subcommand": sequence}
+    paths = [_molecule_file(path) for path in scenario_paths]
+    if not paths:
+        msg = "No scenario to run."
+        raise ConfigError(msg)
+
+    with results.recording() as recorder:
+        try:
+            scenarios = base.select_scenarios(
+                paths,
+                scenario_name,
+                args,
+                command_args,
+                ansible_args,
+            )
+        except MoleculeExit as e:
+            raise ConfigError(e.message, results.exit_code(e)) from e
+
+        try:
+            base.execute_scenarios(scenarios, scenario_name, args, command_args, ansible_args)
+        except (MoleculeExit, subprocess.CalledProcessError) as e:
+            result = recorder.result()
+            if isinstance(e, MoleculeExit):
+                code, message = results.exit_code(e), e.message
+            else:
+                code, message = e.returncode or 1, str(e)
+            if result.failed:
+                raise ActionError(result, result.failed[0], code) from e
+            raise RunError(result, message, code) from e
+        finally:
+            durations.record(sequence, recorder.result())
+        return recorder.result()
+
+
+def _molecule_file(path: str) -> str:
+    """Return the absolute path to the ``molecule.yml`` of a scenario."""
+    if os.path.isdir(path):  # noqa: PTH112
+        path = os.path.join(path, "molecule.yml")  # noqa: PTH118
+    return os.path.abspath(path)  # noqa: PTH100
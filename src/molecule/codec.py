@@ -0,0 +1,140 @@
+"""Codec Module."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+
+from typing import IO, Any, NamedTuple
+
+import yaml
+
+
+class SafeDumper(yaml.SafeDumper):
+    """SafeDumper YAML Class."""
+
+    def increase_indent(self, flow=False, indentless=False):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, FBT002, ARG002, D102
+        return super().increase_indent(flow, False)  # noqa: FBT003
+
+
+class Backend(NamedTuple):
+    """YAML implementation.
+
+    Attributes:
+        name: Name of the implementation.
+        loader: Safe loader class.
+        dumper: Safe dumper class.
+        indents_sequences: Whether the dumper indents sequences nested in
+            mappings, as [molecule.codec.SafeDumper][] does.
+    """
+
+    name: str
+    loader: Any
+    dumper: Any
+    indents_sequences: bool
+
+
+BACKENDS = {"python": Backend("python", yaml.SafeLoader, SafeDumper, indents_sequences=True)}
+if yaml.__with_libyaml__:
+    BACKENDS["libyaml"] = Backend(
+        "libyaml",
+        yaml.CSafeLoader,
+        yaml.CSafeDumper,
+        indents_sequences=False,
+    )
+
+# Leading comments, such as the Molecule header, followed by a JSON document.
+_PRINTABLE_ASCII = re.compile(r"[\x20-\x7e]*")
+_JSON_START = re.compile(r"(?:[ \t\r\n]*#[^\n]*\n)*[ \t\r\n]*[\[{]")
+
+
+def get_backend(name: str) -> Backend:
+    """Return a YAML implementation.
+
+    Args:
+        name: Name of the implementation, ``libyaml`` or ``python``.
+
+    Returns:
+        The implementation, or the pure Python one when it is not available.
+    """
+    return BACKENDS.get(name, BACKENDS["python"])
+
+
+BACKEND = get_backend(os.environ.get("MOLECULE_YAML_BACKEND", "libyaml"))
+
+
+def load(string: str | IO[str], backend: Backend | None = None) -> Any:  # noqa: ANN401
+    """Load a YAML or JSON document.
+
+    Args:
+        string: The document, or a stream to read it from.
+        backend: YAML implementation, defaults to the configured one.
+
+    Returns:
+        The loaded document.
+
+    Raises:
+        yaml.YAMLError: When the document is invalid, with the detailed
+            message of the pure Python loader.
+    """
+    if not isinstance(string, str):
+        string = string.read()
+    match = _JSON_START.match(string)
+    if match:
+        try:
+            return json.loads(string[match.end() - 1 :])
+        except ValueError:
+            pass
+    backend = backend or BACKEND
+    try:
+        return yaml.load(string, Loader=backend.loader)  # noqa: S506
+    except yaml.YAMLError:
+        if backend.loader is yaml.SafeLoader:
+            raise
+    # libyaml errors do not quote the offending line.
+    return yaml.load(string, Loader=yaml.SafeLoader)
+
+
+def dump(data: Any, explicit_start: bool = True, backend: Backend | None = None) -> str:  # noqa: ANN401, FBT001, FBT002
+    """Dump data to a YAML document.
+
+    Args:
+        data: The data to dump.
+        explicit_start: Whether to start the document with ``---``.
+        backend: YAML implementation, defaults to the configured one.
+
+    Returns:
+        The document.
+    """
+    backend = backend or BACKEND
+    dumper = backend.dumper
+    # Top level scalars are also ended differently.
+    if not backend.indents_sequences and not (
+        isinstance(data, dict | list) and _dumps_like_python(data)
+    ):
+        dumper = SafeDumper
+    return yaml.dump(
+        data,
+        Dumper=dumper,
+        default_flow_style=False,
+        explicit_start=explicit_start,
+    )
+
+
+def _dumps_like_python(data: Any, in_mapping: bool = False) -> bool:  # noqa: ANN401, FBT001, FBT002
+    """Return whether libyaml dumps data exactly as SafeDumper does.
+
+    libyaml does not indent sequences nested in mappings, and quotes empty
+    keys and strings with non printable or non ASCII characters differently.
+    """
+    if isinstance(data, dict):
+        return all(
+            key != "" and _dumps_like_python(key) and _dumps_like_python(value, in_mapping=True)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return not (data and in_mapping) and all(_dumps_like_python(value) for value in data)
+    if isinstance(data, str):
+        return _PRINTABLE_ASCII.fullmatch(data) is not None
+    return data is None or isinstance(data, int | float)
@@ -37,9 +37,13 @@ from molecule.command import (
     list,  # noqa: F401
     login,  # noqa: F401
     matrix,  # noqa: F401
+    plan,  # noqa: F401
+    pool,  # noqa: F401
     prepare,  # noqa: F401
     reset,  # noqa: F401
+    serve,  # noqa: F401
     side_effect,  # noqa: F401
+    stats,  # noqa: F401
     syntax,  # noqa: F401
     test,  # noqa: F401
     verify,  # noqa: F401
@@ -23,36 +23,53 @@ from __future__ import annotations
 
 import abc
 import collections
-import contextlib
 import logging
 import os
 import shutil
-import subprocess
 
 from typing import TYPE_CHECKING, Any
 
 import click
-import wcmatch.pathlib
-import wcmatch.wcmatch
 
 from click_help_colors import HelpColorsCommand, HelpColorsGroup
-from wcmatch import glob
 
 import molecule.scenarios
-
-from molecule import config, logger, text, util
+import molecule.scheduler
+
+from molecule import (
+    api,
+    config,
+    discovery,
+    durations,
+    exceptions,
+    gitignore,
+    incremental,
+    locking,
+    logger,
+    ordering,
+    planner,
+    results,
+    scenario_index,
+    shard,
+    suite,
+    text,
+    timings,
+    util,
+)
 from molecule.console import should_do_markup
-from molecule.scenario import Scenario
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from molecule.scenario import Scenario
+    from molecule.scenario_index import IndexedScenario
 
 LOG = logging.getLogger(__name__)
 MOLECULE_GLOB = os.environ.get("MOLECULE_GLOB", "molecule/*/molecule.yml")
 MOLECULE_DEFAULT_SCENARIO_NAME = "default"
+MOLECULE_SHARD = os.environ.get("MOLECULE_SHARD")
+MOLECULE_ORDER = os.environ.get("MOLECULE_ORDER", "directory")
 
 
 class Base(metaclass=abc.ABCMeta):
@@ -105,8 +122,8 @@ def execute_cmdline_scenarios(
     This is useful for subcommands that run scenario sequences, which
     excludes subcommands such as ``list``, ``login``, and ``matrix``.
 
-    ``args`` and ``command_args`` are combined using :func:`get_configs`
-    to generate the scenario(s) configuration.
+    The scenarios found by the glob are run by :func:`molecule.api.run`,
+    whose errors become the exit code of the command.
 
     Args:
         scenario_name: Name of scenario to run, or ``None`` to run all.
@@ -117,51 +134,397 @@ def execute_cmdline_scenarios(
     glob_str = MOLECULE_GLOB
     if scenario_name:
         glob_str = glob_str.replace("*", scenario_name)
-    scenarios = molecule.scenarios.Scenarios(
-        get_configs(args, command_args, ansible_args, glob_str),  # type: ignore[no-untyped-call]
-        scenario_name,
+    scenario_paths = _find_scenario_files(glob_str)
+    if not scenario_paths:
+        _verify_scenario_names([], glob_str)
+
+    options = {
+        **args,
+        **command_args,
+        "scenario_name": scenario_name,
+        "ansible_args": ansible_args,
+    }
+    try:
+        api.run(scenario_paths, command_args["subcommand"], options)
+    except exceptions.MoleculeError as e:
+        raise SystemExit(e.code) from e
+
+
+def select_scenarios(
+    scenario_paths: list[str],
+    scenario_name: str | None,
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+) -> molecule.scenarios.Scenarios:
+    """Select the scenarios to execute among Molecule config files.
+
+    ``args`` and ``command_args`` are combined using :func:`scenario_index.index`
+    to generate the scenario(s) configuration, which is only built for the
+    selected scenarios, one at a time.
+
+    Args:
+        scenario_paths: Absolute paths to Molecule config files.
+        scenario_name: Name of scenario to run, or ``None`` to run all.
+        args: A dict of options, arguments and commands from the CLI.
+        command_args: dict of command arguments, including the target
+        ansible_args: Optional tuple of arguments to pass to the `ansible-playbook` command
+
+    Returns:
+        The selected scenarios, only the ones of its shard with ``--shard``,
+        in the order given by ``--order``.
+    """
+    entries = scenario_index.index(scenario_paths, args, command_args, ansible_args)
+    _verify_scenario_names([e.name for e in entries])
+    order = command_args.get("order") or "directory"
+    recorded = (
+        durations.load(command_args["subcommand"])
+        if order == "lpt" or command_args.get("shard")
+        else {}
     )
+    if not command_args.get("shard"):
+        return molecule.scenarios.Scenarios(entries, scenario_name, order, recorded)
+
+    names = [e.name for e in entries if not scenario_name or e.name == scenario_name]
+    try:
+        selected = shard.select(names, command_args["shard"], recorded)
+    except ValueError as e:
+        util.sysexit_with_message(str(e))
+    return molecule.scenarios.Scenarios(
+        [e for e in entries if e.name in selected],
+        order=order,
+        durations=recorded,
+    )
+
 
-    if scenario_name and scenarios:
+def execute_scenarios(
+    scenarios: molecule.scenarios.Scenarios,
+    scenario_name: str | None,
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+) -> None:
+    """Execute the sequences of the selected scenarios.
+
+    Args:
+        scenarios: The selected scenarios, built as they are iterated.
+        scenario_name: Name of scenario to run, or ``None`` to run all.
+        args: A dict of options, arguments and commands from the CLI.
+        command_args: dict of command arguments, including the target
+        ansible_args: Optional tuple of arguments to pass to the `ansible-playbook` command
+    """
+    try:
+        if command_args.get("pipeline") or command_args.get("jobs", 1) > 1:
+            selected = list(scenarios)
+            # Suites share instances between scenarios run one after the other.
+            util.validate_parallel_cmd_args(  # type: ignore[no-untyped-call]
+                command_args,
+                [s.suite for s in selected if _in_suite(scenario_name, s)],
+            )
+            for scenario in selected:
+                _log_test_matrix(scenario_name, scenario)
+            if command_args.get("pipeline"):
+                _execute_pipelined(selected, command_args)
+            else:
+                _execute_concurrently(selected, args, command_args, ansible_args)
+        else:
+            _execute_sequentially(scenario_name, scenarios, command_args)
+    finally:
+        _await_reapers()
+        _log_lock_waits()
+
+
+def _log_lock_waits() -> None:
+    """Log the time spent waiting for locks held by other processes, if any."""
+    stats = locking.MANAGER.stats
+    if stats.contended:
         LOG.info(
-            "%s scenario test matrix: %s",
-            scenario_name,
-            ", ".join(scenarios.sequence(scenario_name)),
+            "Waited %.2fs for %d of %d ephemeral directory locks, %.2fs at most",
+            stats.waited,
+            stats.contended,
+            stats.acquired,
+            stats.longest,
+        )
+
+
+def _await_reapers() -> None:
+    """Wait for the background destroys and exit non-zero if any failed."""
+    failed = [result for result in molecule.scheduler.REAPERS.wait() if result.returncode]
+    for result in failed:
+        LOG.error(
+            "Background destroy of scenario %s failed with return code %d",
+            result.scenario_name,
+            result.returncode,
         )
+    if failed:
+        util.sysexit(failed[0].returncode)
 
+
+def execute_cmdline_scenario(scenario: Scenario, command_args: dict[str, Any]) -> None:
+    """Execute a single scenario sequence, honoring the destroy strategy.
+
+    Args:
+        scenario: The scenario to execute.
+        command_args: dict of command arguments, including the target
+    """
+    try:
+        execute_scenario(scenario)
+    except SystemExit:
+        # if the command has a 'destroy' arg, like test does,
+        # handle that behavior here.
+        if _destroys_on_failure(command_args):
+            _clean_up_failed(scenario)
+            util.sysexit()
+        else:
+            raise
+    finally:
+        scenario.release_lock()
+
+
+def _execute_sequentially(
+    scenario_name: str | None,
+    scenarios: molecule.scenarios.Scenarios,
+    command_args: dict[str, Any],
+) -> None:
+    """Execute scenarios one after the other, suites once the others are done.
+
+    Args:
+        scenario_name: Name of scenario to run, or ``None`` to run all.
+        scenarios: The selected scenarios, built as they are iterated.
+        command_args: dict of command arguments, including the target
+    """
+    suites: list[Scenario] = []
     for scenario in scenarios:
-        if scenario.config.config["prerun"]:
-            role_name_check = scenario.config.config["role_name_check"]
-            LOG.info("Performing prerun with role_name_check=%s...", role_name_check)
-            scenario.config.runtime.prepare_environment(
-                install_local=True,
-                role_name_check=role_name_check,
-            )
+        _log_test_matrix(scenario_name, scenario)
+        _prerun(scenario)
 
         if command_args.get("subcommand") == "reset":
             LOG.info("Removing %s", scenario.ephemeral_directory)
             shutil.rmtree(scenario.ephemeral_directory)
             return
+        if _in_suite(scenario_name, scenario):
+            suites.append(scenario)
+            continue
+        execute_cmdline_scenario(scenario, command_args)
+
+    for members in suite.group(suites):
+        if len(members) == 1:
+            execute_cmdline_scenario(members[0], command_args)
+        else:
+            execute_cmdline_suite(members, command_args)
+
+
+def _in_suite(scenario_name: str | None, scenario: Scenario) -> bool:
+    """Return whether a scenario shares the instances of its suite.
+
+    Suites are ignored when a single scenario is selected and in parallel
+    mode, where every scenario has its own instance names.
+
+    Args:
+        scenario_name: Name of scenario to run, or ``None`` to run all.
+        scenario: The scenario.
+
+    Returns:
+        Whether the scenario runs along the other scenarios of its suite.
+    """
+    return bool(scenario.suite and not scenario_name and not scenario.config.is_parallel)
+
+
+def execute_cmdline_suite(members: list[Scenario], command_args: dict[str, Any]) -> None:
+    """Execute the scenarios of a suite on one set of instances.
+
+    The first scenario creates and prepares the instances, every scenario
+    runs the rest of its sequence on them, and the first one destroys them.
+
+    Args:
+        members: The scenarios of the suite.
+        command_args: dict of command arguments, including the target
+    """
+    owner = members[0]
+    phases = suite.split(owner.sequence)
+    LOG.info(
+        "Running suite %s: %s",
+        owner.suite,
+        ", ".join(member.name for member in members),
+    )
+    try:
+        for action in phases.setup:
+            execute_subcommand(owner.config, action)
+        for member in members:
+            actions = phases.body if member is owner else suite.member_sequence(member.sequence)
+            with suite.borrow(owner, member):
+                for action in actions:
+                    execute_subcommand(member.config, action)
+        for action in phases.teardown:
+            execute_subcommand(owner.config, action)
+        for member in members:
+            _finish_scenario(member)
+    except SystemExit:
+        if _destroys_on_failure(command_args):
+            _clean_up_failed(owner)
+            util.sysexit()
+        else:
+            raise
+    finally:
+        for member in members:
+            member.release_lock()
+
+
+def _destroys_on_failure(command_args: dict[str, Any]) -> bool:
+    """Return whether the destroy strategy destroys the instances of failed scenarios.
+
+    Args:
+        command_args: dict of command arguments, including the target
+
+    Returns:
+        Whether failed scenarios are cleaned up and destroyed.
+    """
+    return command_args.get("destroy") in ("always", "background")
+
+
+def _clean_up_failed(scenario: Scenario) -> None:
+    """Clean up and destroy the instances of a failed scenario.
+
+    Args:
+        scenario: The scenario which failed.
+    """
+    msg = (
+        f"An error occurred during the {scenario.config.subcommand} sequence action: "
+        f"'{scenario.config.action}'. Cleaning up."
+    )
+    LOG.warning(msg)
+    execute_subcommand(scenario.config, "cleanup")
+    execute_subcommand(scenario.config, "destroy")
+    # always prune ephemeral dir if destroying on failure
+    scenario.prune()
+    if scenario.config.is_parallel:
+        scenario._remove_scenario_state_directory()  # noqa: SLF001
+    scenario.release_lock()
+
+
+def _log_test_matrix(scenario_name: str | None, scenario: Scenario) -> None:
+    """Log the sequence of a scenario selected by name.
+
+    Args:
+        scenario_name: Name of the scenario to run, or ``None`` to run all.
+        scenario: The scenario about to be executed.
+    """
+    if scenario_name:
+        LOG.info(
+            "%s scenario test matrix: %s",
+            scenario_name,
+            ", ".join(scenario.sequence),
+        )
+
+
+def _prerun(scenario: Scenario) -> None:
+    """Prepare the Ansible environment of a scenario when prerun is enabled.
+
+    Args:
+        scenario: The scenario to prepare.
+    """
+    if scenario.config.config["prerun"]:
+        role_name_check = scenario.config.config["role_name_check"]
+        LOG.info("Performing prerun with role_name_check=%s...", role_name_check)
+        scenario.config.runtime.prepare_environment(
+            install_local=True,
+            role_name_check=role_name_check,
+        )
+
+
+def _execute_concurrently(
+    scenarios: list[Scenario],
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+) -> None:
+    """Execute scenarios in worker processes and exit non-zero if any failed.
+
+    Workers always run in parallel mode, so each scenario gets its own
+    ephemeral directory and uniquely named instances.  The prerun is done
+    up front, as concurrent installs into the same collection paths race.
+
+    Args:
+        scenarios: The scenarios to execute.
+        args: ``args`` dict from ``click`` command context
+        command_args: dict of command arguments, including the target
+        ansible_args: Optional tuple of arguments to pass to the `ansible-playbook` command
+    """
+    for scenario in scenarios:
+        _prerun(scenario)
+
+    finished = molecule.scheduler.run_scenarios(
+        scenarios,
+        command_args["jobs"],
+        args,
+        {**command_args, "parallel": True},
+        ansible_args,
+        execute=execute_cmdline_scenario,
+    )
+    results.extend(action for result in finished for action in result.actions)
+    failed = [result for result in finished if result.returncode]
+    if failed:
+        util.sysexit(failed[0].returncode)
+
+
+def _execute_pipelined(scenarios: list[Scenario], command_args: dict[str, Any]) -> None:
+    """Execute the actions of scenarios as an execution plan, in threads.
+
+    Args:
+        scenarios: The scenarios to execute.
+        command_args: dict of command arguments, including the target
+    """
+    for scenario in scenarios:
+        _prerun(scenario)
+
+    by_name = {scenario.name: scenario for scenario in scenarios}
+    nodes = get_plan(scenarios)
+    jobs = command_args.get("jobs", 1)
+    # The interrupted scenarios keep their locks until they are cleaned up.
+    cleaned_up: list[str] = []
+    try:
+        outcome = planner.execute(
+            nodes,
+            lambda node: execute_subcommand(by_name[node.scenario_name].config, node.action),
+            jobs if jobs > 1 else len(scenarios),
+            lambda name: _finish_scenario(by_name[name]),
+        )
+        if outcome.failures and _destroys_on_failure(command_args):
+            cleaned_up = outcome.interrupted
+    finally:
+        for scenario in scenarios:
+            if scenario.name not in cleaned_up:
+                scenario.release_lock()
+    if not outcome.failures:
+        return
+
+    for node, _ in outcome.failures:
+        LOG.error("Action %s failed", node)
+    if _destroys_on_failure(command_args):
         try:
-            execute_scenario(scenario)
-        except SystemExit:
-            # if the command has a 'destroy' arg, like test does,
-            # handle that behavior here.
-            if command_args.get("destroy") == "always":
-                msg = (
-                    f"An error occurred during the {scenario.config.subcommand} sequence action: "
-                    f"'{scenario.config.action}'. Cleaning up."
-                )
-                LOG.warning(msg)
-                execute_subcommand(scenario.config, "cleanup")
-                execute_subcommand(scenario.config, "destroy")
-                # always prune ephemeral dir if destroying on failure
-                scenario.prune()
-                if scenario.config.is_parallel:
-                    scenario._remove_scenario_state_directory()  # noqa: SLF001
-                util.sysexit()
-            else:
-                raise
+            for name in cleaned_up:
+                _clean_up_failed(by_name[name])
+        finally:
+            for name in cleaned_up:
+                by_name[name].release_lock()
+        util.sysexit()
+    code = outcome.failures[0][1].code
+    util.sysexit(code if isinstance(code, int) else 1)
+
+
+def get_plan(scenarios: list[Scenario]) -> list[planner.Node]:
+    """Compile the sequences of scenarios into an execution plan.
+
+    Args:
+        scenarios: The scenarios to execute, in order.
+
+    Returns:
+        The nodes of the plan.
+    """
+    return planner.build(
+        {scenario.name: scenario.sequence for scenario in scenarios},
+        parallel=any(scenario.config.is_parallel for scenario in scenarios),
+    )
 
 
 def execute_subcommand(
@@ -184,7 +547,11 @@ def execute_subcommand(
     # and is also used for reporting in execute_cmdline_scenarios
     current_config.action = subcommand
 
-    return command(current_config).execute(args)
+    with (
+        results.action(current_config.scenario.name, subcommand),
+        timings.timed(current_config, subcommand),
+    ):
+        return command(current_config).execute(args)
 
 
 def execute_scenario(scenario: Scenario) -> None:
@@ -193,35 +560,89 @@ def execute_scenario(scenario: Scenario) -> None:
     Args:
         scenario: The scenario to execute.
     """
-    for action in scenario.sequence:
-        execute_subcommand(scenario.config, action)
+    sequence = list(scenario.sequence)
+    strategy = scenario.config.command_args.get("destroy")
+    background = strategy == "background" and sequence[-1:] == ["destroy"]
+    if background:
+        sequence.pop()
+
+    if scenario.config.command_args.get("incremental"):
+        _execute_incrementally(scenario, sequence)
+    else:
+        for action in sequence:
+            _execute_action(scenario, action)
+
+    if background:
+        # The reaper locks the ephemeral directory in turn.
+        scenario.release_lock()
+        molecule.scheduler.REAPERS.start(scenario, _destroy_scenario)
+    else:
+        _finish_scenario(scenario)
+
+
+def _execute_action(scenario: Scenario, action: str) -> None:
+    """Execute an action of a scenario, once no reaper destroys its instances.
+
+    Args:
+        scenario: The scenario to execute the action of.
+        action: The action to execute.
+    """
+    if action not in planner.LOCAL_ACTIONS:
+        molecule.scheduler.REAPERS.wait_for(scenario)
+    execute_subcommand(scenario.config, action)
+
+
+def _execute_incrementally(scenario: Scenario, sequence: list[str]) -> None:
+    """Execute the steps of a sequence whose inputs changed since they ran.
+
+    Args:
+        scenario: The scenario to execute.
+        sequence: The actions of its sequence to execute.
+    """
+    c = scenario.config
+    skipped = incremental.skipped(c, sequence)
+    for step, action in enumerate(sequence):
+        if step in skipped:
+            LOG.info("Skipping %s, inputs unchanged since it last ran.", action)
+            continue
+        fingerprint = incremental.compute(c, action)
+        try:
+            _execute_action(scenario, action)
+        except SystemExit:
+            c.state.change_state("failed_step", step)
+            raise
+        incremental.record(c, action, fingerprint)
+    c.state.change_state("failed_step", None)
+
+
+def _destroy_scenario(c: config.Config) -> None:
+    """Destroy the instances of a scenario, then prune its ephemeral directory.
+
+    Args:
+        c: The config of the scenario, as rebuilt by its reaper.
+    """
+    execute_subcommand(c, "destroy")
+    _finish_scenario(c.scenario)
+
+
+def _finish_scenario(scenario: Scenario) -> None:
+    """Prune the ephemeral directory once the sequence destroyed the instances.
+
+    The lock of the ephemeral directory is released, as the scenario ended.
 
+    Args:
+        scenario: The scenario whose sequence is done.
+    """
     if "destroy" in scenario.sequence and scenario.config.command_args.get("destroy") != "never":
         scenario.prune()
 
         if scenario.config.is_parallel:
             scenario._remove_scenario_state_directory()  # noqa: SLF001
+    scenario.release_lock()
 
 
 def filter_ignored_scenarios(scenario_paths) -> list[str]:  # type: ignore[no-untyped-def]  # noqa: ANN001, D103
-    command = ["git", "check-ignore", *scenario_paths]
-
-    with contextlib.suppress(subprocess.CalledProcessError, FileNotFoundError):
-        proc = subprocess.run(
-            args=command,
-            capture_output=True,
-            check=True,
-            text=True,
-            shell=False,
-        )
-
-    try:
-        ignored = proc.stdout.splitlines()
-        paths = [candidate for candidate in scenario_paths if str(candidate) not in ignored]
-    except NameError:
-        paths = scenario_paths
-
-    return paths
+    return gitignore.filter_ignored(list(scenario_paths))
 
 
 def get_configs(args, command_args, ansible_args=(), glob_str=MOLECULE_GLOB):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
@@ -238,26 +659,64 @@ def get_configs(args, command_args, ansible_args=(), glob_str=MOLECULE_GLOB):  #
     Returns:
         A list of Config objects.
     """
-    scenario_paths = glob.glob(
-        glob_str,
-        flags=wcmatch.pathlib.GLOBSTAR | wcmatch.pathlib.BRACE | wcmatch.pathlib.DOTGLOB,
-    )
-
-    scenario_paths = filter_ignored_scenarios(scenario_paths)
     configs = [
         config.Config(
-            molecule_file=util.abs_path(c),  # type: ignore[arg-type]
+            molecule_file=c,
             args=args,
             command_args=command_args,
             ansible_args=ansible_args,
         )
-        for c in scenario_paths
+        for c in _find_scenario_files(glob_str)
     ]
     _verify_configs(configs, glob_str)
 
     return configs
 
 
+def get_scenario_index(
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+    glob_str: str = MOLECULE_GLOB,
+) -> list[IndexedScenario]:
+    """Glob the current directory for Molecule config files.
+
+    Unlike :func:`get_configs`, no config is built; scenarios are indexed by
+    path and name so that only the selected ones get their config built.
+
+    Args:
+        args: A dict of options, arguments and commands from the CLI.
+        command_args: A dict of options passed to the subcommand from the CLI.
+        ansible_args: An optional tuple of arguments provided to the `ansible-playbook` command.
+        glob_str: A string representing the glob used to find Molecule config files.
+
+    Returns:
+        A list of indexed scenarios.
+    """
+    entries = scenario_index.index(
+        _find_scenario_files(glob_str),
+        args,
+        command_args,
+        ansible_args,
+    )
+    _verify_scenario_names([e.name for e in entries], glob_str)
+
+    return entries
+
+
+def _find_scenario_files(glob_str: str) -> list[str]:
+    """Return the absolute paths of the Molecule config files matching a glob.
+
+    Args:
+        glob_str: A string representing the glob used to find Molecule config files.
+
+    Returns:
+        A list of absolute paths, without the ones ignored by git.
+    """
+    scenario_paths = filter_ignored_scenarios(discovery.find(glob_str))
+    return [util.abs_path(c) for c in scenario_paths]  # type: ignore[misc]
+
+
 def _verify_configs(configs: list[config.Config], glob_str: str = MOLECULE_GLOB) -> None:
     """Verify a Molecule config was found and returns None.
 
@@ -265,8 +724,17 @@ def _verify_configs(configs: list[config.Config], glob_str: str = MOLECULE_GLOB)
         configs: A list containing absolute paths to Molecule config files.
         glob_str: A string representing the glob used to find Molecule config files.
     """
-    if configs:
-        scenario_names = [c.scenario.name for c in configs]
+    _verify_scenario_names([c.scenario.name for c in configs], glob_str)
+
+
+def _verify_scenario_names(scenario_names: list[str], glob_str: str = MOLECULE_GLOB) -> None:
+    """Verify a scenario was found and names are unique, and returns None.
+
+    Args:
+        scenario_names: Names of the found scenarios.
+        glob_str: A string representing the glob used to find Molecule config files.
+    """
+    if scenario_names:
         for scenario_name, n in collections.Counter(scenario_names).items():
             if n > 1:
                 msg = f"Duplicate scenario name '{scenario_name}' found.  Exiting."
@@ -309,13 +777,55 @@ def click_group_ex():  # type: ignore[no-untyped-def]  # noqa: ANN201
             "list": "blue",
             "matrix": "blue",
             "login": "bright_yellow",
+            "plan": "blue",
+            "pool": "blue",
             "reset": "blue",
+            "serve": "blue",
+            "stats": "blue",
             "test": "bright_yellow",
         },
         result_callback=result_callback,
     )
 
 
+def shard_option() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Return the ``--shard`` option of the commands which can run every scenario."""
+    return click.option(
+        "--shard",
+        default=MOLECULE_SHARD,
+        metavar="INDEX/COUNT",
+        callback=_validate_shard,
+        help=(
+            "Run only the scenarios of shard INDEX of COUNT, counting from 1, split by "
+            "recorded durations. Default is to run all scenarios."
+        ),
+    )
+
+
+def order_option() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Return the ``--order`` option of the commands which can run every scenario."""
+    return click.option(
+        "--order",
+        type=click.Choice(ordering.ORDERS),
+        default=MOLECULE_ORDER,
+        show_default=True,
+        help=(
+            "Order to start scenarios in: by directory, longest first by recorded "
+            "durations (lpt), or shuffled (random)."
+        ),
+    )
+
+
+def _validate_shard(ctx: click.Context, param: click.Parameter, value: str | None) -> str | None:  # noqa: ARG001
+    """Validate the value of the ``--shard`` option."""
+    if value:
+        try:
+            shard.parse(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from None
+    return value
+
+
 def click_command_ex() -> Callable[[Callable[..., Any]], click.Command]:
     """Return extended version of click.command()."""
     return click.command(
@@ -21,13 +21,16 @@
 from __future__ import annotations
 
 import logging
+import os
 
 import click
 
+from molecule import incremental, util
 from molecule.command import base
 
 
 LOG = logging.getLogger(__name__)
+MOLECULE_SKIP_UNCHANGED = util.boolean(os.environ.get("MOLECULE_SKIP_UNCHANGED", "False"))
 
 
 class Converge(base.Base):
@@ -35,8 +38,28 @@ class Converge(base.Base):
 
     def execute(self, action_args: list[str] | None = None) -> None:  # noqa: ARG002
         """Execute the actions necessary to perform a `molecule converge` and returns None."""
-        self._config.provisioner.converge()
+        scope = None
+        if self._config.command_args.get("skip_unchanged"):
+            scope = incremental.converge_scope(self._config)
+            if scope.args is None:
+                msg = "Skipping, inputs unchanged since the last converge."
+                LOG.warning(msg)
+                return
+            if scope.args:
+                LOG.info(
+                    "Converging the changed parts only: %s",
+                    ", ".join(f"{name} {value}" for name, value in scope.args.items()),
+                )
+
+        # The instances match no recorded inputs until the converge succeeds.
+        incremental.forget(self._config, "converge")
+        if scope is None:
+            self._config.provisioner.converge()
+        else:
+            self._config.provisioner.converge(cli_args=scope.args)
         self._config.state.change_state("converged", True)  # noqa: FBT003
+        for action, fingerprint in (scope.fingerprints if scope else {}).items():
+            incremental.record(self._config, action, fingerprint)
 
 
 @base.click_command_ex()
@@ -47,11 +70,19 @@ class Converge(base.Base):
     default=base.MOLECULE_DEFAULT_SCENARIO_NAME,
     help=f"Name of the scenario to target. ({base.MOLECULE_DEFAULT_SCENARIO_NAME})",
 )
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=MOLECULE_SKIP_UNCHANGED,
+    help=(
+        "Skip converge when its inputs did not change since the instances were last "
+        "converged, or restrict it to the converge_scopes which changed. Default is disabled."
+    ),
+)
 @click.argument("ansible_args", nargs=-1, type=click.UNPROCESSED)
-def converge(ctx, scenario_name, ansible_args):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
+def converge(ctx, scenario_name, skip_unchanged, ansible_args):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
     """Use the provisioner to configure instances (dependency, create, prepare converge)."""
     args = ctx.obj.get("args")
     subcommand = base._get_subcommand(__name__)  # noqa: SLF001
-    command_args = {"subcommand": subcommand}
+    command_args = {"subcommand": subcommand, "skip_unchanged": skip_unchanged}
 
     base.execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args)
@@ -23,6 +23,7 @@ import logging
 
 import click
 
+from molecule import incremental, pool
 from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER
@@ -43,6 +44,11 @@ class Create(base.Base):
             LOG.warning(msg)
             return
 
+        # New instances match none of the inputs of a previous converge.
+        incremental.forget(self._config, "converge")
+        if pool.enabled(self._config) and pool.Pool(self._config).acquire():
+            return
+
         self._config.provisioner.create()
 
         self._config.state.change_state("created", True)  # noqa: FBT003
@@ -24,7 +24,7 @@ import os
 
 import click
 
-from molecule import util
+from molecule import incremental, planner, pool, util
 from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER
@@ -44,8 +44,10 @@ class Destroy(base.Base):
             LOG.warning(msg)
             return
 
-        self._config.provisioner.destroy()
-        self._config.state.reset()
+        incremental.forget(self._config, "converge")
+        if not (pool.enabled(self._config) and pool.Pool(self._config).release()):
+            self._config.provisioner.destroy()
+        self._config.state.reset(keep=planner.LOCAL_ACTIONS)
 
 
 @base.click_command_ex()
@@ -73,13 +75,17 @@ class Destroy(base.Base):
     default=False,
     help="Enable or disable parallel mode. Default is disabled.",
 )
-def destroy(ctx, scenario_name, driver_name, __all, parallel):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
+@base.shard_option()
+@base.order_option()
+def destroy(ctx, scenario_name, driver_name, __all, parallel, *, shard, order):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201, PLR0913
     """Use the provisioner to destroy the instances."""
     args = ctx.obj.get("args")
     subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args = {
         "parallel": parallel,
         "subcommand": subcommand,
+        "shard": shard,
+        "order": order,
         "driver_name": driver_name,
     }
 
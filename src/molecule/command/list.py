@@ -63,7 +63,7 @@ def list(ctx, scenario_name, format):  # type: ignore[no-untyped-def] # pragma:
 
     statuses = []
     s = scenarios.Scenarios(
-        base.get_configs(args, command_args, glob_str="**/molecule/*/molecule.yml"),  # type: ignore[no-untyped-call]
+        base.get_scenario_index(args, command_args, glob_str="**/molecule/*/molecule.yml"),
         scenario_name,
     )
     for scenario in s:
@@ -77,5 +77,5 @@ def matrix(ctx, scenario_name, subcommand):  # type: ignore[no-untyped-def] # pr
     args = ctx.obj.get("args")
     command_args = {"subcommand": subcommand}
 
-    s = scenarios.Scenarios(base.get_configs(args, command_args), scenario_name)  # type: ignore[no-untyped-call]
+    s = scenarios.Scenarios(base.get_scenario_index(args, command_args), scenario_name)
     s.print_matrix()  # type: ignore[no-untyped-call]
@@ -0,0 +1,103 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""Plan Command Module."""
+
+from __future__ import annotations
+
+import logging
+
+from typing import TYPE_CHECKING
+
+import click
+
+from rich import box
+from rich.table import Table
+
+from molecule import scenarios
+from molecule.command import base
+from molecule.console import console
+
+
+if TYPE_CHECKING:
+    from molecule.planner import Node
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Plan(base.Base):  # pylint: disable=abstract-method
+    """Plan Command Class.
+
+    .. program:: molecule plan test
+
+    .. option:: molecule plan test
+
+        Show the execution plan of ``molecule test --all --pipeline``.
+
+    .. program:: molecule plan --scenario-name foo test
+
+    .. option:: molecule plan --scenario-name foo test
+
+        Targeting a specific scenario.
+
+    .. program:: molecule plan --parallel test
+
+    .. option:: molecule plan --parallel test
+
+        Show the plan of scenarios running in parallel mode, whose instances
+        do not wait for the ones of other scenarios.
+    """
+
+
+@base.click_command_ex()
+@click.pass_context
+@click.option("--scenario-name", "-s", help="Name of the scenario to target.")
+@click.option(
+    "--parallel/--no-parallel",
+    default=False,
+    help="Plan for parallel mode. Default is disabled.",
+)
+@click.argument("subcommand", nargs=1, type=click.UNPROCESSED)
+def plan(ctx, scenario_name, parallel, subcommand):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
+    """Show the execution plan of the subcommand's actions across scenarios."""
+    args = ctx.obj.get("args")
+    command_args = {"subcommand": subcommand, "parallel": parallel}
+
+    s = scenarios.Scenarios(base.get_scenario_index(args, command_args), scenario_name)
+    print_plan(base.get_plan(list(s)))
+
+
+def print_plan(nodes: list[Node]) -> None:
+    """Show the nodes of an execution plan, by stage.
+
+    Args:
+        nodes: Nodes of the plan.
+    """
+    t = Table(box=box.MINIMAL)
+    for header in ("Stage", "Action", "Resources", "Waits For"):
+        t.add_column(header)
+    for node in sorted(nodes, key=lambda n: (n.stage, n.position)):
+        t.add_row(
+            str(node.stage),
+            str(node),
+            ", ".join(node.resources),
+            ", ".join(str(nodes[i]) for i in node.needs),
+        )
+    console.print(t)
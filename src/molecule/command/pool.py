@@ -0,0 +1,85 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""Pool Command Module."""
+
+import logging
+
+import click
+
+import molecule.pool
+
+from molecule import scenarios, util
+from molecule.command import base
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Pool(base.Base):  # pylint: disable=abstract-method
+    """Pool Command Class.
+
+    .. program:: molecule pool
+
+    .. option:: molecule pool
+
+        Create instances of the default scenario until its pool is full.
+
+    .. program:: molecule pool --scenario-name foo
+
+    .. option:: molecule pool --scenario-name foo
+
+        Targeting a specific scenario.
+
+    .. program:: molecule pool --drain
+
+    .. option:: molecule pool --drain
+
+        Destroy the instances kept by the pool.
+    """
+
+
+@base.click_command_ex()
+@click.pass_context
+@click.option(
+    "--scenario-name",
+    "-s",
+    default=base.MOLECULE_DEFAULT_SCENARIO_NAME,
+    help=f"Name of the scenario to target. ({base.MOLECULE_DEFAULT_SCENARIO_NAME})",
+)
+@click.option(
+    "--drain/--no-drain",
+    default=False,
+    help="Destroy the instances kept instead of creating them. Default is disabled.",
+)
+def pool(ctx, scenario_name, drain):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
+    """Create instances ahead of scenarios using them, up to the pool size."""
+    args = ctx.obj.get("args")
+    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
+    command_args = {"subcommand": subcommand}
+
+    for scenario in scenarios.Scenarios(base.get_scenario_index(args, command_args), scenario_name):
+        if not molecule.pool.enabled(scenario.config):
+            msg = f"Scenario '{scenario.name}' does not configure 'driver.options.pool'.  Exiting."
+            util.sysexit_with_message(msg)
+        p = molecule.pool.Pool(scenario.config)
+        if drain:
+            LOG.info("Destroyed %d sets of instances", p.drain())
+        else:
+            LOG.info("Created %d sets of instances", p.fill())
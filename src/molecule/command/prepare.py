@@ -23,6 +23,7 @@ import logging
 
 import click
 
+from molecule import incremental
 from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER
@@ -96,6 +97,7 @@ class Prepare(base.Base):
             LOG.warning(msg)
             return
 
+        incremental.forget(self._config, "converge")
         self._config.provisioner.prepare()
         self._config.state.change_state("prepared", True)  # noqa: FBT003
 
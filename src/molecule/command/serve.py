@@ -0,0 +1,47 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""Serve Command Module."""
+
+import logging
+import os
+import sys
+
+import click
+
+from molecule import daemon
+from molecule.command import base
+
+
+LOG = logging.getLogger(__name__)
+
+
+@base.click_command_ex()
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="Path of the socket to listen on. (MOLECULE_DAEMON_SOCKET, or a socket of the user)",
+)
+def serve(socket_path):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201
+    """Run commands forwarded by molecule from a warm daemon, until terminated."""
+    path = socket_path or daemon.socket_path()
+    # The daemon starts from a fresh interpreter, as the modules of Molecule
+    # are imported by each command, with its own environment.
+    os.execv(sys.executable, [sys.executable, "-m", "molecule.server", path])  # noqa: S606
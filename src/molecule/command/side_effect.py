@@ -23,6 +23,7 @@ import logging
 
 import click
 
+from molecule import incremental
 from molecule.command import base
 
 
@@ -42,6 +43,8 @@ class SideEffect(base.Base):
             LOG.warning(msg)
             return
 
+        # The instances no longer match the inputs of the last converge.
+        incremental.forget(self._config, "converge")
         self._config.provisioner.side_effect(action_args)
 
 
@@ -0,0 +1,91 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""Stats Command Module."""
+
+import logging
+
+import click
+
+from rich import box
+from rich.table import Table
+
+from molecule import durations, timings
+from molecule.command import base
+from molecule.console import console
+
+
+LOG = logging.getLogger(__name__)
+
+
+@base.click_command_ex()
+@click.pass_context
+@click.option("--scenario-name", "-s", help="Name of the scenario to report.")
+@click.option(
+    "--movers",
+    "-m",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of actions which got the slowest to report.",
+)
+def stats(ctx, scenario_name, movers):  # type: ignore[no-untyped-def] # pragma: no cover  # noqa: ANN001, ANN201, ARG001
+    """Report the durations of the actions of previous runs."""
+    recorded = durations.stats(scenario_name)
+    if not recorded:
+        LOG.warning(
+            "No durations recorded in %s.",
+            timings.path() if timings.enabled() else durations.path(),
+        )
+        return
+
+    table = Table(box=box.MINIMAL, title="Action durations")
+    for header in ("Scenario", "Action", "Runs", "Failures", "p50", "p95"):
+        table.add_column(header, justify="left" if header in ("Scenario", "Action") else "right")
+    for stat in recorded:
+        table.add_row(
+            stat.scenario,
+            stat.action,
+            str(stat.runs),
+            str(stat.failures),
+            _seconds(stat.p50),
+            _seconds(stat.p95),
+        )
+    console.print(table)
+
+    slowest = durations.movers(scenario_name)[:movers]
+    if not slowest:
+        return
+    table = Table(box=box.MINIMAL, title="Slowest movers")
+    for header in ("Scenario", "Action", "Previous", "Latest", "Change"):
+        table.add_column(header, justify="left" if header in ("Scenario", "Action") else "right")
+    for mover in slowest:
+        table.add_row(
+            mover.scenario,
+            mover.action,
+            _seconds(mover.previous),
+            _seconds(mover.latest),
+            f"+{_seconds(mover.change)}",
+        )
+    console.print(table)
+
+
+def _seconds(value: float) -> str:
+    """Format a duration in seconds."""
+    return f"{value:.2f}s"
@@ -33,6 +33,9 @@ from molecule.config import DEFAULT_DRIVER
 LOG = logging.getLogger(__name__)
 MOLECULE_PARALLEL = os.environ.get("MOLECULE_PARALLEL", False)
 MOLECULE_PLATFORM_NAME = os.environ.get("MOLECULE_PLATFORM_NAME", None)
+MOLECULE_JOBS = int(os.environ.get("MOLECULE_JOBS", "1"))
+MOLECULE_PIPELINE = util.boolean(os.environ.get("MOLECULE_PIPELINE", "False"))
+MOLECULE_INCREMENTAL = util.boolean(os.environ.get("MOLECULE_INCREMENTAL", "False"))
 
 
 class Test(base.Base):
@@ -70,15 +73,47 @@ class Test(base.Base):
 )
 @click.option(
     "--destroy",
-    type=click.Choice(["always", "never"]),
+    type=click.Choice(["always", "never", "background"]),
     default="always",
-    help=("The destroy strategy used at the conclusion of a Molecule run (always)."),
+    help=(
+        "The destroy strategy used at the conclusion of a Molecule run (always). "
+        "With background, the final destroy runs in a separate process while the "
+        "next scenario starts."
+    ),
 )
 @click.option(
     "--parallel/--no-parallel",
     default=MOLECULE_PARALLEL,
     help="Enable or disable parallel mode. Default is disabled.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=MOLECULE_JOBS,
+    help=(
+        "Number of scenarios to run concurrently, implies parallel mode. With --pipeline, "
+        "number of actions to run at once instead. Default is 1."
+    ),
+)
+@click.option(
+    "--pipeline/--no-pipeline",
+    default=MOLECULE_PIPELINE,
+    help=(
+        "Run the actions of all scenarios as one execution plan, starting actions as soon "
+        "as the resources they need are free. Default is disabled."
+    ),
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=MOLECULE_INCREMENTAL,
+    help=(
+        "Skip the actions whose inputs did not change since they last ran, and resume "
+        "from the action which failed. Default is disabled."
+    ),
+)
+@base.shard_option()
+@base.order_option()
 @click.argument("ansible_args", nargs=-1, type=click.UNPROCESSED)
 def test(  # type: ignore[no-untyped-def]  # noqa: ANN201, PLR0913
     ctx,  # noqa: ANN001
@@ -87,8 +122,13 @@ def test(  # type: ignore[no-untyped-def]  # noqa: ANN201, PLR0913
     __all,  # noqa: ANN001
     destroy,  # noqa: ANN001
     parallel,  # noqa: ANN001
+    jobs,  # noqa: ANN001
+    pipeline,  # noqa: ANN001
+    incremental,  # noqa: ANN001
     ansible_args,  # noqa: ANN001
     platform_name,  # noqa: ANN001
+    shard,  # noqa: ANN001
+    order,  # noqa: ANN001
 ):  # pragma: no cover
     """Test (dependency, cleanup, destroy, syntax, create, prepare, converge, idempotence, side_effect, verify, cleanup, destroy)."""  # noqa: E501
     args = ctx.obj.get("args")
@@ -97,14 +137,19 @@ def test(  # type: ignore[no-untyped-def]  # noqa: ANN201, PLR0913
         "parallel": parallel,
         "destroy": destroy,
         "subcommand": subcommand,
+        "shard": shard,
+        "order": order,
         "driver_name": driver_name,
         "platform_name": platform_name,
+        "jobs": jobs,
+        "pipeline": pipeline,
+        "incremental": incremental,
     }
 
     if __all:
         scenario_name = None
 
-    if parallel:
+    if parallel or (jobs > 1 and not pipeline):
         util.validate_parallel_cmd_args(command_args)  # type: ignore[no-untyped-call]
 
     base.execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args)
@@ -26,12 +26,25 @@ import warnings
 
 from collections.abc import MutableMapping
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
+import yaml
+
 from ansible_compat.ports import cache, cached_property
 from packaging.version import Version
 
-from molecule import api, interpolation, platforms, scenario, state, util
+from molecule import (
+    api,
+    config_cache,
+    config_layer,
+    interpolation,
+    layout,
+    platforms,
+    scenario,
+    state,
+    util,
+)
 from molecule.app import app
 from molecule.data import __file__ as data_module
 from molecule.dependency import ansible_galaxy, shell
@@ -43,6 +56,7 @@ from molecule.util import boolean
 LOG = logging.getLogger(__name__)
 MOLECULE_DEBUG = boolean(os.environ.get("MOLECULE_DEBUG", "False"))
 MOLECULE_VERBOSITY = int(os.environ.get("MOLECULE_VERBOSITY", 0))
+MOLECULE_CONFIG_CACHE = boolean(os.environ.get("MOLECULE_CONFIG_CACHE", "True"))
 MOLECULE_DIRECTORY = "molecule"
 MOLECULE_FILE = "molecule.yml"
 MOLECULE_KEEP_STRING = "MOLECULE_"
@@ -108,9 +122,14 @@ class Config(metaclass=NewInitCaller):
         self.args = args
         self.command_args = command_args
         self.ansible_args = ansible_args
+        self._documents: dict[str, tuple[str, interpolation.Document]] = {}
+        self._uncached_config: tuple[str, MutableMapping] | None = None  # type: ignore[type-arg]
+        self._validated_config: MutableMapping | None = None  # type: ignore[type-arg]
         self.config = self._get_config()
         self._action = None
-        self._run_uuid = str(uuid4())
+        self._layout: layout.Layout | None = None
+        # Instance pools rebuild the config of the instances they keep.
+        self._run_uuid = command_args.get("run_uuid") or str(uuid4())
         self.project_directory = os.getenv(
             "MOLECULE_PROJECT_DIRECTORY",
             os.getcwd(),  # noqa: PTH109
@@ -120,6 +139,7 @@ class Config(metaclass=NewInitCaller):
 
     def after_init(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         self.config = self._reget_config()  # type: ignore[no-untyped-call]
+        self._layout = None
         if self.molecule_file:
             self._validate()  # type: ignore[no-untyped-call]
 
@@ -136,7 +156,14 @@ class Config(metaclass=NewInitCaller):
 
     @property
     def config_file(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(self.scenario.ephemeral_directory, MOLECULE_FILE)  # noqa: PTH118
+        return self.layout.config_file
+
+    @property
+    def layout(self) -> layout.Layout:
+        """Paths of the scenario, resolved once per action."""
+        if self._layout is None:
+            self._layout = layout.resolve(self)
+        return self._layout
 
     @property
     def is_parallel(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -165,6 +192,7 @@ class Config(metaclass=NewInitCaller):
     @action.setter
     def action(self, value):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN202
         self._action = value
+        self._layout = None
 
     @property
     def cache_directory(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -207,7 +235,7 @@ class Config(metaclass=NewInitCaller):
             "MOLECULE_ENV_FILE": str(self.env_file),
             "MOLECULE_STATE_FILE": self.state.state_file,
             "MOLECULE_INVENTORY_FILE": self.provisioner.inventory_file,
-            "MOLECULE_EPHEMERAL_DIRECTORY": self.scenario.ephemeral_directory,
+            "MOLECULE_EPHEMERAL_DIRECTORY": self.layout.ephemeral_directory,
             "MOLECULE_SCENARIO_DIRECTORY": self.scenario.directory,
             "MOLECULE_PROJECT_DIRECTORY": self.project_directory,
             "MOLECULE_INSTANCE_CONFIG": self.driver.instance_config,
@@ -316,13 +344,13 @@ class Config(metaclass=NewInitCaller):
         """Perform the same prioritized recursive merge from `get_config`.
 
         Interpolates the ``keep_string`` left behind in the original
-        ``get_config`` call.  This is probably __very__ bad.
+        ``get_config`` call.  Config files are not parsed again, only the
+        placeholders which were kept are substituted.
 
         Returns:
             dict: The merged config.
         """
-        env = util.merge_dicts(os.environ, self.env)
-        env = set_env_from_file(env, self.env_file)
+        env = set_env_from_file(util.overlay_env(os.environ, self.env), self.env_file)
 
         return self._combine(env=env)
 
@@ -340,39 +368,129 @@ class Config(metaclass=NewInitCaller):
         Returns:
             dict: The merged config.
         """
-        defaults = self._get_defaults()
-        base_configs = filter(os.path.exists, self.args.get("base_config", []))
-        for base_config in base_configs:
-            with open(base_config) as stream:  # noqa: PTH123
-                s = stream.read()
-                interpolated_config = self._interpolate(s, env, keep_string)
-                defaults = util.merge_dicts(
-                    defaults,
-                    util.safe_load(interpolated_config),
-                )
-
+        base_configs = list(filter(os.path.exists, self.args.get("base_config", [])))
+        sources = [(base_config, config_layer.read(base_config)) for base_config in base_configs]
         if self.molecule_file:
             with open(self.molecule_file) as stream:  # noqa: PTH123
-                s = stream.read()
-                interpolated_config = self._interpolate(s, env, keep_string)
-                defaults = util.merge_dicts(
-                    defaults,
-                    util.safe_load(interpolated_config),
-                )
+                sources.append((self.molecule_file, stream.read()))
+
+        key = None
+        if MOLECULE_CONFIG_CACHE and self.molecule_file:
+            key = config_cache.fingerprint(
+                sources,
+                set_env_from_file(env, self.env_file),
+                self.env_file,
+                keep_string,
+                self._get_defaults(),
+                schemas=schema_v3.schemas(),
+            )
+            cached = config_cache.load(self.molecule_file, keep_string, key)
+            if cached is not None:
+                # Fully interpolated configs are only cached once validated.
+                if not keep_string:
+                    self._validated_config = cached
+                return cached
+
+        env = set_env_from_file(env, self.env_file)
+        layer = config_layer.base_layer(
+            self._get_defaults,
+            base_configs,
+            env,
+            keep_string,
+            self._render_base,
+        )
+        scenario_config = None
+        if self.molecule_file:
+            scenario_config = self._render(self.molecule_file, sources[-1][1], env, keep_string)
+        defaults = config_layer.set_scenario_name(
+            config_layer.merge(layer, scenario_config),
+            self._get_defaults()["scenario"]["name"],
+        )
+
+        if key and keep_string:
+            config_cache.store(self.molecule_file, keep_string, key, defaults)
+        elif key:
+            self._uncached_config = (key, defaults)
 
         return defaults
 
-    def _interpolate(self, stream: str, env: MutableMapping, keep_string: str) -> str:  # type: ignore[type-arg]
-        env = set_env_from_file(env, self.env_file)
+    def _render(
+        self,
+        path: str,
+        stream: str,
+        env: MutableMapping,  # type: ignore[type-arg]
+        keep_string: str | None,
+    ) -> MutableMapping:  # type: ignore[type-arg]
+        """Interpolate a config file.
+
+        Args:
+            path: Path to the config file.
+            stream: Content of the config file.
+            env: Environment used for interpolation.
+            keep_string: Prefix of variables to leave uninterpolated.
 
+        Returns:
+            The interpolated config.
+        """
+        document = self._parse(path, stream)
         i = interpolation.Interpolator(interpolation.TemplateWithDefaults, env)
+        try:
+            if keep_string:
+                return document.render(i, keep_string)  # type: ignore[no-any-return]
+            return document.render_kept(i)  # type: ignore[no-any-return]
+        except interpolation.InvalidInterpolation as e:
+            msg = f"parsing config file '{path}'.\n\n{e.place}\n{e.string}"
+            util.sysexit_with_message(msg)
+        return {}
+
+    def _render_base(
+        self,
+        path: str,
+        env: MutableMapping[str, Any],
+        keep_string: str | None,
+    ) -> MutableMapping[str, Any]:
+        """Interpolate a base config shared by all scenarios.
 
+        Args:
+            path: Path to the base config.
+            env: Environment used for interpolation.
+            keep_string: Prefix of variables to leave uninterpolated.
+
+        Returns:
+            The interpolated config.
+        """
         try:
-            return i.interpolate(stream, keep_string)
+            return config_layer.render(path, env, keep_string)
+        except yaml.scanner.ScannerError as e:
+            util.sysexit_with_message(str(e))
         except interpolation.InvalidInterpolation as e:
-            msg = f"parsing config file '{self.molecule_file}'.\n\n{e.place}\n{e.string}"
+            msg = f"parsing config file '{path}'.\n\n{e.place}\n{e.string}"
             util.sysexit_with_message(msg)
-        return ""
+        return {}
+
+    def _parse(self, path: str, stream: str) -> interpolation.Document:
+        """Return the parsed document of a config file.
+
+        Documents are kept for the lifetime of the config, so the second pass
+        substituting ``MOLECULE_`` variables does not parse them again.
+
+        Args:
+            path: Path to the config file.
+            stream: Content of the config file.
+
+        Returns:
+            The parsed document.
+        """
+        parsed = self._documents.get(path)
+        if parsed and parsed[0] == stream:
+            return parsed[1]
+
+        try:
+            document = interpolation.Document(stream)
+        except yaml.scanner.ScannerError as e:
+            util.sysexit_with_message(str(e))
+        self._documents[path] = (stream, document)
+        return document
 
     def _get_defaults(self) -> MutableMapping:  # type: ignore[type-arg]
         if not self.molecule_file:
@@ -424,6 +542,8 @@ class Config(metaclass=NewInitCaller):
                     "verify": "verify.yml",
                 },
                 "log": True,
+                "platform_group_size": 0,
+                "converge_scopes": [],
             },
             "scenario": {
                 "name": scenario_name,
@@ -468,6 +588,11 @@ class Config(metaclass=NewInitCaller):
         }
 
     def _validate(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
+        validated_config, self._validated_config = self._validated_config, None
+        if self.config is validated_config:
+            LOG.debug("Using validated config from cache for %s.", self.molecule_file)
+            return
+
         msg = f"Validating schema {self.molecule_file}."
         LOG.debug(msg)
 
@@ -476,6 +601,10 @@ class Config(metaclass=NewInitCaller):
             msg = f"Failed to validate {self.molecule_file}\n\n{errors}"
             util.sysexit_with_message(msg)
 
+        uncached_config, self._uncached_config = self._uncached_config, None
+        if uncached_config and uncached_config[1] is self.config:
+            config_cache.store(self.molecule_file, None, uncached_config[0], self.config)
+
 
 def molecule_directory(path: str) -> str:
     """Return directory of the current scenario."""
@@ -491,7 +620,7 @@ def set_env_from_file(env: MutableMapping[str, str], env_file: str) -> MutableMa
     """Load environment from file."""
     if env_file and os.path.exists(env_file):  # noqa: PTH110
         env = copy.copy(env)
-        d = util.safe_load_file(env_file)
+        d = config_layer.load_env_file(env_file)
         for k, v in d.items():
             env[k] = v
 
@@ -0,0 +1,140 @@
+"""Config Cache Module."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from typing import TYPE_CHECKING, Any
+
+from molecule import __version__, daemon, interpolation, scenario
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, MutableMapping
+
+
+LOG = logging.getLogger(__name__)
+CACHE_DIRECTORY = os.path.join("molecule", ".config_cache")  # noqa: PTH118
+
+
+def fingerprint(  # noqa: PLR0913
+    sources: Iterable[tuple[str, str]],
+    env: Mapping[str, Any],
+    env_file: str | None,
+    keep_string: str | None,
+    defaults: Mapping[str, Any] | None = None,
+    *,
+    schemas: Iterable[str] = (),
+) -> str:
+    """Compute the key of a merged config.
+
+    Args:
+        sources: Path and content of every file merged into the config, in order.
+        env: Environment used for interpolation, including the env file.
+        env_file: Path to the env file.
+        keep_string: Prefix of variables left uninterpolated.
+        defaults: Defaults the files are merged into, which may change
+            without the version changing in development installs.
+        schemas: Paths to the schemas cached configs skip validation against,
+            which change along with the drivers providing them.
+
+    Returns:
+        A hex digest changing whenever any of the inputs changes.
+    """
+    h = hashlib.sha256()
+    h.update(f"{__version__}\0{keep_string}\0".encode())
+    h.update(f"{json.dumps(defaults, sort_keys=True)}\0".encode())
+    for schema in schemas:
+        with contextlib.suppress(OSError):
+            stat = os.stat(schema)  # noqa: PTH116
+            h.update(f"{schema}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+        h.update(b"\0")
+    names = set()
+    for path, content in sources:
+        h.update(f"{path}\0{content}\0".encode())
+        names |= interpolation.referenced_variables(content)
+
+    if env_file and os.path.isfile(env_file):  # noqa: PTH113
+        with open(env_file, "rb") as stream:  # noqa: PTH123
+            h.update(stream.read())
+    h.update(b"\0")
+
+    for name in sorted(names):
+        h.update(f"{name}={env.get(name)!r}\0".encode())
+
+    return h.hexdigest()
+
+
+def load(molecule_file: str, keep_string: str | None, key: str) -> MutableMapping[str, Any] | None:
+    """Return the cached config for the given key.
+
+    Args:
+        molecule_file: Path to the scenario's ``molecule.yml``.
+        keep_string: Prefix of variables left uninterpolated.
+        key: Fingerprint computed by [molecule.config_cache.fingerprint][].
+
+    Returns:
+        The cached config or None when there is no valid entry.
+    """
+    path = _entry_path(molecule_file, keep_string)
+    # Commands run by ``molecule serve`` find the entries parsed by the daemon.
+    entry = daemon.preloaded(path)
+    if entry is None:
+        try:
+            with open(path, encoding="utf-8") as stream:  # noqa: PTH123
+                entry = json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+
+    LOG.debug("Using cached config %s for %s", path, molecule_file)
+    return entry.get("config")
+
+
+def store(
+    molecule_file: str,
+    keep_string: str | None,
+    key: str,
+    config: MutableMapping[str, Any],
+) -> None:
+    """Store a config under the given key.
+
+    Only one entry is kept per scenario and pass, replacing any previous one.
+    Configs which do not survive a JSON round trip unchanged are not cached.
+
+    Args:
+        molecule_file: Path to the scenario's ``molecule.yml``.
+        keep_string: Prefix of variables left uninterpolated.
+        key: Fingerprint computed by [molecule.config_cache.fingerprint][].
+        config: The merged config.
+    """
+    try:
+        data = json.dumps({"key": key, "config": config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(data)["config"] != config:
+        return
+
+    path = _entry_path(molecule_file, keep_string)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")  # noqa: PTH120
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            stream.write(data)
+        os.replace(tmp, path)  # noqa: PTH105
+    except OSError as e:
+        LOG.debug("Unable to cache config for %s: %s", molecule_file, e)
+
+
+def _entry_path(molecule_file: str, keep_string: str | None) -> str:
+    name = hashlib.sha256(f"{os.path.abspath(molecule_file)}\0{keep_string}".encode())  # noqa: PTH100
+    return os.path.join(  # noqa: PTH118
+        scenario.ephemeral_directory(CACHE_DIRECTORY),
+        f"{name.hexdigest()}.json",
+    )
@@ -0,0 +1,182 @@
+"""Config Layer Module."""
+
+from __future__ import annotations
+
+import copy
+import os
+
+from collections.abc import Callable, MutableMapping
+from typing import Any, NamedTuple
+
+from molecule import interpolation, util
+
+
+# Stands for the scenario name in the shared defaults, as it is the only
+# default depending on the scenario.
+DEFAULT_SCENARIO_NAME = "\0scenario-name"
+MAX_LAYERS = 32
+
+
+class _Source(NamedTuple):
+    signature: tuple[int, int]
+    content: str
+    names: frozenset[str]
+
+
+_Render = Callable[[str, MutableMapping[str, Any], str | None], MutableMapping[str, Any]]
+_sources: dict[str, _Source] = {}
+_documents: dict[str, tuple[tuple[int, int], interpolation.Document]] = {}
+_env_files: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_layers: dict[tuple[Any, ...], MutableMapping[str, Any]] = {}
+
+
+def read(path: str) -> str:
+    """Return the content of a shared config file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The content, read again only when the file changed.
+    """
+    return _source(path).content
+
+
+def render(
+    path: str,
+    env: MutableMapping[str, Any],
+    keep_string: str | None,
+) -> MutableMapping[str, Any]:
+    """Render a shared config file.
+
+    Args:
+        path: Path to the file.
+        env: Environment used for interpolation.
+        keep_string: Prefix of variables to leave uninterpolated.
+
+    Returns:
+        The rendered config.
+
+    Raises:
+        yaml.scanner.ScannerError: When the file is not valid YAML.
+        molecule.interpolation.InvalidInterpolation: On invalid placeholders.
+    """
+    source = _source(path)
+    parsed = _documents.get(path)
+    if parsed is None or parsed[0] != source.signature:
+        parsed = (source.signature, interpolation.Document(source.content))
+        _documents[path] = parsed
+    i = interpolation.Interpolator(interpolation.TemplateWithDefaults, env)
+    return parsed[1].render(i, keep_string)  # type: ignore[no-any-return]
+
+
+def base_layer(
+    defaults: Callable[[], MutableMapping[str, Any]],
+    base_configs: list[str],
+    env: MutableMapping[str, Any],
+    keep_string: str | None,
+    render_base: _Render | None = None,
+) -> MutableMapping[str, Any]:
+    """Return the defaults merged with the rendered base configs.
+
+    The result is shared and must not be modified.  The scenario name is left
+    as [molecule.config_layer.DEFAULT_SCENARIO_NAME][] unless a base config
+    sets it, see [molecule.config_layer.set_scenario_name][].
+
+    Args:
+        defaults: Returns the defaults, with any scenario name.
+        base_configs: Paths to the base configs, in merge order.
+        env: Environment used for interpolation.
+        keep_string: Prefix of variables to leave uninterpolated.
+        render_base: Renders a base config, defaults to
+            [molecule.config_layer.render][].
+
+    Returns:
+        The merged config.
+    """
+    render_base = render_base or render
+    key = (keep_string, tuple(_key(path, env) for path in base_configs))
+    layer = _layers.get(key)
+    if layer is None:
+        layer = defaults()
+        layer["scenario"]["name"] = DEFAULT_SCENARIO_NAME
+        for path in base_configs:
+            layer = util.merge_dicts(layer, render_base(path, env, keep_string))
+        while len(_layers) >= MAX_LAYERS:
+            del _layers[next(iter(_layers))]
+        _layers[key] = layer
+    return layer
+
+
+def set_scenario_name(config: MutableMapping[str, Any], name: str) -> MutableMapping[str, Any]:
+    """Replace the scenario name left by the shared defaults.
+
+    Args:
+        config: A config merged on top of a base layer, not shared.
+        name: The default scenario name.
+
+    Returns:
+        The config.
+    """
+    scenario = config.get("scenario")
+    if isinstance(scenario, MutableMapping) and scenario.get("name") == DEFAULT_SCENARIO_NAME:
+        scenario["name"] = name
+    return config
+
+
+def merge(
+    layer: MutableMapping[str, Any],
+    config: MutableMapping[str, Any] | None,
+) -> MutableMapping[str, Any]:
+    """Merge a config on top of a shared layer.
+
+    Args:
+        layer: The shared layer.
+        config: The config to merge, if any.
+
+    Returns:
+        A new config, sharing nothing with the layer.
+    """
+    if config is None:
+        return copy.deepcopy(layer)
+    return util.merge_dicts(layer, config)
+
+
+def load_env_file(path: str) -> dict[str, Any]:
+    """Return the variables of an env file.
+
+    Args:
+        path: Path to the env file.
+
+    Returns:
+        The variables, loaded again only when the file changed.  The result is
+        shared and must not be modified.
+    """
+    signature = _signature(path)
+    cached = _env_files.get(path)
+    if cached is None or cached[0] != signature:
+        cached = (signature, util.safe_load_file(path) or {})
+        _env_files[path] = cached
+    return cached[1]
+
+
+def _key(path: str, env: MutableMapping[str, Any]) -> tuple[Any, ...]:
+    source = _source(path)
+    variables = tuple((name, repr(env.get(name))) for name in sorted(source.names))
+    return path, source.signature, variables
+
+
+def _source(path: str) -> _Source:
+    signature = _signature(path)
+    source = _sources.get(path)
+    if source is None or source.signature != signature:
+        with open(path) as stream:  # noqa: PTH123
+            content = stream.read()
+        source = _Source(signature, content, frozenset(interpolation.referenced_variables(content)))
+        _sources[path] = source
+    return source
+
+
+def _signature(path: str) -> tuple[int, int]:
+    stat = os.stat(path)  # noqa: PTH116
+    return stat.st_mtime_ns, stat.st_size
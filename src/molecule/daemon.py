@@ -0,0 +1,410 @@
+"""Molecule Daemon Module."""
+
+from __future__ import annotations
+
+# The client imports this module before anything else, so it only imports the
+# standard library and molecule.forking here, and the rest where the daemon
+# uses it.
+import atexit
+import contextlib
+import hashlib
+import importlib
+import importlib.metadata
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import sys
+import traceback
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from molecule import forking
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+
+LOG = logging.getLogger(__name__)
+# Commands needing the controlling terminal of the client, or the daemon itself.
+NOT_FORWARDED = frozenset(("login", "serve"))
+# Libraries imported by every command, so imported once by the daemon.
+WARM_IMPORTS = (
+    "ansible_compat.runtime",
+    "click",
+    "click_help_colors",
+    "enrich.console",
+    "enrich.logging",
+    "jinja2",
+    "jsonschema",
+    "packaging.version",
+    "pluggy",
+    "rich.console",
+    "rich.logging",
+    "wcmatch.glob",
+    "yaml",
+    "molecule.app",
+)
+# Variables which differ between shells without affecting Molecule.
+VOLATILE_VARIABLES = frozenset(("_", "OLDPWD", "PWD", "SHLVL"))
+# Files Ansible may read its config from, besides ``ANSIBLE_CONFIG``.
+ANSIBLE_CONFIG_FILES = ("ansible.cfg", "~/.ansible.cfg", "/etc/ansible/ansible.cfg")
+MAX_RUNTIMES = 8
+SIGNALS = (signal.SIGHUP, signal.SIGINT, signal.SIGQUIT, signal.SIGTERM)
+
+# Parsed files by path, along with the size and modification time they had.
+_preloaded: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def socket_path(environ: Mapping[str, str] = os.environ) -> str:
+    """Return the path of the socket of the daemon.
+
+    Args:
+        environ: Environment of the command.
+
+    Returns:
+        ``MOLECULE_DAEMON_SOCKET``, or a socket of the current user in the
+        runtime or cache directory.
+    """
+    if environ.get("MOLECULE_DAEMON_SOCKET"):
+        return environ["MOLECULE_DAEMON_SOCKET"]
+    directory = environ.get("XDG_RUNTIME_DIR") or environ.get("XDG_CACHE_HOME")
+    if not directory:
+        directory = os.path.expanduser("~/.cache")  # noqa: PTH111
+    return os.path.join(directory, "molecule", f"daemon-{os.getuid()}.sock")  # noqa: PTH118
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run a command line through the daemon, when it is running.
+
+    Args:
+        argv: The command line, starting with the name of the program.
+
+    Returns:
+        The exit code of the command, or ``None`` when it needs to run in
+        this process.
+    """
+    if os.environ.get("MOLECULE_NO_DAEMON") or NOT_FORWARDED.intersection(argv[1:]):
+        return None
+    path = socket_path()
+    if not os.path.exists(path):  # noqa: PTH110
+        return None
+
+    umask = os.umask(0)
+    os.umask(umask)
+    request = {
+        "argv": argv,
+        "prog": _program_name(argv[0]),
+        "cwd": os.getcwd(),  # noqa: PTH109
+        "env": dict(os.environ),
+        "umask": umask,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+            socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], [0, 1, 2])
+        except OSError:
+            return None
+        return _wait(sock)
+
+
+def _program_name(path: str) -> str:
+    """Return the program name click shows for Molecule, as run by the client."""
+    package = getattr(sys.modules["__main__"], "__package__", None)
+    if not package:
+        return os.path.basename(path)  # noqa: PTH119
+    name = os.path.splitext(os.path.basename(path))[0]  # noqa: PTH119, PTH122
+    return f"python -m {package if name == '__main__' else f'{package}.{name}'}"
+
+
+def _wait(sock: socket.socket) -> int | None:
+    """Relay signals to the command until the daemon reports its exit code."""
+    pid = None
+
+    def relay(signum: int, frame: object) -> None:  # noqa: ARG001
+        if pid:
+            with contextlib.suppress(OSError):
+                os.kill(pid, signum)
+
+    for signum in SIGNALS:
+        signal.signal(signum, relay)
+    for line in sock.makefile("r"):
+        status, _, value = line.strip().partition(" ")
+        if status == "pid":
+            pid = int(value)
+        elif status == "exit":
+            return int(value)
+        else:
+            return None
+    # The daemon stopped while the command was running.
+    return 1
+
+
+def preloaded(path: str) -> Any:  # noqa: ANN401
+    """Return the content the daemon parsed of a JSON file, unless it changed since.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The parsed content, or ``None``.
+    """
+    entry = _preloaded.get(path)
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return entry[1] if entry[0] == (stat.st_size, stat.st_mtime_ns) else None
+
+
+def preload(directory: str) -> None:
+    """Parse the JSON files of a directory which changed since last parsed.
+
+    Args:
+        directory: The directory.
+    """
+    with contextlib.suppress(OSError):
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(".json"):
+                continue
+            stat = entry.stat()
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            cached = _preloaded.get(entry.path)
+            if cached and cached[0] == fingerprint:
+                continue
+            with contextlib.suppress(OSError, ValueError):
+                _preloaded[entry.path] = (fingerprint, json.loads(Path(entry.path).read_text()))
+
+
+class Daemon:
+    """Server running the commands forwarded by clients."""
+
+    def __init__(self, path: str, run: Callable[[list[str], str], object]) -> None:
+        """Initialize a new daemon.
+
+        Args:
+            path: Path of the socket to listen on.
+            run: Function running the arguments of a command line, given the
+                program name to show.
+        """
+        self.path = path
+        self.run = run
+        self._runtimes: dict[str, Any] = {}
+        self._children: dict[int, socket.socket] = {}
+        self._packages = _packages_fingerprint()
+        self._wakeup = (-1, -1)
+
+    def serve(self) -> None:
+        """Warm up, then run the commands of clients until terminated."""
+        for name in WARM_IMPORTS:
+            importlib.import_module(name)
+        # Plugins are looked up among the installed distributions.
+        importlib.metadata.entry_points()
+
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)  # noqa: PTH103, PTH120
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)  # noqa: PTH108
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the user may connect, from the moment the socket exists.
+        umask = os.umask(0o077)
+        try:
+            server.bind(self.path)
+        finally:
+            os.umask(umask)
+        server.listen()
+        # Children exiting wake the daemon up through a pipe.
+        self._wakeup = os.pipe()
+        for fd in self._wakeup:
+            os.set_blocking(fd, False)
+        signal.set_wakeup_fd(self._wakeup[1])
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ)
+        selector.register(self._wakeup[0], selectors.EVENT_READ)
+        LOG.info("Serving on %s", self.path)
+        try:
+            while True:
+                for key, _ in selector.select():
+                    if key.fileobj is server:
+                        conn, _ = server.accept()
+                        self._handle(server, conn)
+                    else:
+                        with contextlib.suppress(BlockingIOError):
+                            while os.read(self._wakeup[0], 512):
+                                pass
+                self._reap()
+        finally:
+            server.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)  # noqa: PTH108
+
+    def _handle(self, server: socket.socket, conn: socket.socket) -> None:
+        try:
+            request, fds = forking.receive(conn)
+        except (OSError, ValueError) as e:
+            LOG.warning("Invalid request: %s", e)
+            conn.close()
+            return
+
+        restart = _packages_fingerprint() != self._packages
+        runtime = None if restart else self._runtime(request)
+        if runtime is None:
+            forking.close(fds)
+            with contextlib.suppress(OSError):
+                conn.sendall(b"fallback\n")
+            conn.close()
+            if restart:
+                LOG.info("Installed packages changed, restarting")
+                server.close()
+                os.execv(sys.executable, [sys.executable, *sys.orig_argv[1:]])  # noqa: S606
+            return
+
+        from molecule.app import app  # noqa: PLC0415
+
+        app.runtime = runtime
+        preload(_config_cache_directory(request))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if not pid:
+            signal.set_wakeup_fd(-1)
+            forking.close(list(self._wakeup))
+            for sock in (server, conn, *self._children.values()):
+                sock.close()
+            _run(request, fds, self.run)
+        forking.close(fds)
+        try:
+            conn.sendall(f"pid {pid}\n".encode())
+        except OSError:
+            conn.close()
+            return
+        self._children[pid] = conn
+
+    def _runtime(self, request: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return the Ansible runtime of a command, built by the daemon."""
+        key = runtime_key(request["cwd"], request["env"])
+        if key not in self._runtimes:
+            from ansible_compat.runtime import Runtime  # noqa: PLC0415
+
+            try:
+                with _context(request):
+                    runtime = Runtime(isolated=False)
+                    runtime.version  # noqa: B018
+            except Exception:
+                LOG.warning("Unable to initialize Ansible for %s", request["cwd"], exc_info=True)
+                return None
+            if len(self._runtimes) >= MAX_RUNTIMES:
+                del self._runtimes[next(iter(self._runtimes))]
+            self._runtimes[key] = runtime
+        return self._runtimes[key]
+
+    def _reap(self) -> None:
+        for pid, conn in list(self._children.items()):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if not done:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            with contextlib.suppress(OSError):
+                conn.sendall(f"exit {code if code >= 0 else 128 - code}\n".encode())
+            conn.close()
+            del self._children[pid]
+
+
+def _run(
+    request: dict[str, Any],
+    fds: list[int],
+    run: Callable[[list[str], str], object],
+) -> None:
+    """Run a command in a child of the daemon, then exit with its code."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    for signum in (signal.SIGCHLD, signal.SIGHUP, signal.SIGQUIT, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_DFL)
+    forking.attach(fds)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.umask(request["umask"])
+    sys.argv = list(request["argv"])
+
+    code = 1
+    try:
+        run(sys.argv[1:], request["prog"])
+        code = 0
+    except SystemExit as e:
+        code = forking.exit_code(e)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(Exception):
+            atexit._run_exitfuncs()  # noqa: SLF001
+        with contextlib.suppress(Exception):
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(code)
+
+
+@contextlib.contextmanager
+def _context(request: dict[str, Any]) -> Iterator[None]:
+    """Run with the working directory and environment of a command."""
+    cwd = os.getcwd()  # noqa: PTH109
+    environ = dict(os.environ)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(environ)
+
+
+def runtime_key(cwd: str, env: Mapping[str, str]) -> str:
+    """Return what Ansible configures itself from, when started in a directory.
+
+    Args:
+        cwd: The working directory.
+        env: The environment.
+
+    Returns:
+        A digest of the directory, of the environment and of the Ansible
+        config files which may be read there.
+    """
+    h = hashlib.sha256(f"{cwd}\0".encode())
+    for name, value in sorted(env.items()):
+        if name not in VOLATILE_VARIABLES:
+            h.update(f"{name}={value}\0".encode())
+    # Their contents are hashed, as Molecule rewrites the config of a
+    # scenario, unchanged, before every playbook it runs.
+    for name in (env.get("ANSIBLE_CONFIG", ""), *ANSIBLE_CONFIG_FILES):
+        path = os.path.join(cwd, os.path.expanduser(name)) if name else ""  # noqa: PTH111, PTH118
+        with contextlib.suppress(OSError), open(path, "rb") as f:  # noqa: PTH123
+            h.update(f"{path}\0".encode() + f.read() + b"\0")
+    return h.hexdigest()
+
+
+def _packages_fingerprint() -> list[tuple[str, int]]:
+    """Return the modification times of the directories modules are imported from."""
+    fingerprint = []
+    # The working directory, the first entry of python -m, is left out.
+    for entry in filter(None, sys.path):
+        with contextlib.suppress(OSError):
+            fingerprint.append((entry, os.stat(entry).st_mtime_ns))  # noqa: PTH116
+    return fingerprint
+
+
+def _config_cache_directory(request: dict[str, Any]) -> str:
+    """Return the directory of the config cache of a command, see molecule.config_cache."""
+    env = request["env"]
+    directory = env.get("MOLECULE_EPHEMERAL_DIRECTORY") or env.get(
+        "XDG_CACHE_HOME",
+        os.path.expanduser("~/.cache"),  # noqa: PTH111
+    )
+    return os.path.join(request["cwd"], directory, "molecule", ".config_cache")  # noqa: PTH118
@@ -91,7 +91,7 @@ class AnsibleGalaxyBase(base.Base):
 
     @property
     def default_env(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return util.merge_dicts(os.environ, self._config.env)
+        return util.overlay_env(os.environ, self._config.env)
 
     def bake(self):  # type: ignore[no-untyped-def]  # noqa: ANN201
         """Bake an ``ansible-galaxy`` command so it's ready to execute and returns None."""
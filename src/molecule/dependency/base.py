@@ -105,7 +105,7 @@ class Base:
         Returns:
             dict
         """
-        env = util.merge_dicts(os.environ, self._config.env)
+        env = util.overlay_env(os.environ, self._config.env)
         return env  # noqa: RET504
 
     @property
@@ -129,7 +129,7 @@ class Base:
 
     @property
     def env(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return util.merge_dicts(
+        return util.overlay_env(
             self.default_env,
             self._config.config["dependency"]["env"],
         )
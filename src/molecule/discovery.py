@@ -0,0 +1,183 @@
+"""Scenario Discovery Module."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from typing import Any
+
+from wcmatch import glob
+
+from molecule import __version__, scenario
+from molecule.util import boolean
+
+
+LOG = logging.getLogger(__name__)
+MOLECULE_DISCOVERY_CACHE = boolean(os.environ.get("MOLECULE_DISCOVERY_CACHE", "True"))
+CACHE_DIRECTORY = os.path.join("molecule", ".discovery_cache")  # noqa: PTH118
+FLAGS = glob.GLOBSTAR | glob.BRACE | glob.DOTGLOB
+# Directories changing this close to the walk may change again within the
+# resolution of their modification time, unnoticed.
+RACY_NS = 2_000_000_000
+# Never worth walking, and modified by most git commands.
+SKIPPED_DIRECTORIES = frozenset((".git",))
+
+
+def find(glob_str: str) -> list[str]:
+    """Return the files matching a glob.
+
+    Args:
+        glob_str: A string representing the glob used to find Molecule config files.
+
+    Returns:
+        The matching paths, relative to the current directory unless the glob
+        is absolute.
+    """
+    if not MOLECULE_DISCOVERY_CACHE:
+        return walk(glob_str)[0]
+
+    path = _entry_path(glob_str)
+    paths = _load(path)
+    if paths is not None:
+        LOG.debug("Using cached discovery %s for %s", path, glob_str)
+        return paths
+
+    start = time.time_ns()
+    paths, directories = walk(glob_str)
+    if all(mtime < start - RACY_NS for mtime in directories.values()):
+        _store(path, {"paths": paths, "directories": directories})
+    return paths
+
+
+def walk(glob_str: str) -> tuple[list[str], dict[str, int]]:
+    """Walk the directories a glob can match in.
+
+    Args:
+        glob_str: A string representing the glob used to find Molecule config files.
+
+    Returns:
+        The matching paths and the modification time of every listed directory.
+    """
+    segments = glob_str.split("/")
+    prefix = []
+    for segment in segments[:-1]:
+        if glob.is_magic(segment, flags=FLAGS):
+            break
+        prefix.append(segment)
+    rest = segments[len(prefix) :]
+
+    tail = len(rest) - 1
+    depth: int | None = tail
+    # Symlinked directories are not followed by ``**``, only by the segments
+    # after it.
+    if any("**" in segment for segment in rest):
+        depth = None
+        tail = len(rest) - 1 - max(i for i, s in enumerate(rest) if "**" in s)
+
+    root = "/".join(prefix) or ("/" if glob_str.startswith("/") else "")
+    ephemeral_root = os.path.dirname(scenario.ephemeral_directory())  # noqa: PTH120
+    walker = _Walker(glob_str, segments[-1], ephemeral_root, tail)
+    walker.walk(root, depth)
+    return walker.paths, walker.directories
+
+
+class _Walker:
+    def __init__(self, glob_str: str, basename: str, ephemeral_root: str, tail: int) -> None:
+        self.matcher = glob.compile(glob_str, flags=FLAGS)
+        # Cheaper than matching the full path of every file.
+        self.basename = None if glob.is_magic(basename, flags=FLAGS) else basename
+        self.ephemeral_root = ephemeral_root
+        self.ephemeral_name = os.path.basename(ephemeral_root)  # noqa: PTH119
+        self.tail = tail
+        self.paths: list[str] = []
+        self.directories: dict[str, int] = {}
+
+    def walk(self, directory: str, depth: int | None) -> None:
+        """Record matching files below a directory.
+
+        Args:
+            directory: Directory to list, relative unless the glob is absolute.
+            depth: Levels of subdirectories left to walk, None for no limit.
+        """
+        path = directory or "."
+        self.directories[path] = _mtime(path)
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            name = os.path.join(directory, entry.name) if directory else entry.name  # noqa: PTH118
+            try:
+                is_dir = entry.is_dir()
+            except OSError:  # pragma: no cover
+                continue
+            if is_dir:
+                self._descend(entry, name, depth)
+            elif self.basename in (None, entry.name) and self.matcher.match(name):
+                self.paths.append(name)
+
+    def _descend(self, entry: os.DirEntry[str], name: str, depth: int | None) -> None:
+        if depth == 0 or entry.name in SKIPPED_DIRECTORIES:
+            return
+        if entry.name == self.ephemeral_name and os.path.abspath(name) == self.ephemeral_root:  # noqa: PTH100
+            # Written to by every run.
+            return
+        if depth is not None:
+            self.walk(name, depth - 1)
+        elif not entry.is_symlink():
+            self.walk(name, None)
+        elif self.tail > 0:
+            self.walk(name, self.tail - 1)
+
+
+def _mtime(path: str) -> int:
+    """Return the modification time of a directory, or -1 if it is missing.
+
+    Args:
+        path: Path to the directory.
+
+    Returns:
+        The modification time in nanoseconds.
+    """
+    try:
+        return os.stat(path).st_mtime_ns  # noqa: PTH116
+    except FileNotFoundError:
+        return -1
+
+
+def _load(path: str) -> list[str] | None:
+    try:
+        with open(path, encoding="utf-8") as stream:  # noqa: PTH123
+            entry = json.load(stream)
+        for directory, mtime in entry["directories"].items():
+            if _mtime(directory) != mtime:
+                LOG.debug("Discovery cache invalidated by %s", directory)
+                return None
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+    return entry["paths"]  # type: ignore[no-any-return]
+
+
+def _store(path: str, entry: dict[str, Any]) -> None:
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")  # noqa: PTH120
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            json.dump(entry, stream)
+        os.replace(tmp, path)  # noqa: PTH105
+    except OSError as e:
+        LOG.debug("Unable to cache discovery of %s: %s", path, e)
+
+
+def _entry_path(glob_str: str) -> str:
+    name = hashlib.sha256(f"{__version__}\0{os.getcwd()}\0{glob_str}".encode())  # noqa: PTH109
+    return os.path.join(  # noqa: PTH118
+        scenario.ephemeral_directory(CACHE_DIRECTORY),
+        f"{name.hexdigest()}.json",
+    )
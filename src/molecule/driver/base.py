@@ -139,10 +139,7 @@ class Driver:
 
     @property
     def instance_config(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(  # noqa: PTH118
-            self._config.scenario.ephemeral_directory,
-            "instance_config.yml",
-        )
+        return self._config.layout.instance_config
 
     @property
     def ssh_connection_options(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -0,0 +1,266 @@
+"""Scenario Durations Module."""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import statistics
+import tempfile
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from molecule import scenario, timings
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from molecule.results import RunResult
+
+
+LOG = logging.getLogger(__name__)
+
+# Number of durations kept for every scenario and sequence.
+SAMPLES = 5
+# Number of durations kept for every action of a scenario.
+ACTION_SAMPLES = 20
+
+
+class Stat(NamedTuple):
+    """Durations of an action of a scenario.
+
+    Attributes:
+        scenario: Name of the scenario.
+        action: Name of the action.
+        runs: Number of times the action succeeded.
+        failures: Number of times the action failed.
+        p50: Median duration of its last successful runs, in seconds.
+        p95: 95th percentile of the durations of its last successful runs, in seconds.
+    """
+
+    scenario: str
+    action: str
+    runs: int
+    failures: int
+    p50: float
+    p95: float
+
+
+class Mover(NamedTuple):
+    """Change of the duration of an action between its last two successful runs.
+
+    Attributes:
+        scenario: Name of the scenario.
+        action: Name of the action.
+        previous: Duration of the run before the last one, in seconds.
+        latest: Duration of the last run, in seconds.
+    """
+
+    scenario: str
+    action: str
+    previous: float
+    latest: float
+
+    @property
+    def change(self) -> float:
+        """Return how much longer the last run took, in seconds."""
+        return self.latest - self.previous
+
+
+def path() -> str:
+    """Return the path to the durations file of the current project.
+
+    Returns:
+        ``MOLECULE_DURATIONS_FILE``, or ``durations.json`` in the cache
+        directory of the project.
+    """
+    if os.environ.get("MOLECULE_DURATIONS_FILE"):
+        return os.environ["MOLECULE_DURATIONS_FILE"]
+    project = os.path.basename(os.getenv("MOLECULE_PROJECT_DIRECTORY", os.getcwd()))  # noqa: PTH109, PTH119
+    return os.path.join(  # noqa: PTH118
+        scenario.ephemeral_directory(os.path.join("molecule", project)),  # noqa: PTH118
+        "durations.json",
+    )
+
+
+def load(sequence: str) -> dict[str, float]:
+    """Return the estimated durations of the scenarios running a sequence.
+
+    With ``MOLECULE_TIMINGS`` set, the durations are the ones of the runs
+    of the sequence in the timings of the actions.
+
+    Args:
+        sequence: Name of the sequence.
+
+    Returns:
+        Mean of the recorded durations, in seconds, by scenario name.
+    """
+    if timings.enabled():
+        samples = _sequences(timings.rows(), sequence)
+    else:
+        samples = _read(path())["sequences"].get(sequence, {})
+    return {name: sum(values) / len(values) for name, values in samples.items() if values}
+
+
+def record(sequence: str, result: RunResult) -> None:
+    """Record the durations of a run.
+
+    Scenarios which failed are left out of the durations of the sequence,
+    and failed actions are only counted.
+
+    Args:
+        sequence: Name of the sequence which ran.
+        result: Results of the run.
+    """
+    if not result.actions:
+        return
+    file = path()
+    try:
+        # Runs recording at once would otherwise drop each other's durations.
+        with _locked(file):
+            data = _read(file)
+            _add(data, sequence, result)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(file) or ".", suffix=".tmp")  # noqa: PTH120
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                json.dump(data, stream, indent=2, sort_keys=True)
+            os.replace(tmp, file)  # noqa: PTH105
+    except OSError as e:
+        LOG.debug("Unable to record durations in %s: %s", file, e)
+
+
+def stats(scenario_name: str | None = None) -> list[Stat]:
+    """Return the durations of the actions of the scenarios.
+
+    Args:
+        scenario_name: Name of the only scenario to report, all by default.
+
+    Returns:
+        The durations of every action which ran, by scenario and action name.
+    """
+    return [
+        Stat(
+            name,
+            action,
+            entry["runs"],
+            entry["failures"],
+            percentile(entry["durations"], 50),
+            percentile(entry["durations"], 95),
+        )
+        for name, action, entry in _actions(scenario_name)
+    ]
+
+
+def movers(scenario_name: str | None = None) -> list[Mover]:
+    """Return the actions which got slower between their last two successful runs.
+
+    Args:
+        scenario_name: Name of the only scenario to report, all by default.
+
+    Returns:
+        The actions which got slower, the ones slowing down the most first.
+    """
+    found = [
+        Mover(name, action, *entry["durations"][-2:])
+        for name, action, entry in _actions(scenario_name)
+        if len(entry["durations"]) >= 2  # noqa: PLR2004
+    ]
+    return sorted(
+        (mover for mover in found if mover.change > 0),
+        key=lambda mover: (-mover.change, mover.scenario, mover.action),
+    )
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Return a percentile of durations.
+
+    Args:
+        values: The durations.
+        percent: The percentile, between 1 and 99.
+
+    Returns:
+        The percentile, interpolated between the durations, or 0 without any.
+    """
+    if len(values) < 2:  # noqa: PLR2004
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def _add(data: dict[str, Any], sequence: str, result: RunResult) -> None:
+    """Add the durations of a run to the content of a durations file."""
+    failed = {action.scenario for action in result.failed}
+    totals: dict[str, float] = {}
+    for action in result.actions:
+        actions = data["actions"].setdefault(action.scenario, {})
+        entry = actions.setdefault(action.action, {"runs": 0, "failures": 0, "durations": []})
+        if action.returncode:
+            entry["failures"] += 1
+            continue
+        entry["runs"] += 1
+        entry["durations"] = [*entry["durations"], round(action.duration, 3)][-ACTION_SAMPLES:]
+        if action.scenario not in failed:
+            totals[action.scenario] = totals.get(action.scenario, 0.0) + action.duration
+
+    samples = data["sequences"].setdefault(sequence, {})
+    for name, duration in totals.items():
+        samples[name] = [*samples.get(name, []), round(duration, 3)][-SAMPLES:]
+
+
+def _sequences(rows: list[timings.Row], sequence: str) -> dict[str, list[float]]:
+    """Return the last durations of the runs of a sequence which succeeded, by scenario."""
+    totals: dict[tuple[str, str], float] = {}
+    failed: set[tuple[str, str]] = set()
+    for row in rows:
+        if row.sequence != sequence:
+            continue
+        key = (row.scenario, row.run_uuid)
+        totals[key] = totals.get(key, 0.0) + row.duration
+        if row.returncode:
+            failed.add(key)
+
+    samples: dict[str, list[float]] = {}
+    for (name, run_uuid), duration in totals.items():
+        if (name, run_uuid) not in failed:
+            samples[name] = [*samples.get(name, []), duration][-SAMPLES:]
+    return samples
+
+
+def _actions(scenario_name: str | None) -> list[tuple[str, str, dict[str, Any]]]:
+    """Return the recorded actions, by scenario and action name."""
+    recorded = _read(path())["actions"]
+    if timings.enabled():
+        recorded = {}
+        for row in timings.rows():
+            actions = recorded.setdefault(row.scenario, {})
+            entry = actions.setdefault(row.action, {"runs": 0, "failures": 0, "durations": []})
+            if row.returncode:
+                entry["failures"] += 1
+            else:
+                entry["runs"] += 1
+                entry["durations"] = [*entry["durations"], row.duration][-ACTION_SAMPLES:]
+    return [
+        (name, action, entry)
+        for name, actions in sorted(recorded.items())
+        if not scenario_name or name == scenario_name
+        for action, entry in sorted(actions.items())
+    ]
+
+
+@contextlib.contextmanager
+def _locked(file: str) -> Iterator[None]:
+    """Hold the lock of a durations file, which other runs wait for."""
+    with open(f"{file}.lock", "a", encoding="utf-8") as stream:  # noqa: PTH123
+        fcntl.lockf(stream, fcntl.LOCK_EX)
+        yield
+
+
+def _read(file: str) -> dict[str, Any]:
+    """Return the content of a durations file, empty when missing or invalid."""
+    data: dict[str, Any] = {}
+    with contextlib.suppress(OSError, ValueError), open(file, encoding="utf-8") as stream:  # noqa: PTH123
+        data = json.load(stream)
+    if not isinstance(data, dict):
+        data = {}
+    return {"sequences": data.get("sequences") or {}, "actions": data.get("actions") or {}}
@@ -0,0 +1,89 @@
+"""Molecule Exceptions Module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from molecule.results import ActionResult, RunResult
+
+
+class MoleculeExit(SystemExit):
+    """Exit of a Molecule command, along with the message explaining it."""
+
+    def __init__(self, code: int = 1, message: str = "") -> None:
+        """Initialize the exit.
+
+        Args:
+            code: Exit code.
+            message: Message logged about the exit, if any.
+        """
+        super().__init__(code)
+        self.message = message
+
+
+class MoleculeError(Exception):
+    """Base class of the errors of Molecule runs.
+
+    Attributes:
+        message: Message logged about the error, if any.
+        code: Exit code the command line returns for the error.
+    """
+
+    def __init__(self, message: str = "", code: int = 1) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Message logged about the error, if any.
+            code: Exit code the command line returns for the error.
+        """
+        super().__init__(message or f"Molecule exited with code {code}")
+        self.message = message
+        self.code = code
+
+
+class ConfigError(MoleculeError):
+    """The scenarios to run could not be found, or their configs are invalid."""
+
+
+class RunError(MoleculeError):
+    """A run failed.
+
+    Attributes:
+        result: Results of the actions which ran, up to the failure.
+    """
+
+    def __init__(self, result: RunResult, message: str = "", code: int = 1) -> None:
+        """Initialize the error.
+
+        Args:
+            result: Results of the actions which ran, up to the failure.
+            message: Message logged about the error, if any.
+            code: Exit code the command line returns for the error.
+        """
+        super().__init__(message, code)
+        self.result = result
+
+
+class ActionError(RunError):
+    """An action of a scenario failed.
+
+    Attributes:
+        action: Result of the action which failed.
+    """
+
+    def __init__(self, result: RunResult, action: ActionResult, code: int = 1) -> None:
+        """Initialize the error.
+
+        Args:
+            result: Results of the actions which ran, up to the failure.
+            action: Result of the action which failed.
+            code: Exit code the command line returns for the error.
+        """
+        super().__init__(
+            result,
+            action.message or f"Action {action.action} of scenario {action.scenario} failed",
+            code,
+        )
+        self.action = action
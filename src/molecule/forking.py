@@ -0,0 +1,108 @@
+"""Forked Commands Module."""
+
+from __future__ import annotations
+
+# The clients of the daemon and the zygotes import this module before anything
+# else, so it only imports the standard library.
+import contextlib
+import json
+import os
+import socket
+import sys
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+
+def receive(conn: socket.socket) -> tuple[dict[str, Any], list[int]]:
+    """Receive a request along with the standard streams of its client.
+
+    Args:
+        conn: Connection to the client.
+
+    Returns:
+        The request, and the file descriptors of the streams.
+
+    Raises:
+        ValueError: When the request is invalid or misses a stream.
+    """
+    data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            close(fds)
+            msg = "truncated request"
+            raise ValueError(msg)
+        data += chunk
+    if len(fds) != 3:  # noqa: PLR2004
+        close(fds)
+        msg = "expected the standard streams of the client"
+        raise ValueError(msg)
+    return json.loads(data), fds
+
+
+def close(fds: list[int]) -> None:
+    """Close file descriptors, ignoring the ones already closed.
+
+    Args:
+        fds: The file descriptors.
+    """
+    for fd in fds:
+        with contextlib.suppress(OSError):
+            os.close(fd)
+
+
+def attach(fds: list[int]) -> None:
+    """Make the standard streams of a client the ones of this process.
+
+    Args:
+        fds: The file descriptors of the standard streams of the client,
+            which are closed once duplicated.
+    """
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+    close(fds)
+    sys.stdin, sys.stdout, sys.stderr = (
+        _stream(fd, stream) for fd, stream in enumerate((sys.stdin, sys.stdout, sys.stderr))
+    )
+
+
+def _stream(fd: int, stream: TextIO) -> TextIO:
+    """Open a standard stream of the client, as the interpreter would have.
+
+    The streams of the server are not reused, as they keep what they found
+    out about the files of the server, such as whether they can seek.
+    """
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    errors = getattr(stream, "errors", None) or "strict"
+    if fd == 0:
+        return open(fd, encoding=encoding, errors=errors, closefd=False)
+    return open(
+        fd,
+        "w",
+        encoding=encoding,
+        errors=errors,
+        closefd=False,
+        # Like the interpreter, stderr is always line buffered.
+        buffering=1 if fd == 2 or os.isatty(fd) else -1,  # noqa: PLR2004
+    )
+
+
+def exit_code(e: SystemExit) -> int:
+    """Return the exit code of the interpreter exiting with an exception.
+
+    Args:
+        e: The exception.
+
+    Returns:
+        The exit code, printing the message the exception exits with, if any.
+    """
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)  # noqa: T201
+    return 1
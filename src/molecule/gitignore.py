@@ -0,0 +1,412 @@
+"""Git Ignore Module."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+
+from typing import NamedTuple
+
+
+LOG = logging.getLogger(__name__)
+# Settings changing which files are read or how they are matched.
+UNSUPPORTED_ENVIRONMENT = ("GIT_DIR", "GIT_WORK_TREE", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_SYSTEM")
+
+
+class Unsupported(Exception):  # noqa: N818
+    """Raised when ignore rules use a feature the engine cannot evaluate."""
+
+
+class Rule(NamedTuple):
+    """A compiled ignore pattern."""
+
+    regex: re.Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+class _Compiled(NamedTuple):
+    mtime: int
+    rules: list[Rule] | None
+
+
+_compiled: dict[str, _Compiled] = {}
+_config_cache: dict[str, tuple[int | None, str | None]] = {}
+
+
+def filter_ignored(paths: list[str], root: str | None = None) -> list[str]:
+    """Remove the paths ignored by git.
+
+    Args:
+        paths: Paths to files or directories, relative to the current directory
+            or absolute.
+        root: Directory the paths were found in.  When git ignores it, the
+            paths are returned unfiltered, as it was explicitly asked for.
+
+    Returns:
+        The paths not ignored, in their original order.
+    """
+    if root is not None and paths and not filter_ignored([root]):
+        return paths
+
+    candidates = []
+    for path in paths:
+        try:
+            ignored = is_ignored(path)
+        except (Unsupported, OSError) as e:
+            LOG.debug("Asking git whether %s is ignored: %s", path, e)
+            ignored = True
+        if ignored:
+            candidates.append(path)
+    if not candidates:
+        return paths
+
+    confirmed = check_ignore(candidates)
+    if confirmed is None:
+        # Without git, trust the rules for what they could evaluate.
+        confirmed = {path for path in candidates if _safe_is_ignored(path)}
+    return [path for path in paths if path not in confirmed]
+
+
+def _safe_is_ignored(path: str) -> bool:
+    try:
+        return is_ignored(path)
+    except (Unsupported, OSError):
+        return False
+
+
+def check_ignore(paths: list[str]) -> set[str] | None:
+    """Ask git which of the given paths are ignored.
+
+    Args:
+        paths: Paths to check.
+
+    Returns:
+        The ignored paths, or None when git could not tell.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "check-ignore", "--stdin", "-z"],  # noqa: S607
+            input="\0".join(paths) + "\0",
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    # 1 means none of the paths is ignored, 128 is a fatal error, such as not
+    # being in a work tree.
+    if proc.returncode not in (0, 1):
+        return None
+    return set(filter(None, proc.stdout.split("\0")))
+
+
+def is_ignored(path: str) -> bool:
+    """Tell whether a path matches the ignore rules of its work tree.
+
+    Files tracked by git are not ignored, even when matched by a rule, which
+    this function does not know about.
+
+    Args:
+        path: Path to a file or directory.
+
+    Returns:
+        Whether the path or one of its parent directories is ignored.
+
+    Raises:
+        Unsupported: When the rules cannot be evaluated in-process.
+    """
+    if any(name in os.environ for name in UNSUPPORTED_ENVIRONMENT):
+        msg = "git environment variables are set"
+        raise Unsupported(msg)
+
+    path = os.path.abspath(path)  # noqa: PTH100
+    found = _find_work_tree(os.path.dirname(path))  # noqa: PTH120
+    if found is None:
+        return False
+    root, git_dir = found
+
+    parts = os.path.relpath(path, root).split(os.sep)  # noqa: PTH206
+    if parts[0] in (".", "..") or ".git" in parts:
+        return False
+
+    exclude = os.path.join(git_dir, "info", "exclude")  # noqa: PTH118
+    base_rules = [("", _global_rules(git_dir)), ("", _rules(exclude))]
+    for i in range(len(parts)):
+        directory = "/".join(parts[:i])
+        gitignore = os.path.join(root, *parts[:i], ".gitignore")  # noqa: PTH118
+        base_rules.append((directory, _rules(gitignore)))
+        relative = "/".join(parts[: i + 1])
+        is_dir = i < len(parts) - 1 or os.path.isdir(path)  # noqa: PTH112
+        if _match(base_rules, relative, is_dir):
+            return True
+    return False
+
+
+def _match(levels: list[tuple[str, list[Rule]]], path: str, is_dir: bool) -> bool:  # noqa: FBT001
+    """Return whether the last rule matching a path ignores it.
+
+    Args:
+        levels: Directory, relative to the work tree, and rules of every ignore
+            file, from lowest to highest precedence.
+        path: Path relative to the work tree.
+        is_dir: Whether the path is a directory.
+
+    Returns:
+        Whether the path is ignored.
+    """
+    for directory, rules in reversed(levels):
+        relative = path[len(directory) + 1 :] if directory else path
+        if directory and not path.startswith(f"{directory}/"):
+            continue
+        for rule in reversed(rules):
+            if rule.directory_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(relative):
+                return not rule.negated
+    return False
+
+
+def _find_work_tree(directory: str) -> tuple[str, str] | None:
+    """Return the root of the work tree containing a directory and its git directory.
+
+    Args:
+        directory: Absolute path to a directory.
+
+    Returns:
+        The work tree and git directory, or None outside of a work tree.
+
+    Raises:
+        Unsupported: For work trees whose git directory cannot be located.
+    """
+    while True:
+        dot_git = os.path.join(directory, ".git")  # noqa: PTH118
+        if os.path.isdir(dot_git):  # noqa: PTH112
+            return directory, dot_git
+        if os.path.isfile(dot_git):  # noqa: PTH113
+            # Linked work trees and submodules.
+            with open(dot_git, encoding="utf-8") as stream:  # noqa: PTH123
+                content = stream.read().strip()
+            if not content.startswith("gitdir: "):
+                msg = f"unexpected content in {dot_git}"
+                raise Unsupported(msg)
+            git_dir = os.path.join(directory, content[len("gitdir: ") :])  # noqa: PTH118
+            common = os.path.join(git_dir, "commondir")  # noqa: PTH118
+            if os.path.isfile(common):  # noqa: PTH113
+                with open(common, encoding="utf-8") as stream:  # noqa: PTH123
+                    git_dir = os.path.join(git_dir, stream.read().strip())  # noqa: PTH118
+            return directory, os.path.normpath(git_dir)
+        parent = os.path.dirname(directory)  # noqa: PTH120
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _global_rules(git_dir: str) -> list[Rule]:
+    """Return the rules of the global excludes file.
+
+    Args:
+        git_dir: The git directory, whose config may set ``core.excludesFile``.
+
+    Returns:
+        The compiled rules.
+    """
+    xdg_config = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")  # noqa: PTH111
+    excludes_file = os.path.join(xdg_config, "git", "ignore")  # noqa: PTH118
+    for config_file in (
+        "/etc/gitconfig",
+        os.path.join(xdg_config, "git", "config"),  # noqa: PTH118
+        os.path.expanduser("~/.gitconfig"),  # noqa: PTH111
+        os.path.join(git_dir, "config"),  # noqa: PTH118
+    ):
+        value = _config_excludes_file(config_file)
+        if value is not None:
+            excludes_file = os.path.expanduser(value)  # noqa: PTH111
+    return _rules(excludes_file)
+
+
+def _config_excludes_file(path: str) -> str | None:
+    """Read ``core.excludesFile`` from a git config file.
+
+    Args:
+        path: Path to the git config file.
+
+    Returns:
+        The configured value, if any.
+
+    Raises:
+        Unsupported: For configs including other files or making matching
+            case insensitive.
+    """
+    mtime = _mtime(path)
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    value = None
+    if mtime is not None:
+        section = ""
+        with open(path, encoding="utf-8") as stream:  # noqa: PTH123
+            for line in stream:
+                stripped = line.strip()
+                if stripped.startswith("["):
+                    section = stripped[1:].split("]")[0].strip().lower()
+                    if section.startswith("include"):
+                        msg = f"{path} includes other config files"
+                        raise Unsupported(msg)
+                    continue
+                if section != "core" or "=" not in stripped:
+                    continue
+                key, _, raw = stripped.partition("=")
+                key = key.strip().lower()
+                raw = raw.strip().strip('"')
+                if key == "excludesfile":
+                    value = raw
+                elif key == "ignorecase" and raw.lower() in ("true", "yes", "on", "1"):
+                    msg = f"{path} enables core.ignoreCase"
+                    raise Unsupported(msg)
+    _config_cache[path] = (mtime, value)
+    return value
+
+
+def _rules(path: str) -> list[Rule]:
+    """Return the compiled rules of an ignore file, compiling it when it changed.
+
+    Args:
+        path: Path to the ignore file.
+
+    Returns:
+        The rules, empty when the file does not exist.
+
+    Raises:
+        Unsupported: When a pattern cannot be compiled.
+    """
+    mtime = _mtime(path)
+    if mtime is None:
+        return []
+    cached = _compiled.get(path)
+    if cached is None or cached.mtime != mtime:
+        try:
+            with open(path, encoding="utf-8") as stream:  # noqa: PTH123
+                rules = [r for r in map(compile_pattern, stream.read().splitlines()) if r]
+        except (Unsupported, UnicodeDecodeError):
+            rules = None
+        cached = _Compiled(mtime, rules)
+        _compiled[path] = cached
+    if cached.rules is None:
+        msg = f"{path} uses unsupported patterns"
+        raise Unsupported(msg)
+    return cached.rules
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns  # noqa: PTH116
+    except OSError:
+        return None
+
+
+def compile_pattern(line: str) -> Rule | None:
+    """Compile a line of an ignore file.
+
+    Args:
+        line: The line, without its line terminator.
+
+    Returns:
+        The rule, or None for blank lines and comments.
+
+    Raises:
+        Unsupported: For character classes such as ``[[:space:]]``.
+    """
+    # Trailing spaces are ignored unless escaped.
+    pattern = re.sub(r"(?<!\\) +$", "", line)
+    if not pattern or pattern.startswith("#"):
+        return None
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    # Patterns without a slash match at any level.
+    pattern = pattern.lstrip("/") if "/" in pattern else f"**/{pattern}"
+    return Rule(re.compile(_translate(pattern)), negated, directory_only)
+
+
+def _translate(pattern: str) -> str:
+    """Translate a wildmatch pattern into a regular expression.
+
+    Args:
+        pattern: Pattern matched against paths relative to the ignore file.
+
+    Returns:
+        The regular expression.
+
+    Raises:
+        Unsupported: For character classes such as ``[[:space:]]``.
+    """
+    segments = pattern.split("/")
+    parts = []
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:.*/)?")
+            continue
+        parts.append(_translate_segment(segment) + ("" if last else "/"))
+    return "".join(parts)
+
+
+def _translate_segment(segment: str) -> str:
+    result = []
+    i = 0
+    while i < len(segment):
+        c = segment[i]
+        i += 1
+        if c == "\\" and i < len(segment):
+            result.append(re.escape(segment[i]))
+            i += 1
+        elif c == "*":
+            while i < len(segment) and segment[i] == "*":
+                i += 1
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            translated, i = _translate_class(segment, i)
+            result.append(translated)
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+def _translate_class(segment: str, start: int) -> tuple[str, int]:
+    """Translate a bracket expression.
+
+    Args:
+        segment: Path segment of the pattern.
+        start: Index following the opening bracket.
+
+    Returns:
+        The regular expression and the index following the expression.
+
+    Raises:
+        Unsupported: For character classes such as ``[[:space:]]``.
+    """
+    end = start
+    if end < len(segment) and segment[end] in "!^":
+        end += 1
+    if end < len(segment) and segment[end] == "]":
+        end += 1
+    end = segment.find("]", end)
+    if end < 0:
+        return re.escape("["), start
+    body = segment[start:end]
+    if "[:" in body or "\\" in body:
+        msg = f"character class in {segment}"
+        raise Unsupported(msg)
+    if body[:1] in ("!", "^"):
+        body = "^" + body[1:]
+    return "(?!/)[{}]".format(body.replace("[", "\\[")), end + 1
@@ -0,0 +1,245 @@
+"""Incremental Runs Module."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from molecule import planner
+
+
+if TYPE_CHECKING:
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+SETUP_ACTIONS = ("create", "prepare")
+# Actions creating or tearing down instances, which do not run the role.
+LIFECYCLE_ACTIONS = frozenset(("create", "prepare", "destroy"))
+# Config sections the lifecycle actions depend on.
+LIFECYCLE_SECTIONS = ("driver", "platforms", "provisioner")
+# Files the dependency action installs from, besides those set in its options.
+DEPENDENCY_FILES = ("requirements.yml", "collections.yml")
+# Actions running a playbook other than their own.
+PLAYBOOKS = {"idempotence": "converge", "syntax": "converge"}
+ROLE_DIRECTORIES = (
+    "defaults",
+    "files",
+    "handlers",
+    "library",
+    "meta",
+    "module_utils",
+    "plugins",
+    "roles",
+    "tasks",
+    "templates",
+    "vars",
+)
+
+
+class ConvergeScope(NamedTuple):
+    """The part of the role a converge needs to apply."""
+
+    fingerprints: dict[str, str]
+    args: dict[str, str] | None
+
+
+def compute(config: Config, action: str, exclude: tuple[Path, ...] = ()) -> str:
+    """Compute the fingerprint of the inputs of an action.
+
+    Args:
+        config: An instance of a Molecule config.
+        action: Name of the action.
+        exclude: Files and directories left out of the fingerprint.
+
+    Returns:
+        A hex digest changing whenever any of the inputs changes.
+    """
+    h = hashlib.sha256(f"{action}\0".encode())
+    playbook = getattr(config.provisioner.playbooks, PLAYBOOKS.get(action, action), None)
+    if playbook and os.path.isfile(playbook):  # noqa: PTH113
+        h.update(Path(playbook).read_bytes())
+    h.update(b"\0")
+
+    sections = (
+        {key: config.config.get(key) for key in LIFECYCLE_SECTIONS}
+        if action in LIFECYCLE_ACTIONS
+        else config.config
+    )
+    h.update(json.dumps(sections, sort_keys=True, default=str).encode())
+    for name, value in sorted(os.environ.items()):
+        if name.startswith("ANSIBLE_"):
+            h.update(f"\0{name}={value}".encode())
+    h.update(b"\0")
+
+    if action == "dependency":
+        _update_dependency_files(h, config)
+    elif action not in LIFECYCLE_ACTIONS:
+        links = config.config["provisioner"]["inventory"].get("links") or {}
+        paths = [
+            Path(config.scenario.directory),
+            *(Path(config.project_directory, name) for name in ROLE_DIRECTORIES),
+            *(Path(config.provisioner.abs_path(link)) for link in links.values()),
+        ]
+        for path in paths:
+            _update_tree(h, path, exclude)
+    return h.hexdigest()
+
+
+def _update_dependency_files(h: hashlib._Hash, config: Config) -> None:
+    options = config.config["dependency"].get("options", {})
+    names = [*DEPENDENCY_FILES, options.get("role-file"), options.get("requirements-file")]
+    for directory in (config.scenario.directory, config.project_directory):
+        for name in filter(None, names):
+            path = Path(directory, name)
+            if path.is_file():
+                h.update(f"{path}\0".encode())
+                h.update(path.read_bytes())
+
+
+def _update_tree(h: hashlib._Hash, top: Path, exclude: tuple[Path, ...] = ()) -> None:
+    paths = [top] if top.is_file() else []
+    for root, dirs, files in os.walk(top):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        paths.extend(Path(root, name) for name in sorted(files))
+    for path in paths:
+        if any(path == e or e in path.parents for e in exclude):
+            continue
+        h.update(f"{path.relative_to(top.parent)}\0".encode())
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            continue
+
+
+def record(config: Config, action: str, fingerprint: str) -> None:
+    """Record the fingerprint of an action once it completed.
+
+    Args:
+        config: An instance of a Molecule config.
+        action: Name of the action.
+        fingerprint: Fingerprint of its inputs, computed before it ran.
+    """
+    fingerprints = dict(config.state.fingerprints or {})
+    fingerprints[action] = fingerprint
+    config.state.change_state("fingerprints", fingerprints)
+
+
+def forget(config: Config, action: str) -> None:
+    """Forget the fingerprints of an action, once the instances changed otherwise.
+
+    Args:
+        config: An instance of a Molecule config.
+        action: Name of the action, whose scoped fingerprints are forgotten too.
+    """
+    fingerprints = config.state.fingerprints or {}
+    kept = {
+        name: fingerprint
+        for name, fingerprint in fingerprints.items()
+        if name != action and not name.startswith(f"{action}/")
+    }
+    if kept != fingerprints:
+        config.state.change_state("fingerprints", kept)
+
+
+def skipped(config: Config, sequence: list[str]) -> set[int]:
+    """Return the steps of a sequence an incremental run skips.
+
+    Args:
+        config: An instance of a Molecule config.
+        sequence: Actions of the sequence.
+
+    Returns:
+        Positions in the sequence of the actions to skip.
+    """
+    state = config.state
+    recorded = state.fingerprints or {}
+    computed: dict[str, str] = {}
+
+    def unchanged(action: str) -> bool:
+        if action not in computed:
+            computed[action] = compute(config, action)
+        return recorded.get(action) == computed[action]
+
+    skip: set[int] = set()
+    if (
+        state.created
+        and "create" in sequence
+        and all(unchanged(action) for action in SETUP_ACTIONS if action in sequence)
+    ):
+        create_at = sequence.index("create")
+        skip.update(
+            step
+            for step, action in enumerate(sequence)
+            if action in SETUP_ACTIONS or (step < create_at and action in ("cleanup", "destroy"))
+        )
+
+    failed_step = state.failed_step
+    if failed_step is not None and failed_step < len(sequence):
+        reusing = bool(state.created)
+        for step, action in enumerate(sequence[:failed_step]):
+            if action in planner.LOCAL_ACTIONS:
+                if unchanged(action):
+                    skip.add(step)
+            elif reusing and (step in skip or unchanged(action)):
+                skip.add(step)
+            else:
+                # Later steps build on what this one changes on the instances.
+                reusing = False
+                skip.discard(step)
+    return skip
+
+
+def converge_scope(config: Config) -> ConvergeScope:
+    """Return what a converge skipping unchanged inputs needs to apply.
+
+    Each of the ``provisioner.converge_scopes`` maps a file or directory of
+    the project to the tags or hosts converging it.  When only scoped paths
+    changed since the last converge, the converge is restricted to their
+    tags and hosts.
+
+    Args:
+        config: An instance of a Molecule config.
+
+    Returns:
+        The fingerprints to record once converged, along with ``None`` when
+        nothing changed, the ``ansible-playbook`` arguments restricting the
+        converge to what changed, or no arguments for a full converge.
+    """
+    scopes = config.config["provisioner"]["converge_scopes"]
+    paths = tuple(Path(config.project_directory, scope["path"]) for scope in scopes)
+    current = {"converge": compute(config, "converge")}
+    if scopes:
+        current["converge/"] = compute(config, "converge", exclude=paths)
+        for scope, path in zip(scopes, paths, strict=True):
+            h = hashlib.sha256()
+            _update_tree(h, path)
+            current[f"converge/{scope['path']}"] = h.hexdigest()
+
+    recorded = config.state.fingerprints or {}
+    if not config.state.converged:
+        return ConvergeScope(current, {})
+    if recorded.get("converge") == current["converge"]:
+        return ConvergeScope(current, None)
+    changed = [
+        scope
+        for scope in scopes
+        if recorded.get(f"converge/{scope['path']}") != current[f"converge/{scope['path']}"]
+    ]
+    if not changed or recorded.get("converge/") != current["converge/"]:
+        return ConvergeScope(current, {})
+
+    args = {}
+    # Every changed scope must be covered, so a restriction applies only
+    # when all of them declare it.
+    if all(scope.get("tags") for scope in changed):
+        args["tags"] = ",".join(dict.fromkeys(t for scope in changed for t in scope["tags"]))
+    if all(scope.get("limit") for scope in changed):
+        args["limit"] = ":".join(dict.fromkeys(scope["limit"] for scope in changed))
+    return ConvergeScope(current, args)
@@ -19,6 +19,13 @@
 import string
 
 from collections.abc import MutableMapping
+from typing import Any, NamedTuple
+
+import yaml
+
+
+STR_TAG = "tag:yaml.org,2002:str"
+_RESOLVER = yaml.resolver.Resolver()
 
 
 class InvalidInterpolation(Exception):  # noqa: N818
@@ -63,6 +70,11 @@ class Interpolator:
     If a literal dollar sign is needed in a configuration, use a double dollar
     sign (`$$`).
 
+    Variables are substituted in the strings of the parsed YAML document, so
+    a substituted value never changes the structure of the document and
+    variables in comments are ignored.  Unquoted values are typed after
+    substitution, ``port: ${PORT}`` yields an integer when ``PORT=22``.
+
     Molecule will substitute special ``MOLECULE_`` environment variables
     defined in `molecule.yml`.
 
@@ -127,3 +139,144 @@ class TemplateWithDefaults(string.Template):
             return None
 
         return self.pattern.sub(convert, self.template)
+
+
+def referenced_variables(text: str) -> set[str]:
+    """Return the names of the variables a string refers to.
+
+    Variables used as defaults, like ``DEFAULT`` in ``${VARIABLE:-$DEFAULT}``,
+    are included.
+
+    Args:
+        text: The string to inspect.
+
+    Returns:
+        The set of variable names.
+    """
+    names = set()
+    for mo in TemplateWithDefaults.pattern.finditer(text):
+        named = mo.group("named") or mo.group("braced")
+        if named is None:
+            continue
+        var, sep, default = named.partition("-")
+        names.add(var.rstrip(":") if sep else named)
+        if default.startswith("$"):
+            names.add(default[1:])
+    return names
+
+
+class _Template(NamedTuple):
+    node: yaml.ScalarNode
+    value: str
+    names: set[str]
+    implicit: bool
+
+
+class _ComposingLoader(yaml.SafeLoader):  # pylint: disable=too-many-ancestors
+    """Loader collecting the string scalars which contain placeholders."""
+
+    def __init__(self, stream: str) -> None:
+        super().__init__(stream)
+        self.templates: list[_Template] = []
+
+    def compose_scalar_node(self, anchor):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN202
+        event = self.peek_event()  # type: ignore[no-untyped-call]
+        node = super().compose_scalar_node(anchor)
+        if node.tag == STR_TAG and "$" in node.value:
+            self.templates.append(
+                _Template(
+                    node,
+                    node.value,
+                    referenced_variables(node.value),
+                    # Plain scalars without an explicit tag are resolved again
+                    # once substituted, so ``port: ${PORT}`` still yields an int.
+                    event.implicit[0],
+                ),
+            )
+        return node
+
+
+class Document:
+    """YAML document interpolated on its parsed tree.
+
+    The document is parsed once and only the string scalars containing
+    placeholders are substituted, leaving comments and the structure of the
+    document untouched.  Placeholders kept by a render with ``keep_string``
+    can be substituted later on without parsing the document again.
+    """
+
+    def __init__(self, stream: str) -> None:
+        """Parse a YAML document.
+
+        Args:
+            stream: The YAML document.
+        """
+        loader = _ComposingLoader(stream)
+        try:
+            self._root = loader.get_single_node()
+        finally:
+            loader.dispose()
+        self._templates = loader.templates
+        self._kept: list[_Template] | None = None
+
+    def render(self, interpolator: Interpolator, keep_string: str | None = None) -> Any:  # noqa: ANN401
+        """Substitute every placeholder and construct the document.
+
+        Args:
+            interpolator: Interpolator used to substitute the placeholders.
+            keep_string: Prefix of variables to leave uninterpolated.
+
+        Returns:
+            The constructed document.
+        """
+        for template in self._templates:
+            self._substitute(interpolator, template, keep_string)
+        self._kept = [
+            t
+            for t in self._templates
+            if keep_string and any(name.startswith(keep_string) for name in t.names)
+        ]
+        return self._construct()
+
+    def render_kept(self, interpolator: Interpolator) -> Any:  # noqa: ANN401
+        """Substitute the placeholders kept by the previous render.
+
+        Falls back to a full render when the document was never rendered with
+        a ``keep_string``.
+
+        Args:
+            interpolator: Interpolator used to substitute the placeholders.
+
+        Returns:
+            The constructed document.
+        """
+        if self._kept is None:
+            return self.render(interpolator)
+        for template in self._kept:
+            self._substitute(interpolator, template, None)
+        self._kept = []
+        return self._construct()
+
+    def _substitute(
+        self,
+        interpolator: Interpolator,
+        template: _Template,
+        keep_string: str | None,
+    ) -> None:
+        value = interpolator.interpolate(template.value, keep_string)
+        template.node.value = value
+        if template.implicit:
+            template.node.tag = _RESOLVER.resolve(  # type: ignore[no-untyped-call]
+                yaml.ScalarNode,
+                value,
+                (True, False),
+            )
+
+    def _construct(self) -> Any:  # noqa: ANN401
+        if self._root is None:
+            return {}
+        loader = yaml.SafeLoader("")
+        try:
+            return loader.construct_document(self._root) or {}
+        finally:
+            loader.dispose()
@@ -0,0 +1,64 @@
+"""Scenario Layout Module."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from molecule.config import Config
+
+
+class Layout(NamedTuple):
+    """Paths of a scenario, resolved for an action.
+
+    Attributes:
+        ephemeral_directory: Directory of the state and generated files of the scenario.
+        inventory_directory: Directory of the inventory Molecule generates.
+        inventory_file: Inventory of the instances of the scenario.
+        config_file: The ``molecule.yml`` Molecule generates, with the merged config.
+        ansible_config_file: The ``ansible.cfg`` Molecule generates.
+        instance_config: Instance config written by the driver.
+        state_file: State file of the scenario.
+        verifier_directory: Directory of the tests of the verifier.
+        playbooks: Playbooks by action, filled in as they are looked up.
+    """
+
+    ephemeral_directory: str
+    inventory_directory: str
+    inventory_file: str
+    config_file: str
+    ansible_config_file: str
+    instance_config: str
+    state_file: str
+    verifier_directory: str
+    playbooks: dict[str, str | None]
+
+
+def resolve(config: Config) -> Layout:
+    """Resolve the paths of the scenario of a config.
+
+    Args:
+        config: An instance of a Molecule config.
+
+    Returns:
+        The layout of the scenario.
+    """
+    ephemeral_directory = config.scenario.ephemeral_directory
+    inventory_directory = os.path.join(ephemeral_directory, "inventory")  # noqa: PTH118
+    return Layout(
+        ephemeral_directory=ephemeral_directory,
+        inventory_directory=inventory_directory,
+        inventory_file=os.path.join(inventory_directory, "ansible_inventory.yml"),  # noqa: PTH118
+        config_file=os.path.join(ephemeral_directory, "molecule.yml"),  # noqa: PTH118
+        ansible_config_file=os.path.join(ephemeral_directory, "ansible.cfg"),  # noqa: PTH118
+        instance_config=os.path.join(ephemeral_directory, "instance_config.yml"),  # noqa: PTH118
+        state_file=os.path.join(ephemeral_directory, "state.yml"),  # noqa: PTH118
+        verifier_directory=os.path.join(  # noqa: PTH118
+            config.scenario.directory,
+            config.config["verifier"].get("directory", "tests"),
+        ),
+        playbooks={},
+    )
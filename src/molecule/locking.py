@@ -0,0 +1,206 @@
+"""Ephemeral Directory Locking Module."""
+
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import signal
+import threading
+import time
+
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+
+LOG = logging.getLogger(__name__)
+LOCK_FILE = ".lock"
+MOLECULE_LOCK_TIMEOUT = float(os.environ.get("MOLECULE_LOCK_TIMEOUT", "300"))
+# Longest sleep between attempts when a thread other than the main one waits.
+POLL_INTERVAL = 0.5
+
+
+class LockStats(NamedTuple):
+    """Wait times of the locks a process acquired."""
+
+    acquired: int
+    contended: int
+    waited: float
+    longest: float
+
+
+class _Deadline(Exception):  # noqa: N818
+    """Raised by the alarm interrupting a blocking lock."""
+
+
+class DirectoryLock:
+    """Exclusive lock of a directory."""
+
+    def __init__(self, directory: str) -> None:
+        """Initialize a new, not yet acquired, lock.
+
+        Args:
+            directory: The directory to lock.
+        """
+        self.directory = directory
+        self._stream: IO[str] | None = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether the lock is held."""
+        return self._stream is not None
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Acquire the lock, waiting for other processes to release it.
+
+        Args:
+            timeout: Seconds to wait at most, or ``None`` to wait forever.
+
+        Returns:
+            The seconds spent waiting.
+
+        Raises:
+            TimeoutError: When the lock was not acquired in time.
+        """
+        start = time.monotonic()
+        stream = open(os.path.join(self.directory, LOCK_FILE), "w")  # noqa: PTH118, PTH123, SIM115
+        if not _try_lock(stream):
+            LOG.info("Waiting for the lock on %s", self.directory)
+            try:
+                _wait(stream, timeout)
+            except TimeoutError:
+                stream.close()
+                raise
+        self._stream = stream
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        """Release the lock, if held."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+def _wait(stream: IO[str], timeout: float | None) -> None:
+    if timeout is None:
+        fcntl.lockf(stream, fcntl.LOCK_EX)
+        return
+    if threading.current_thread() is threading.main_thread():
+        # Interrupt the blocking call at the deadline.
+        previous = signal.signal(signal.SIGALRM, _raise_deadline)
+        signal.setitimer(signal.ITIMER_REAL, max(timeout, 0.001))
+        try:
+            fcntl.lockf(stream, fcntl.LOCK_EX)
+        except _Deadline:
+            raise TimeoutError from None
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        return
+
+    # Signals only reach the main thread, other threads retry until the deadline.
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while not _try_lock(stream):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, POLL_INTERVAL)
+
+
+def _try_lock(stream: IO[str]) -> bool:
+    try:
+        fcntl.lockf(stream, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _raise_deadline(signum: int, frame: FrameType | None) -> None:  # noqa: ARG001
+    raise _Deadline
+
+
+class _Holders:
+    """A lock, and the number of scenarios of the process holding it."""
+
+    def __init__(self, directory: str) -> None:
+        self.lock = DirectoryLock(directory)
+        self.count = 0
+        self.guard = threading.Lock()
+
+
+class LockManager:
+    """Locks of the ephemeral directories of a process.
+
+    POSIX record locks belong to the process and are dropped as soon as any
+    descriptor of the locked file is closed, so the manager keeps one
+    descriptor per directory and counts the scenarios holding it.
+    """
+
+    def __init__(self, timeout: float | None = MOLECULE_LOCK_TIMEOUT) -> None:
+        """Initialize a new manager.
+
+        Args:
+            timeout: Seconds to wait for a lock at most, or ``None`` to wait forever.
+        """
+        self.timeout = timeout
+        self._holders: dict[str, _Holders] = {}
+        self._mutex = threading.Lock()
+        self._stats = LockStats(0, 0, 0.0, 0.0)
+
+    @property
+    def stats(self) -> LockStats:
+        """Wait times of the locks acquired so far."""
+        return self._stats
+
+    def acquire(self, directory: str) -> DirectoryLock:
+        """Lock a directory, unless already locked by this process.
+
+        Args:
+            directory: The directory to lock.
+
+        Returns:
+            The lock, to be given back to [release][molecule.locking.LockManager.release].
+        """
+        with self._mutex:
+            holders = self._holders.setdefault(directory, _Holders(directory))
+        # Only threads locking the same directory wait for each other.
+        with holders.guard:
+            if not holders.count:
+                self._record(directory, holders.lock.acquire(self.timeout))
+            holders.count += 1
+        return holders.lock
+
+    def release(self, lock: DirectoryLock) -> None:
+        """Release a lock once every holder of the process released it.
+
+        Args:
+            lock: A lock returned by [acquire][molecule.locking.LockManager.acquire].
+        """
+        with self._mutex:
+            holders = self._holders.get(lock.directory)
+        if holders is None or holders.lock is not lock:
+            return
+        with holders.guard:
+            holders.count = max(holders.count - 1, 0)
+            if not holders.count:
+                lock.release()
+
+    def _record(self, directory: str, waited: float) -> None:
+        contended = waited > 0.01  # noqa: PLR2004
+        if contended:
+            LOG.info("Waited %.2fs for the lock on %s", waited, directory)
+        with self._mutex:
+            self._stats = LockStats(
+                self._stats.acquired + 1,
+                self._stats.contended + contended,
+                self._stats.waited + waited,
+                max(self._stats.longest, waited),
+            )
+
+
+MANAGER = LockManager()
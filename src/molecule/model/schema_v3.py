@@ -19,25 +19,74 @@
 #  DEALINGS IN THE SOFTWARE.
 """Schema v3 Validation Module."""
 
+from __future__ import annotations
+
 import json
 import logging
 import os
 
-from jsonschema import validate as jsonschema_validate
-from jsonschema.exceptions import ValidationError
+from typing import TYPE_CHECKING, Any
+
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.validators import validator_for
 
 from molecule import api
 from molecule.data import __file__ as data_module
 
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from jsonschema.protocols import Validator
+
+
 LOG = logging.getLogger(__name__)
 
+# Compiled validators shared by the whole process, by schema file.
+_validators: dict[str, tuple[int, Validator]] = {}
+
+
+def get_validator(schema_file: str) -> Validator:
+    """Return the compiled validator of a schema file.
+
+    The schema is loaded and checked once, the validator is reused until the
+    modification time of the file changes.
+
+    Args:
+        schema_file: Path to a JSON schema.
+
+    Returns:
+        The validator.
+    """
+    mtime = os.stat(schema_file).st_mtime_ns  # noqa: PTH116
+    cached = _validators.get(schema_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(schema_file, encoding="utf-8") as f:  # noqa: PTH123
+        schema = json.load(f)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    _validators[schema_file] = (mtime, validator)
+    return validator
 
-def validate(c):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
-    """Perform schema validation."""
-    result = []
-    schemas = []
 
+def schemas() -> list[str]:
+    """Return the schemas configs may be validated against.
+
+    Returns:
+        The schema of Molecule, then the schemas of the installed drivers
+        providing one.
+    """
+    files = [os.path.dirname(data_module) + "/molecule.json"]  # noqa: PTH120
+    files.extend(filter(None, (driver.schema_file() for driver in api.drivers())))
+    return files
+
+
+def validate(c):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
+    """Perform schema validation, returning every error found."""
+    result: list[str] = []
     schema_files = [os.path.dirname(data_module) + "/molecule.json"]  # noqa: PTH120
     driver_name = c["driver"]["name"]
 
@@ -55,25 +104,42 @@ def validate(c):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
         schema_files.append(driver_schema_file)
 
     for schema_file in schema_files:
-        with open(schema_file, encoding="utf-8") as f:  # noqa: PTH123
-            schema = json.load(f)
-        schemas.append(schema)
-
-    try:
-        for schema in schemas:
-            jsonschema_validate(c, schema)
-    except ValidationError as exc:
-        # handle validation error for driver name
-        if exc.json_path == "$.driver.name" and exc.message.endswith(
-            (
-                "is not of type 'string'",
-                "is not valid under any of the given schemas",
-            ),
-        ):
-            wrong_driver_name = str(exc.message.split()[0])
-            driver_name_err_msg = exc.schema["messages"]["anyOf"]
-            result.append(f"{wrong_driver_name} {driver_name_err_msg}")
-        else:
-            result.append(exc.message)
+        by_path: dict[str, list[ValidationError]] = {}
+        for error in get_validator(schema_file).iter_errors(c):
+            by_path.setdefault(error.json_path, []).append(error)
+        # Report the most relevant error of every invalid location, picked the
+        # same way jsonschema.validate does.
+        result.extend(_error_message(best_match(errors)) for _, errors in sorted(by_path.items()))
 
     return result
+
+
+def validate_many(configs: Mapping[str, Any]) -> dict[str, list[str]]:
+    """Validate several configs in one pass.
+
+    Args:
+        configs: Configs to validate, by name, usually the ``molecule.yml`` path.
+
+    Returns:
+        All errors found, by name, for the configs which are invalid.
+    """
+    result = {}
+    for name, c in configs.items():
+        errors = validate(c)  # type: ignore[no-untyped-call]
+        if errors:
+            result[name] = errors
+    return result
+
+
+def _error_message(exc: ValidationError) -> str:
+    # handle validation error for driver name
+    if exc.json_path == "$.driver.name" and exc.message.endswith(
+        (
+            "is not of type 'string'",
+            "is not valid under any of the given schemas",
+        ),
+    ):
+        wrong_driver_name = str(exc.message.split()[0])
+        driver_name_err_msg = exc.schema["messages"]["anyOf"]  # type: ignore[index]
+        return f"{wrong_driver_name} {driver_name_err_msg}"
+    return exc.message
@@ -0,0 +1,80 @@
+"""Scenario Ordering Module."""
+
+from __future__ import annotations
+
+import logging
+import random
+
+from typing import TYPE_CHECKING, Protocol, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+LOG = logging.getLogger(__name__)
+
+ORDERS = ("directory", "lpt", "random")
+
+
+class _Orderable(Protocol):
+    """Scenario, or indexed scenario, being ordered."""
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def directory(self) -> str: ...
+
+
+T = TypeVar("T", bound=_Orderable)
+
+
+def estimates(names: list[str], durations: Mapping[str, float]) -> dict[str, float]:
+    """Estimate the durations of scenarios.
+
+    Args:
+        names: Names of the scenarios.
+        durations: Recorded durations of scenarios, by name.
+
+    Returns:
+        The recorded duration of every scenario, or the mean of the others
+        without any, or 1.0 when no scenario has one.
+    """
+    known = [durations[name] for name in names if name in durations]
+    default = sum(known) / len(known) if known else 1.0
+    return {name: durations.get(name, default) for name in names}
+
+
+def sort(
+    scenarios: list[T],
+    order: str,
+    durations: Mapping[str, float] | None = None,
+    seed: float | None = None,
+) -> list[T]:
+    """Sort scenarios in the order to start them in.
+
+    Args:
+        scenarios: The scenarios.
+        order: One of :data:`ORDERS`.
+        durations: Recorded durations of scenarios, by name, used by ``lpt``.
+        seed: Seed of the shuffle of ``random``, so that sorting the same
+            scenarios again gives the same order.
+
+    Returns:
+        The scenarios, sorted.
+
+    Raises:
+        ValueError: When the order is unknown.
+    """
+    by_directory = sorted(scenarios, key=lambda s: s.directory)
+    if order == "directory":
+        return by_directory
+    if order == "lpt":
+        weights = estimates([s.name for s in by_directory], durations or {})
+        return sorted(by_directory, key=lambda s: -weights[s.name])
+    if order == "random":
+        random.Random(seed).shuffle(by_directory)  # noqa: S311
+        return by_directory
+    msg = f"Order '{order}' is not one of {', '.join(ORDERS)}."
+    raise ValueError(msg)
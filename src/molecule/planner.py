@@ -0,0 +1,171 @@
+"""Execution Planner Module."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+LOG = logging.getLogger(__name__)
+
+NETWORK_ACTIONS = frozenset(("dependency",))
+# Actions not touching instances, any other action is assumed to.
+LOCAL_ACTIONS = frozenset(("dependency", "syntax"))
+
+
+class Node(NamedTuple):
+    """An action of a scenario in the execution plan."""
+
+    position: int
+    scenario_name: str
+    action: str
+    resources: tuple[str, ...]
+    needs: tuple[int, ...]
+    stage: int
+
+    def __str__(self) -> str:
+        """Return the node as ``scenario:action``."""
+        return f"{self.scenario_name}:{self.action}"
+
+
+class Outcome(NamedTuple):
+    """Outcome of an executed plan."""
+
+    failures: list[tuple[Node, SystemExit]]
+    interrupted: list[str]
+
+
+def resources(scenario_name: str, action: str, parallel: bool) -> tuple[str, ...]:  # noqa: FBT001
+    """Return the resources an action needs.
+
+    Args:
+        scenario_name: Name of the scenario.
+        action: Action of the scenario's sequence.
+        parallel: Whether instance names are unique to the scenario.
+
+    Returns:
+        The resources, ephemeral directory first.
+    """
+    needed = [f"ephemeral:{scenario_name}"]
+    if action in NETWORK_ACTIONS:
+        needed.append("network")
+    if action not in LOCAL_ACTIONS:
+        needed.append(f"instances:{scenario_name}" if parallel else "instances")
+    return tuple(needed)
+
+
+def build(sequences: dict[str, list[str]], parallel: bool) -> list[Node]:  # noqa: FBT001
+    """Compile the sequences of scenarios into an execution plan.
+
+    Args:
+        sequences: Sequence of every scenario, in the order to run them in.
+        parallel: Whether scenarios run in parallel mode.
+
+    Returns:
+        The nodes of the plan, in scenario then sequence order.
+    """
+    nodes: list[Node] = []
+    last_user: dict[str, int] = {}
+    for scenario_name, sequence in sequences.items():
+        local = [action for action in sequence if action in LOCAL_ACTIONS]
+        for action in local + [action for action in sequence if action not in LOCAL_ACTIONS]:
+            needed = resources(scenario_name, action, parallel)
+            needs = tuple(sorted({last_user[r] for r in needed if r in last_user}))
+            stage = max((nodes[i].stage + 1 for i in needs), default=0)
+            node = Node(len(nodes), scenario_name, action, needed, needs, stage)
+            nodes.append(node)
+            for r in needed:
+                last_user[r] = node.position
+    return nodes
+
+
+def execute(
+    nodes: list[Node],
+    run: Callable[[Node], None],
+    workers: int,
+    finish: Callable[[str], None],
+) -> Outcome:
+    """Execute a plan, running every node as soon as its needs are done.
+
+    Once a node fails, no other node is started.  Running nodes are waited
+    for, and the scenarios which started but did not finish are reported as
+    interrupted.
+
+    Args:
+        nodes: Nodes of the plan.
+        run: Function executing a node, exiting when it fails.
+        workers: Maximum number of nodes to run at once.
+        finish: Function called once every node of a scenario is done.
+
+    Returns:
+        The outcome of the plan.
+    """
+    schedule = _Schedule(nodes)
+    started: list[str] = []
+    failures: list[tuple[Node, SystemExit]] = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        running: dict[Future[None], Node] = {}
+        while (not failures and schedule.ready) or running:
+            while not failures and schedule.ready:
+                node = nodes[schedule.ready.pop(0)]
+                if node.scenario_name not in started:
+                    started.append(node.scenario_name)
+                LOG.debug("Starting %s", node)
+                # The context carries over, such as the recording of results.
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, run, node)] = node
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f].position):
+                node = running.pop(future)
+                error = future.exception()
+                if isinstance(error, SystemExit):
+                    failures.append((node, error))
+                elif error:
+                    raise error
+                elif schedule.complete(node):
+                    finish(node.scenario_name)
+
+    return Outcome(failures, [name for name in started if schedule.remaining[name]])
+
+
+class _Schedule:
+    """Nodes of a plan whose needs are done."""
+
+    def __init__(self, nodes: list[Node]) -> None:
+        """Initialize a new schedule.
+
+        Args:
+            nodes: Nodes of the plan.
+        """
+        self.ready = [node.position for node in nodes if not node.needs]
+        self.remaining: dict[str, int] = {}
+        self._waiting = {node.position: len(node.needs) for node in nodes}
+        self._dependents: dict[int, list[int]] = {node.position: [] for node in nodes}
+        for node in nodes:
+            self.remaining[node.scenario_name] = self.remaining.get(node.scenario_name, 0) + 1
+            for i in node.needs:
+                self._dependents[i].append(node.position)
+
+    def complete(self, node: Node) -> bool:
+        """Mark a node done, readying the nodes which waited for it.
+
+        Args:
+            node: The node done.
+
+        Returns:
+            Whether every node of its scenario is done.
+        """
+        for i in self._dependents[node.position]:
+            self._waiting[i] -= 1
+            if not self._waiting[i]:
+                self.ready.append(i)
+        self.ready.sort()
+        self.remaining[node.scenario_name] -= 1
+        return not self.remaining[node.scenario_name]
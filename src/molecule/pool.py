@@ -0,0 +1,312 @@
+"""Instance Pool Module."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import molecule.command.base
+
+from molecule import util
+from molecule.config import Config
+from molecule.scenario import ephemeral_directory
+
+
+LOG = logging.getLogger(__name__)
+LEASE_FILE = "pool_lease.json"
+
+
+class Entry(NamedTuple):
+    """A set of instances kept by a pool."""
+
+    run_uuid: str
+    molecule_file: str
+    created: float
+    prepared: bool
+
+
+def _running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process runs as another user.
+        return True
+    return True
+
+
+def enabled(config: Config) -> bool:
+    """Return whether a scenario leases its instances from a pool.
+
+    Args:
+        config: An instance of a Molecule config.
+
+    Returns:
+        Whether the driver of the scenario configures a pool.
+    """
+    return bool(
+        config.driver.name in ("default", "delegated")
+        and config.driver.managed
+        and config.driver.options.get("pool")
+        and not config.is_parallel,
+    )
+
+
+class Pool:
+    """Pool of instances of a scenario."""
+
+    def __init__(self, config: Config) -> None:
+        """Initialize a new pool.
+
+        Args:
+            config: An instance of a Molecule config, configuring a pool.
+        """
+        options = config.driver.options["pool"]
+        self.size: int = options.get("size", 1)
+        self.ttl: int = options.get("ttl", 0)
+        self._config = config
+        self.directory = Path(ephemeral_directory(os.path.join("molecule_pool", self.key())))  # noqa: PTH118
+
+    def key(self) -> str:
+        """Return the hash of the platforms and playbooks of the pool.
+
+        Returns:
+            The hash, as hexadecimal digits.
+        """
+        playbooks = self._config.provisioner.playbooks
+        digest = hashlib.sha256(
+            json.dumps(
+                [self._config.driver.name, self._config.config["platforms"]],
+                sort_keys=True,
+            ).encode(),
+        )
+        for playbook in (playbooks.create, playbooks.prepare, playbooks.destroy):
+            if playbook and os.path.isfile(playbook):  # noqa: PTH113
+                digest.update(Path(playbook).read_bytes())
+        return digest.hexdigest()[:16]
+
+    def entries(self) -> list[Entry]:
+        """Return the sets of instances available, oldest first.
+
+        Returns:
+            The entries not leased.
+        """
+        entries = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError, ValueError):
+                entries.append(Entry(**json.loads(path.read_text())))
+        return sorted(entries, key=lambda entry: entry.created)
+
+    def fill(self) -> int:
+        """Create sets of instances until the pool is full.
+
+        Returns:
+            The number of sets created.
+        """
+        self.prune()
+        missing = max(self.size - len(self.entries()), 0)
+        for _ in range(missing):
+            self._add(self._create())
+        return missing
+
+    def drain(self) -> int:
+        """Destroy every set of instances available.
+
+        Returns:
+            The number of sets destroyed.
+        """
+        return sum(self._destroy_available(entry) for entry in self.entries())
+
+    def prune(self) -> int:
+        """Destroy the sets of instances which expired or whose lease was lost.
+
+        Returns:
+            The number of sets destroyed.
+        """
+        return self.reclaim() + sum(
+            self._destroy_available(entry) for entry in self.entries() if self._expired(entry)
+        )
+
+    def reclaim(self) -> int:
+        """Destroy the leased sets of instances whose lease was lost.
+
+        A lease is lost once the process which took it is gone and the
+        scenario it was leased to no longer records it, as when a run
+        crashed before its ephemeral directory was removed.
+
+        Returns:
+            The number of sets destroyed.
+        """
+        reclaimed = 0
+        for path in self.directory.glob("*.leased"):
+            with contextlib.suppress(OSError, ValueError):
+                run_uuid, pid, _ = path.name.split(".")
+                if _running(int(pid)) or self._holds(json.loads(path.read_text())):
+                    continue
+                # Renaming is atomic, so a single process reclaims the set.
+                path.rename(self._leased(run_uuid))
+                entry = self._entry(json.loads(self._leased(run_uuid).read_text()))
+                self._destroy(entry)
+                self._leased(run_uuid).unlink()
+                reclaimed += 1
+        return reclaimed
+
+    def acquire(self) -> bool:
+        """Lease a set of instances to the scenario.
+
+        Returns:
+            Whether a set was available.
+        """
+        self.prune()
+        for entry in self.entries():
+            if self._claim(entry):
+                break
+        else:
+            return False
+
+        self._leased(entry.run_uuid).write_text(
+            json.dumps({**entry._asdict(), "lease_file": self._lease_file}),
+        )
+        LOG.info("Leasing instances %s from pool %s", entry.run_uuid, self.directory.name)
+        suffix = f"-{entry.run_uuid}"
+        instance_config = util.safe_load_file(self._entry_config(entry).driver.instance_config)
+        # Hosts keep the names of the platforms, and connect to the pooled
+        # instances by their address or, lacking one, by their own names.
+        util.write_file(
+            self._config.driver.instance_config,
+            util.safe_dump(
+                [
+                    {
+                        **instance,
+                        "instance": instance["instance"].removesuffix(suffix),
+                        "address": instance.get("address") or instance["instance"],
+                    }
+                    for instance in instance_config or []
+                ],
+            ),
+        )
+        Path(self._lease_file).write_text(json.dumps(entry._asdict()))
+        state = self._config.state
+        state.change_state("driver", self._config.driver.name)
+        state.change_state("prepared", entry.prepared)
+        state.change_state("created", True)  # noqa: FBT003
+        return True
+
+    def release(self) -> bool:
+        """Return the set of instances leased to the scenario.
+
+        The set goes back to the pool if the scenario did not converge it,
+        did not expire and the pool is not full, and is destroyed otherwise.
+
+        Returns:
+            Whether the scenario had leased a set.
+        """
+        if not os.path.isfile(self._lease_file):  # noqa: PTH113
+            return False
+
+        entry = self._entry(json.loads(Path(self._lease_file).read_text()))
+        if (
+            not self._config.state.converged
+            and not self._expired(entry)
+            and len(self.entries()) < self.size
+        ):
+            LOG.info("Returning instances %s to pool %s", entry.run_uuid, self.directory.name)
+            self._add(entry)
+        else:
+            self._destroy(entry)
+        # The scenario may be destroyed by another process than the one which
+        # leased the set.
+        for leased in self.directory.glob(f"{entry.run_uuid}.*.leased"):
+            leased.unlink(missing_ok=True)
+        Path(self._config.driver.instance_config).unlink(missing_ok=True)
+        os.remove(self._lease_file)  # noqa: PTH107
+        return True
+
+    @property
+    def _lease_file(self) -> str:
+        return os.path.join(self._config.layout.ephemeral_directory, LEASE_FILE)  # noqa: PTH118
+
+    def _path(self, run_uuid: str, suffix: str) -> Path:
+        return self.directory / f"{run_uuid}{suffix}"
+
+    def _leased(self, run_uuid: str) -> Path:
+        # Leased sets are named after the process leasing them, for the sets
+        # of crashed processes to be found.
+        return self._path(run_uuid, f".{os.getpid()}.leased")
+
+    def _entry(self, data: dict[str, Any]) -> Entry:
+        return Entry(**{field: data[field] for field in Entry._fields})
+
+    def _add(self, entry: Entry) -> None:
+        partial = self._path(entry.run_uuid, ".json.tmp")
+        partial.write_text(json.dumps(entry._asdict()))
+        partial.replace(self._path(entry.run_uuid, ".json"))
+
+    def _holds(self, lease: dict[str, Any]) -> bool:
+        # Whether the scenario a set was leased to still records the lease.
+        try:
+            held = json.loads(Path(lease["lease_file"]).read_text())
+        except (KeyError, OSError, ValueError):
+            return False
+        return bool(held.get("run_uuid") == lease["run_uuid"])
+
+    def _expired(self, entry: Entry) -> bool:
+        return bool(self.ttl) and time.time() - entry.created > self.ttl
+
+    def _claim(self, entry: Entry) -> bool:
+        # Renaming is atomic, so a single process claims the entry.
+        try:
+            os.rename(self._path(entry.run_uuid, ".json"), self._leased(entry.run_uuid))  # noqa: PTH104
+        except OSError:
+            return False
+        return True
+
+    def _entry_config(self, entry: Entry) -> Config:
+        c = Config(
+            molecule_file=entry.molecule_file,
+            args=self._config.args,
+            command_args={"subcommand": "pool", "parallel": True, "run_uuid": entry.run_uuid},
+            ansible_args=self._config.ansible_args,
+        )
+        # Platforms get their unique names once loaded, which create needs first.
+        c.platforms  # noqa: B018
+        return c
+
+    def _create(self) -> Entry:
+        entry = Entry(
+            run_uuid=str(uuid.uuid4()),
+            molecule_file=self._config.molecule_file,
+            created=time.time(),
+            prepared=False,
+        )
+        LOG.info("Creating instances %s for pool %s", entry.run_uuid, self.directory.name)
+        c = self._entry_config(entry)
+        try:
+            molecule.command.base.execute_subcommand(c, "create")
+            molecule.command.base.execute_subcommand(c, "prepare")
+        except SystemExit:
+            self._destroy(entry)
+            raise
+        return entry._replace(prepared=bool(c.state.prepared))
+
+    def _destroy_available(self, entry: Entry) -> bool:
+        if not self._claim(entry):
+            return False
+        self._destroy(entry)
+        self._leased(entry.run_uuid).unlink()
+        return True
+
+    def _destroy(self, entry: Entry) -> None:
+        LOG.info("Destroying instances %s of pool %s", entry.run_uuid, self.directory.name)
+        c = self._entry_config(entry)
+        molecule.command.base.execute_subcommand(c, "destroy")
+        c.scenario._remove_scenario_state_directory()  # noqa: SLF001
@@ -33,7 +33,7 @@ from ansible_compat.ports import cached_property
 
 from molecule import util
 from molecule.api import drivers
-from molecule.provisioner import ansible_playbook, ansible_playbooks, base
+from molecule.provisioner import ansible_playbook, ansible_playbooks, base, fanout
 
 
 LOG = logging.getLogger(__name__)
@@ -463,7 +463,7 @@ class Ansible(base.Base):
         collections_path_list = [
             util.abs_path(
                 os.path.join(  # noqa: PTH118
-                    self._config.scenario.ephemeral_directory,
+                    self._config.layout.ephemeral_directory,
                     "collections",
                 ),
             ),
@@ -499,7 +499,7 @@ class Ansible(base.Base):
 
         roles_path_list = [
             util.abs_path(
-                os.path.join(self._config.scenario.ephemeral_directory, "roles"),  # noqa: PTH118
+                os.path.join(self._config.layout.ephemeral_directory, "roles"),  # noqa: PTH118
             ),
             util.abs_path(
                 os.path.join(self._config.project_directory, os.path.pardir),  # noqa: PTH118
@@ -516,7 +516,7 @@ class Ansible(base.Base):
                 list(map(util.abs_path, os.environ["ANSIBLE_ROLES_PATH"].split(":"))),
             )
 
-        env = util.merge_dicts(
+        return util.overlay_env(
             os.environ,
             {
                 "ANSIBLE_CONFIG": self._config.provisioner.config_file,
@@ -527,10 +527,8 @@ class Ansible(base.Base):
                     self._get_filter_plugins_directories(),
                 ),
             },
+            self._config.env,
         )
-        env = util.merge_dicts(env, self._config.env)
-
-        return env  # noqa: RET504
 
     @property
     def name(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -585,7 +583,7 @@ class Ansible(base.Base):
         env["ANSIBLE_LIBRARY"] = library_path
         env["ANSIBLE_FILTER_PLUGINS"] = filter_plugins_path
 
-        return util.merge_dicts(default_env, env)
+        return util.overlay_env(default_env, env)
 
     @property
     def hosts(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -658,18 +656,15 @@ class Ansible(base.Base):
 
     @property
     def inventory_directory(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return self._config.scenario.inventory_directory
+        return self._config.layout.inventory_directory
 
     @property
     def inventory_file(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(self.inventory_directory, "ansible_inventory.yml")  # noqa: PTH118
+        return self._config.layout.inventory_file
 
     @property
     def config_file(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(  # noqa: PTH118
-            self._config.scenario.ephemeral_directory,
-            "ansible.cfg",
-        )
+        return self._config.layout.ansible_config_file
 
     @cached_property
     def playbooks(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -705,22 +700,27 @@ class Ansible(base.Base):
         pb.add_cli_arg("check", True)  # noqa: FBT003
         pb.execute()
 
-    def converge(self, playbook=None, **kwargs):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN003, ANN201
+    def converge(self, playbook=None, cli_args=None, **kwargs):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN003, ANN201
         """Execute ``ansible-playbook`` against the converge playbook. unless specified otherwise.
 
         Args:
             playbook: An optional string containing an absolute path to a playbook.
+            cli_args: An optional dict of arguments added to the command.
             kwargs: An optional keyword arguments.
 
         Returns:
             str: The output from the ``ansible-playbook`` command.
         """
         pb = self._get_ansible_playbook(playbook or self.playbooks.converge, **kwargs)  # type: ignore[no-untyped-call]
+        for name, value in (cli_args or {}).items():
+            pb.add_cli_arg(name, value)
 
         return pb.execute()
 
     def destroy(self):  # type: ignore[no-untyped-def]  # noqa: ANN201
         """Execute ``ansible-playbook`` against the destroy playbook and returns None."""
+        if fanout.fan_out(self._config, self.playbooks.destroy):
+            return
         pb = self._get_ansible_playbook(self.playbooks.destroy)  # type: ignore[no-untyped-call]
         pb.execute()
 
@@ -738,6 +738,8 @@ class Ansible(base.Base):
 
     def create(self):  # type: ignore[no-untyped-def]  # noqa: ANN201
         """Execute ``ansible-playbook`` against the create playbook and returns None."""
+        if fanout.fan_out(self._config, self.playbooks.create):
+            return
         pb = self._get_ansible_playbook(self.playbooks.create)  # type: ignore[no-untyped-call]
         pb.execute()
 
@@ -928,7 +930,7 @@ class Ansible(base.Base):
             [
                 util.abs_path(
                     os.path.join(  # noqa: PTH118
-                        self._config.scenario.ephemeral_directory,
+                        self._config.layout.ephemeral_directory,
                         "library",
                     ),
                 ),
@@ -965,7 +967,7 @@ class Ansible(base.Base):
                 self._get_filter_plugin_directory(),  # type: ignore[no-untyped-call]
                 util.abs_path(
                     os.path.join(  # noqa: PTH118
-                        self._config.scenario.ephemeral_directory,
+                        self._config.layout.ephemeral_directory,
                         "plugins",
                         "filter",
                     ),
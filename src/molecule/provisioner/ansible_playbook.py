@@ -23,7 +23,7 @@ import logging
 import shlex
 import warnings
 
-from molecule import util
+from molecule import results, util
 from molecule.api import MoleculeRuntimeWarning
 
 
@@ -47,7 +47,7 @@ class AnsiblePlaybook:
         self._config = config
         self._cli = {}  # type: ignore[var-annotated]
         if verify:
-            self._env = util.merge_dicts(
+            self._env = util.overlay_env(
                 self._config.verifier.env,
                 self._config.config["verifier"]["env"],
             )
@@ -114,6 +114,7 @@ class AnsiblePlaybook:
                 debug=self._config.debug,
                 cwd=cwd,
             )
+        results.add_output(result.stdout)
 
         if result.returncode != 0:
             from rich.markup import escape
@@ -77,8 +77,14 @@ class AnsiblePlaybooks:
         """Return path to playbook or None if playbook is not needed.
 
         Return None when there is no playbook configured and when action is
-        considered skippable.
+        considered skippable.  Playbooks are looked up once per action.
         """
+        playbooks = self._config.layout.playbooks
+        if section not in playbooks:
+            playbooks[section] = self._find_playbook(section)  # type: ignore[no-untyped-call]
+        return playbooks[section]
+
+    def _find_playbook(self, section):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN202
         c = self._config.config
         driver_dict = c["provisioner"]["playbooks"].get(self._config.driver.name)
 
@@ -94,8 +100,9 @@ class AnsiblePlaybooks:
 
             if os.path.exists(playbook):  # noqa: PTH110
                 return playbook
-            if os.path.exists(self._get_bundled_driver_playbook(section)):  # type: ignore[no-untyped-call]  # noqa: PTH110
-                return self._get_bundled_driver_playbook(section)  # type: ignore[no-untyped-call]
+            bundled_playbook = self._get_bundled_driver_playbook(section)  # type: ignore[no-untyped-call]
+            if os.path.exists(bundled_playbook):  # noqa: PTH110
+                return bundled_playbook
             if section not in [
                 # these playbooks can be considered optional
                 "prepare",
@@ -0,0 +1,184 @@
+"""Platform Fan-out Module."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+
+from molecule import util
+from molecule.provisioner import ansible_playbook
+
+
+if TYPE_CHECKING:
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+
+def group_size(config: Config) -> int:
+    """Return the number of platforms per create and destroy run.
+
+    Args:
+        config: An instance of a Molecule config.
+
+    Returns:
+        ``provisioner.platform_group_size``, 0 for a single run.
+    """
+    return config.config["provisioner"]["platform_group_size"]  # type: ignore[no-any-return]
+
+
+def fan_out(config: Config, playbook: str | None) -> bool:
+    """Run a playbook per group of platforms, when configured to.
+
+    Args:
+        config: An instance of a Molecule config.
+        playbook: Path to the create or destroy playbook.
+
+    Returns:
+        Whether the playbook was run.
+    """
+    size = group_size(config)
+    if not size or not playbook or len(config.platforms.instances) <= size:
+        return False
+    run(config, playbook, size)
+    return True
+
+
+def split(platforms: list[dict[str, Any]], size: int) -> list[list[dict[str, Any]]]:
+    """Split platforms into groups.
+
+    Args:
+        platforms: Platforms of the scenario.
+        size: Number of platforms per group.
+
+    Returns:
+        The groups, in platform order.
+    """
+    return [platforms[i : i + size] for i in range(0, len(platforms), size)]
+
+
+def run(config: Config, playbook: str, size: int) -> None:
+    """Run a playbook concurrently for every group of platforms.
+
+    Groups which succeeded are merged into the instance config even when
+    others failed, the latter then exit with the return code of the first
+    failed run.
+
+    Args:
+        config: An instance of a Molecule config.
+        playbook: Path to the create or destroy playbook.
+        size: Number of platforms per group.
+    """
+    groups = split(config.platforms.instances, size)
+    instance_config = InstanceConfig(
+        config.driver.instance_config,
+        [platform["name"] for platform in config.platforms.instances],
+    )
+    LOG.info("Running %s in %d platform groups", config.action, len(groups))
+    failures: list[tuple[list[str], SystemExit]] = []
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = {
+            executor.submit(_run_group, config, playbook, index, group, instance_config): [
+                platform["name"] for platform in group
+            ]
+            for index, group in enumerate(groups)
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            if isinstance(error, SystemExit):
+                failures.append((futures[future], error))
+            elif error:
+                raise error
+
+    if failures:
+        names = ", ".join(name for group, _ in failures for name in group)
+        code = failures[0][1].code
+        util.sysexit_with_message(
+            f"{config.action.capitalize()} failed for {names}",
+            code if isinstance(code, int) else 1,
+        )
+
+
+def _run_group(
+    config: Config,
+    playbook: str,
+    index: int,
+    group: list[dict[str, Any]],
+    instance_config: InstanceConfig,
+) -> None:
+    names = [platform["name"] for platform in group]
+    directory = os.path.join(config.layout.ephemeral_directory, "fanout", str(index))  # noqa: PTH118
+    os.makedirs(directory, exist_ok=True)  # noqa: PTH103
+    molecule_file = os.path.join(directory, "molecule.yml")  # noqa: PTH118
+    util.write_file(molecule_file, util.safe_dump({**config.config, "platforms": group}))
+    group_instance_config = os.path.join(directory, "instance_config.yml")  # noqa: PTH118
+    instance_config.extract(names, group_instance_config)
+
+    pb = ansible_playbook.AnsiblePlaybook(playbook, config)
+    pb.add_env_arg("MOLECULE_FILE", molecule_file)  # type: ignore[no-untyped-call]
+    pb.add_env_arg("MOLECULE_INSTANCE_CONFIG", group_instance_config)  # type: ignore[no-untyped-call]
+    pb.execute()  # type: ignore[no-untyped-call]
+
+    instance_config.merge(names, group_instance_config)
+
+
+class InstanceConfig:
+    """Instance config of a scenario, shared by concurrent playbook runs."""
+
+    def __init__(self, path: str, order: list[str]) -> None:
+        """Initialize a new instance config.
+
+        Args:
+            path: Path to the scenario's instance config.
+            order: Instance names, in the order to write their entries in.
+        """
+        self._path = path
+        self._order = {name: i for i, name in enumerate(order)}
+        self._lock = threading.Lock()
+
+    def extract(self, names: list[str], path: str) -> None:
+        """Write the entries of some instances to a file of their own.
+
+        The file is removed when the scenario has no instance config, as
+        playbooks tell whether instances exist by its presence.
+
+        Args:
+            names: Instance names.
+            path: Path to the file to write.
+        """
+        with self._lock:
+            if not os.path.isfile(self._path):  # noqa: PTH113
+                if os.path.exists(path):  # noqa: PTH110
+                    os.remove(path)  # noqa: PTH107
+                return
+            entries = [entry for entry in self._load(self._path) if entry["instance"] in names]
+            util.write_file(path, util.safe_dump(entries))
+
+    def merge(self, names: list[str], path: str) -> None:
+        """Replace the entries of some instances by the ones written to a file.
+
+        Args:
+            names: Instance names.
+            path: Path to the file written by the playbook.
+        """
+        with self._lock:
+            exists = os.path.isfile(self._path)  # noqa: PTH113
+            entries = self._load(path) if os.path.isfile(path) else []  # noqa: PTH113
+            if not exists and not entries:
+                return
+            if exists:
+                entries += [
+                    entry for entry in self._load(self._path) if entry["instance"] not in names
+                ]
+            entries.sort(key=lambda entry: self._order.get(entry["instance"], len(self._order)))
+            util.write_file(self._path, util.safe_dump(entries))
+
+    @staticmethod
+    def _load(path: str) -> list[dict[str, Any]]:
+        # Destroy playbooks write an empty mapping once instances are gone.
+        return util.safe_load_file(path) or []
@@ -0,0 +1,222 @@
+"""Run Results Module."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import re
+import threading
+import time
+
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+_RECAP = re.compile(r"^PLAY RECAP \**$")
+_RECAP_HOST = re.compile(r"^(?P<host>\S+)\s+:\s+(?P<stats>(?:\w+=\d+\s*)+)$")
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+_recorder: contextvars.ContextVar[Recorder | None] = contextvars.ContextVar(
+    "recorder",
+    default=None,
+)
+_stats: contextvars.ContextVar[dict[str, dict[str, int]] | None] = contextvars.ContextVar(
+    "stats",
+    default=None,
+)
+
+
+class ActionResult(NamedTuple):
+    """Outcome of an action of a scenario.
+
+    Attributes:
+        scenario: Name of the scenario.
+        action: Name of the action.
+        returncode: Exit code of the action, 0 when it succeeded.
+        duration: Time the action took, in seconds.
+        stats: Counts of the ``PLAY RECAP`` of the playbooks it ran, by host.
+        message: Message logged about its failure, if any.
+    """
+
+    scenario: str
+    action: str
+    returncode: int
+    duration: float
+    stats: dict[str, dict[str, int]]
+    message: str = ""
+
+
+class RunResult(NamedTuple):
+    """Outcome of a run.
+
+    Attributes:
+        actions: Results of the actions, in the order they ended.
+    """
+
+    actions: list[ActionResult]
+
+    @property
+    def failed(self) -> list[ActionResult]:
+        """Return the results of the actions which failed."""
+        return [action for action in self.actions if action.returncode]
+
+    @property
+    def returncode(self) -> int:
+        """Return the exit code of the first action which failed, or 0."""
+        return next((action.returncode for action in self.failed), 0)
+
+    def scenario(self, name: str) -> list[ActionResult]:
+        """Return the results of the actions of a scenario.
+
+        Args:
+            name: Name of the scenario.
+
+        Returns:
+            The results of its actions, in the order they ended.
+        """
+        return [action for action in self.actions if action.scenario == name]
+
+
+class Recorder:
+    """Results of the actions of a run."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.actions: list[ActionResult] = []
+        self._lock = threading.Lock()
+
+    def add(self, result: ActionResult) -> None:
+        """Record the result of an action.
+
+        Args:
+            result: The result.
+        """
+        with self._lock:
+            self.actions.append(result)
+
+    def result(self) -> RunResult:
+        """Return the results recorded so far."""
+        with self._lock:
+            return RunResult(list(self.actions))
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[Recorder]:
+    """Record the actions executed in the context.
+
+    Yields:
+        The recorder receiving their results.
+    """
+    recorder = Recorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextlib.contextmanager
+def action(scenario: str, name: str) -> Iterator[None]:
+    """Record an action, when recording.
+
+    Args:
+        scenario: Name of the scenario.
+        name: Name of the action.
+
+    Yields:
+        Nothing, once the action can run.
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    stats: dict[str, dict[str, int]] = {}
+    token = _stats.set(stats)
+    start = time.monotonic()
+    try:
+        yield
+    except SystemExit as e:
+        recorder.add(
+            ActionResult(
+                scenario,
+                name,
+                exit_code(e),
+                time.monotonic() - start,
+                stats,
+                getattr(e, "message", ""),
+            ),
+        )
+        raise
+    else:
+        recorder.add(ActionResult(scenario, name, 0, time.monotonic() - start, stats))
+    finally:
+        _stats.reset(token)
+
+
+def add_output(output: object) -> None:
+    """Count the ``PLAY RECAP`` of the output of a playbook in the current action.
+
+    Args:
+        output: Standard output of ``ansible-playbook``.
+    """
+    stats = _stats.get()
+    if stats is None or not isinstance(output, str):
+        return
+    for host, counts in parse_recap(output).items():
+        totals = stats.setdefault(host, {})
+        for key, value in counts.items():
+            totals[key] = totals.get(key, 0) + value
+
+
+def extend(actions: Iterable[ActionResult]) -> None:
+    """Record the results of actions executed elsewhere, when recording.
+
+    Args:
+        actions: The results, such as the ones sent back by a worker process.
+    """
+    recorder = _recorder.get()
+    if recorder is not None:
+        for result in actions:
+            recorder.add(result)
+
+
+def parse_recap(output: str) -> dict[str, dict[str, int]]:
+    """Parse the ``PLAY RECAP`` of the output of ``ansible-playbook``.
+
+    Args:
+        output: Standard output of ``ansible-playbook``.
+
+    Returns:
+        Counts by host, such as ``{"instance": {"ok": 2, "changed": 1, ...}}``.
+    """
+    recap: dict[str, dict[str, int]] = {}
+    in_recap = False
+    for line in _ANSI_ESCAPE.sub("", output).splitlines():
+        line = line.strip()  # noqa: PLW2901
+        if _RECAP.match(line):
+            in_recap = True
+            continue
+        match = _RECAP_HOST.match(line) if in_recap else None
+        if match is None:
+            in_recap = in_recap and not line
+            continue
+        recap[match["host"]] = {
+            key: int(value) for key, value in (item.split("=") for item in match["stats"].split())
+        }
+    return recap
+
+
+def exit_code(e: SystemExit) -> int:
+    """Return the exit code of a failure exiting with an exception.
+
+    Args:
+        e: The exit.
+
+    Returns:
+        Its code, or 1 when it has no code telling of a failure.
+    """
+    return e.code if isinstance(e.code, int) and e.code else 1
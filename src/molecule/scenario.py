@@ -21,17 +21,16 @@
 from __future__ import annotations
 
 import errno
-import fcntl
 import fnmatch
 import logging
 import os
 import shutil
 
 from pathlib import Path
-from time import sleep
 
-from molecule import scenarios, util
+from molecule import locking, scenarios, util
 from molecule.constants import RC_TIMEOUT
+from molecule.exceptions import MoleculeExit
 
 
 LOG = logging.getLogger(__name__)
@@ -46,7 +45,8 @@ class Scenario:
         Args:
             config: An instance of a Molecule config.
         """
-        self._lock = None
+        self._lock: locking.DirectoryLock | None = None
+        self._lock_released = False
         self.config = config
         self._setup()  # type: ignore[no-untyped-call]
 
@@ -86,10 +86,22 @@ class Scenario:
             if not dirs and not files:
                 os.removedirs(dirpath)
 
+    def release_lock(self: Scenario) -> None:
+        """Release the lock of the ephemeral directory, once the scenario ended."""
+        self._lock_released = True
+        if self._lock:
+            locking.MANAGER.release(self._lock)
+            self._lock = None
+
     @property
     def name(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         return self.config.config["scenario"]["name"]
 
+    @property
+    def suite(self) -> str | None:
+        """Return the name of the suite sharing instances with the scenario, if any."""
+        return self.config.config["scenario"].get("suite")  # type: ignore[no-any-return]
+
     @property
     def directory(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         if self.config.molecule_file:
@@ -113,29 +125,23 @@ class Scenario:
 
             path = ephemeral_directory(project_scenario_directory)
 
-        if os.environ.get("MOLECULE_PARALLEL", False) and not self._lock:
-            with open(os.path.join(path, ".lock"), "w") as self._lock:  # type: ignore[assignment]  # noqa: PTH118, PTH123
-                for i in range(1, 5):
-                    try:
-                        fcntl.lockf(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[arg-type]
-                        break
-                    except OSError:
-                        delay = 30 * i
-                        LOG.warning(
-                            "Retrying to acquire lock on %s, waiting for %s seconds",
-                            path,
-                            delay,
-                        )
-                        sleep(delay)
-                else:
-                    LOG.warning("Timedout trying to acquire lock on %s", path)
-                    raise SystemExit(RC_TIMEOUT)
+        # The lock is held until the scenario ends, see release_lock.
+        if (
+            os.environ.get("MOLECULE_PARALLEL", False)
+            and not self._lock
+            and not self._lock_released
+        ):
+            try:
+                self._lock = locking.MANAGER.acquire(path)
+            except TimeoutError:
+                LOG.warning("Timedout trying to acquire lock on %s", path)
+                raise MoleculeExit(RC_TIMEOUT) from None
 
         return path
 
     @property
     def inventory_directory(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(self.ephemeral_directory, "inventory")  # noqa: PTH118
+        return self.config.layout.inventory_directory
 
     @property
     def check_sequence(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -204,8 +210,10 @@ class Scenario:
 
     def _setup(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
         """Prepare the scenario for Molecule and returns None."""
-        if not os.path.isdir(self.inventory_directory):  # noqa: PTH112
-            os.makedirs(self.inventory_directory, exist_ok=True)  # noqa: PTH103
+        # The layout of the config is not available while its scenario is built.
+        inventory_directory = os.path.join(self.ephemeral_directory, "inventory")  # noqa: PTH118
+        if not os.path.isdir(inventory_directory):  # noqa: PTH112
+            os.makedirs(inventory_directory, exist_ok=True)  # noqa: PTH103
 
 
 def ephemeral_directory(path: str | None = None) -> str:
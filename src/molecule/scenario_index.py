@@ -0,0 +1,171 @@
+"""Scenario Index Module."""
+
+from __future__ import annotations
+
+import os
+import re
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import yaml
+
+from molecule import config, interpolation
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from molecule.scenario import Scenario
+
+
+# A top level ``scenario:`` key opening a block mapping, optionally followed
+# by a comment.
+_SCENARIO_KEY = re.compile(r"^scenario:\s*(?:#.*)?$")
+_NAME_KEY = re.compile(r"^(?P<indent>[ ]+)name:(?:\s+(?P<value>.*?))?\s*$")
+_PLAIN_NAME = re.compile(r"^[A-Za-z0-9_.][A-Za-z0-9_.\-]*$")
+_RESOLVER = yaml.resolver.Resolver()
+
+
+class IndexedScenario(NamedTuple):
+    """A discovered scenario whose config is only built when needed."""
+
+    name: str
+    molecule_file: str
+    args: dict[str, Any]
+    command_args: dict[str, Any]
+    ansible_args: tuple[str, ...] = ()
+
+    @property
+    def directory(self) -> str:
+        """Return the scenario directory."""
+        return os.path.dirname(self.molecule_file)  # noqa: PTH120
+
+    def load(self) -> Scenario:
+        """Build the scenario's config.
+
+        The result is not kept by the index, so the config is released as
+        soon as the caller drops the returned scenario.
+
+        Returns:
+            The scenario of a newly built config.
+        """
+        c = config.Config(
+            molecule_file=self.molecule_file,
+            args=self.args,
+            command_args=self.command_args,
+            ansible_args=self.ansible_args,
+        )
+        return c.scenario  # type: ignore[no-any-return]
+
+
+def index(
+    molecule_files: Iterable[str],
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+) -> list[IndexedScenario]:
+    """Index the scenarios defined by the given config files.
+
+    Names are read with [molecule.scenario_index.read_scenario_name][]; only
+    scenarios whose name cannot be determined that way get their config built.
+
+    Args:
+        molecule_files: Absolute paths to ``molecule.yml`` files.
+        args: A dict of options, arguments and commands from the CLI.
+        command_args: A dict of options passed to the subcommand from the CLI.
+        ansible_args: A tuple of arguments provided to the `ansible-playbook` command.
+
+    Returns:
+        The indexed scenarios, in the order of ``molecule_files``.
+    """
+    base_configs = [c for c in args.get("base_config", []) if os.path.exists(c)]  # noqa: PTH110
+    entries = []
+    for molecule_file in molecule_files:
+        name = read_scenario_name(molecule_file, base_configs)
+        entry = IndexedScenario(name or "", molecule_file, args, command_args, ansible_args)
+        if name is None:
+            entry = entry._replace(name=entry.load().name)
+        entries.append(entry)
+    return entries
+
+
+def read_scenario_name(molecule_file: str, base_configs: Iterable[str] = ()) -> str | None:
+    """Read the scenario name without building the config.
+
+    Only the block style ``scenario.name`` key of the base configs and the
+    scenario's config is looked at, the last one defining it wins.  Without
+    any, the name defaults to the name of the scenario directory.
+
+    Args:
+        molecule_file: Path to the scenario's ``molecule.yml``.
+        base_configs: Paths to the base configs merged below it.
+
+    Returns:
+        The scenario name, or None when it can only be known by rendering the
+        config, e.g. when it is interpolated or not written in plain block
+        style.
+    """
+    name = os.path.basename(os.path.dirname(molecule_file)) or "default"  # noqa: PTH119, PTH120
+    for path in (*base_configs, molecule_file):
+        try:
+            with open(path, encoding="utf-8") as stream:  # noqa: PTH123
+                found, value = _scan_scenario_name(stream)
+        except (OSError, UnicodeDecodeError):
+            return None
+        if not found:
+            continue
+        if value is None:
+            return None
+        name = value
+    return name
+
+
+def _scan_scenario_name(lines: Iterable[str]) -> tuple[bool, str | None]:
+    """Scan a config for the value of ``scenario.name``.
+
+    Args:
+        lines: Lines of the config.
+
+    Returns:
+        Whether the config may define the name and, if so, its value or None
+        when it is not a plain or simply quoted scalar.
+    """
+    found: tuple[bool, str | None] = (False, None)
+    in_scenario = False
+    indent = None
+    for line in lines:
+        line = line.rstrip("\r\n")  # noqa: PLW2901
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace():
+            in_scenario = bool(_SCENARIO_KEY.match(line))
+            indent = None
+            if not in_scenario and line.startswith("scenario:"):
+                # Flow mappings, anchors, aliases or tags.
+                found = (True, None)
+            continue
+        if not in_scenario:
+            continue
+        if line.lstrip().startswith("<<:"):
+            found = (True, None)
+            continue
+        match = _NAME_KEY.match(line)
+        current = len(line) - len(line.lstrip())
+        if indent is None:
+            indent = current
+        if match and current == indent:
+            found = (True, _scalar(match.group("value") or ""))
+    return found
+
+
+def _scalar(value: str) -> str | None:
+    if " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    elif _RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) != interpolation.STR_TAG:  # type: ignore[no-untyped-call]
+        # Plain scalars such as numbers or booleans are not loaded as strings.
+        return None
+    if "$" in value or not _PLAIN_NAME.match(value):
+        return None
+    return value
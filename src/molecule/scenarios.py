@@ -18,9 +18,22 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 """Scenarios Module."""
+
+from __future__ import annotations
+
 import logging
+import random
+
+from typing import TYPE_CHECKING
+
+from molecule import ordering, scenario_index, util
 
-from molecule import util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from molecule.config import Config
+    from molecule.scenario import Scenario
 
 
 LOG = logging.getLogger(__name__)
@@ -29,21 +42,35 @@ LOG = logging.getLogger(__name__)
 class Scenarios:
     """The Scenarios groups one or more scenario objects Molecule will execute."""
 
-    def __init__(self, configs, scenario_name=None) -> None:  # type: ignore[no-untyped-def]  # noqa: ANN001
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        configs,  # noqa: ANN001
+        scenario_name=None,  # noqa: ANN001
+        order: str = "directory",
+        durations: Mapping[str, float] | None = None,
+    ) -> None:
         """Initialize a new scenarios class and returns None.
 
         Args:
-            configs: A list containing Molecule config instances.
+            configs: A list containing Molecule config instances or indexed
+                scenarios, whose config is only built once they are iterated.
             scenario_name: A string containing the name of the scenario.
+            order: Order to run the scenarios in, one of ``ordering.ORDERS``.
+            durations: Recorded durations of the scenarios, by name, used by
+                the ``lpt`` order.
         """
         self._configs = configs
         self._scenario_name = scenario_name
-        self._scenarios = self.all
+        self._order = order
+        self._durations = durations
+        # Shuffled the same way every time scenarios are selected.
+        self._seed = random.random()  # noqa: S311
+        self._scenarios = self._select()  # type: ignore[no-untyped-call]
 
     def next(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         if not self._scenarios:
             raise StopIteration
-        return self._scenarios.pop(0)
+        return _load(self._scenarios.pop(0))
 
     def __iter__(self):  # type: ignore[no-untyped-def]  # noqa: ANN204
         """Make object iterable."""
@@ -58,36 +85,43 @@ class Scenarios:
         Returns:
             list
         """
-        if self._scenario_name:
-            scenarios = self._filter_for_scenario()  # type: ignore[no-untyped-call]
-            self._verify()  # type: ignore[no-untyped-call]
-
-            return scenarios
-
-        scenarios = [c.scenario for c in self._configs]
-        scenarios.sort(key=lambda x: x.directory)
-        return scenarios
+        return [_load(s) for s in self._select()]  # type: ignore[no-untyped-call]
 
     def print_matrix(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         msg = "Test matrix"
         LOG.info(msg)
 
         tree = {}
-        for scenario in self.all:
-            tree[scenario.name] = list(scenario.sequence)
+        for s in self._select():  # type: ignore[no-untyped-call]
+            tree[s.name] = list(_load(s).sequence)
         util.print_as_yaml(tree)
 
     def sequence(self, scenario_name: str) -> list[str]:  # noqa: D102
-        for scenario in self.all:
-            if scenario.name == scenario_name:
-                return list(scenario.sequence)
+        for s in self._select():  # type: ignore[no-untyped-call]
+            if s.name == scenario_name:
+                return list(_load(s).sequence)
         raise RuntimeError(  # noqa: TRY003
             f"Unable to find sequence for {scenario_name} scenario.",  # noqa: EM102
         )
 
+    def _select(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
+        """Return the selected scenarios, without building indexed ones.
+
+        Returns:
+            list
+        """
+        if self._scenario_name:
+            scenarios = self._filter_for_scenario()  # type: ignore[no-untyped-call]
+            self._verify()  # type: ignore[no-untyped-call]
+
+            return scenarios
+
+        scenarios = [_unbuilt(c) for c in self._configs]
+        return ordering.sort(scenarios, self._order, self._durations, self._seed)
+
     def _verify(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
         """Verify the specified scenario was found and returns None."""
-        scenario_names = [c.scenario.name for c in self._configs]
+        scenario_names = [_unbuilt(c).name for c in self._configs]
         if self._scenario_name not in scenario_names:
             msg = f"Scenario '{self._scenario_name}' not found.  Exiting."
             util.sysexit_with_message(msg)
@@ -98,7 +132,7 @@ class Scenarios:
         Returns:
             list
         """
-        return [c.scenario for c in self._configs if c.scenario.name == self._scenario_name]
+        return [_unbuilt(c) for c in self._configs if _unbuilt(c).name == self._scenario_name]
 
     def _get_matrix(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
         """Build a matrix of scenarios with sequence to include and returns a dict.
@@ -137,3 +171,19 @@ class Scenarios:
             }
             for scenario in self.all
         }
+
+
+def _unbuilt(
+    c: Config | scenario_index.IndexedScenario,
+) -> Scenario | scenario_index.IndexedScenario:
+    """Return the scenario of a config, or the indexed scenario as is."""
+    if isinstance(c, scenario_index.IndexedScenario):
+        return c
+    return c.scenario  # type: ignore[no-any-return]
+
+
+def _load(s: Scenario | scenario_index.IndexedScenario) -> Scenario:
+    """Return the scenario, building the config of an indexed scenario."""
+    if isinstance(s, scenario_index.IndexedScenario):
+        return s.load()
+    return s
@@ -0,0 +1,374 @@
+"""Concurrent Scenario Scheduler Module."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from rich.text import Text
+
+from molecule import config, locking, logger, results
+from molecule.console import console
+from molecule.constants import RC_SUCCESS, RC_TIMEOUT, RC_UNKNOWN_ERROR
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.process import BaseProcess
+
+    from molecule.results import ActionResult
+    from molecule.scenario import Scenario
+
+
+LOG = logging.getLogger(__name__)
+
+
+class ScenarioResult(NamedTuple):
+    """Outcome of a scenario executed by a scheduler worker."""
+
+    scenario_name: str
+    returncode: int
+    duration: float
+    actions: tuple[ActionResult, ...] = ()
+
+
+def run_scenarios(  # noqa: PLR0913
+    scenarios: list[Scenario],
+    jobs: int,
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...] = (),
+    *,
+    execute: Callable[[Scenario, dict[str, Any]], None],
+) -> list[ScenarioResult]:
+    """Run the given scenarios in up to ``jobs`` worker processes.
+
+    Each worker builds its own config from the scenario's ``molecule.yml`` and
+    writes everything it prints, including the output of ``ansible-playbook``,
+    into a log file private to that scenario.  The log is replayed on the
+    console as soon as the scenario completes, so output of concurrent
+    scenarios is never interleaved.
+
+    Args:
+        scenarios: Scenarios selected for execution.
+        jobs: Maximum number of scenarios to run at once.
+        args: ``args`` dict from ``click`` command context.
+        command_args: dict of command arguments, including the target.
+        ansible_args: Optional tuple of arguments to pass to the `ansible-playbook` command.
+        execute: Function executing a scenario in a worker, given the command
+            arguments.
+
+    Returns:
+        A list of results, in order of completion.
+    """
+    outcomes = []
+    # spawn gives every worker a clean interpreter instead of inheriting the
+    # locks and logging handlers of the main process.
+    mp_context = multiprocessing.get_context("spawn")
+
+    with (
+        tempfile.TemporaryDirectory(prefix="molecule-jobs-") as log_directory,
+        ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor,
+    ):
+        futures = {}
+        for scenario in scenarios:
+            log_file = os.path.join(log_directory, f"{scenario.name}.log")  # noqa: PTH118
+            LOG.info("Scheduling scenario %s", scenario.name)
+            future = executor.submit(
+                _run_worker,
+                scenario.name,
+                scenario.config.molecule_file,
+                execute=execute,
+                args=args,
+                command_args=command_args,
+                ansible_args=ansible_args,
+                log_file=log_file,
+                environ=dict(os.environ),
+            )
+            futures[future] = (scenario.name, log_file)
+
+        for future in as_completed(futures):
+            scenario_name, log_file = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                LOG.exception("Worker running scenario %s failed", scenario_name)
+                result = ScenarioResult(scenario_name, RC_UNKNOWN_ERROR, 0.0)
+            _replay_log(scenario_name, log_file)
+            outcomes.append(result)
+
+    _print_summary(outcomes)
+    return outcomes
+
+
+def _run_worker(  # noqa: PLR0913
+    scenario_name: str,
+    molecule_file: str,
+    *,
+    execute: Callable[[Scenario, dict[str, Any]], None],
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...],
+    log_file: str,
+    environ: dict[str, str],
+) -> ScenarioResult:
+    """Execute a single scenario inside a worker process.
+
+    Args:
+        scenario_name: Name of the scenario, used for reporting.
+        molecule_file: Path to the scenario's ``molecule.yml``.
+        execute: Function executing the scenario, given the command arguments.
+        args: ``args`` dict from ``click`` command context.
+        command_args: dict of command arguments, including the target.
+        ansible_args: Tuple of arguments to pass to the `ansible-playbook` command.
+        log_file: File receiving everything the worker writes to stdout and stderr.
+        environ: Environment of the main process.
+
+    Returns:
+        The scenario result.
+    """
+    # The process level environment the worker was spawned with may have been
+    # altered through copies of os.environ, start from what the main process
+    # actually sees instead.
+    os.environ.clear()
+    os.environ.update(environ)
+
+    # Redirect the file descriptors rather than sys.stdout so output of the
+    # ansible-playbook subprocesses lands in the same buffer.
+    with open(log_file, "w") as stream:  # noqa: PTH123
+        os.dup2(stream.fileno(), 1)
+        os.dup2(stream.fileno(), 2)
+    if not logging.getLogger().handlers:
+        logger.configure()
+    logger.set_log_level(args.get("verbose", 0), args.get("debug", False))
+
+    start = time.monotonic()
+    returncode = RC_SUCCESS
+    with results.recording() as recorder:
+        try:
+            c = config.Config(
+                molecule_file=molecule_file,
+                args=args,
+                command_args=command_args,
+                ansible_args=ansible_args,
+            )
+            execute(c.scenario, command_args)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else RC_UNKNOWN_ERROR
+    for result in REAPERS.wait():
+        returncode = returncode or result.returncode
+
+    return ScenarioResult(
+        scenario_name,
+        returncode,
+        time.monotonic() - start,
+        tuple(recorder.actions),
+    )
+
+
+class Reaper(NamedTuple):
+    """Process destroying the instances of a scenario in the background."""
+
+    scenario_name: str
+    instances: frozenset[str]
+    process: BaseProcess
+    log_file: str
+    start: float
+
+
+class Reapers:
+    """Background destroys, awaited before the run exits.
+
+    A scenario run with ``--destroy=background`` hands its final ``destroy``
+    to a reaper process, which holds the lock of the scenario's ephemeral
+    directory, destroys the instances, then prunes the directory.  The run
+    moves on to the next scenario meanwhile, unless that scenario uses
+    instance names a reaper is still destroying.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of reapers."""
+        self._reapers: list[Reaper] = []
+        self._results: list[ScenarioResult] = []
+        self._log_directory: tempfile.TemporaryDirectory[str] | None = None
+
+    def start(self, scenario: Scenario, destroy: Callable[[config.Config], None]) -> None:
+        """Destroy the instances of a scenario in a reaper process.
+
+        Args:
+            scenario: The scenario whose sequence only has its destroy left.
+            destroy: Function destroying the instances of a scenario config,
+                run by the reaper while it holds the lock.
+        """
+        c = scenario.config
+        if self._log_directory is None:
+            self._log_directory = tempfile.TemporaryDirectory(prefix="molecule-reapers-")
+        log_file = os.path.join(self._log_directory.name, f"{scenario.name}.log")  # noqa: PTH118
+        process = multiprocessing.get_context("spawn").Process(
+            target=_run_reaper,
+            args=(c.molecule_file,),
+            kwargs={
+                "destroy": destroy,
+                "args": c.args,
+                # The reaper must find the ephemeral directory of this run.
+                "command_args": {**c.command_args, "run_uuid": c._run_uuid},  # noqa: SLF001
+                "ansible_args": c.ansible_args,
+                "log_file": log_file,
+                "environ": dict(os.environ),
+            },
+            name=f"molecule-reaper-{scenario.name}",
+        )
+        process.start()
+        LOG.info("Destroying scenario %s in the background", scenario.name)
+        self._reapers.append(
+            Reaper(scenario.name, _instance_names(scenario), process, log_file, time.monotonic()),
+        )
+
+    def wait_for(self, scenario: Scenario) -> None:
+        """Wait for the reapers destroying instances the scenario uses.
+
+        Args:
+            scenario: The scenario about to use its instances.
+        """
+        if not self._reapers:
+            return
+        names = _instance_names(scenario)
+        for reaper in [r for r in self._reapers if r.instances & names]:
+            LOG.info("Waiting for scenario %s to be destroyed", reaper.scenario_name)
+            self._join(reaper)
+
+    def wait(self) -> list[ScenarioResult]:
+        """Wait for every reaper.
+
+        Returns:
+            The results of the reapers which finished since the last call.
+        """
+        for reaper in list(self._reapers):
+            self._join(reaper)
+        if self._log_directory is not None:
+            self._log_directory.cleanup()
+            self._log_directory = None
+        outcomes, self._results = self._results, []
+        return outcomes
+
+    def _join(self, reaper: Reaper) -> None:
+        reaper.process.join()
+        self._reapers.remove(reaper)
+        _replay_log(reaper.scenario_name, reaper.log_file)
+        returncode = reaper.process.exitcode
+        self._results.append(
+            ScenarioResult(
+                reaper.scenario_name,
+                RC_UNKNOWN_ERROR if returncode is None else returncode,
+                time.monotonic() - reaper.start,
+            ),
+        )
+
+
+REAPERS = Reapers()
+
+
+def _instance_names(scenario: Scenario) -> frozenset[str]:
+    return frozenset(platform["name"] for platform in scenario.config.platforms.instances)
+
+
+def _run_reaper(  # noqa: PLR0913
+    molecule_file: str,
+    *,
+    destroy: Callable[[config.Config], None],
+    args: dict[str, Any],
+    command_args: dict[str, Any],
+    ansible_args: tuple[str, ...],
+    log_file: str,
+    environ: dict[str, str],
+) -> None:
+    """Destroy the instances of a scenario, holding the lock of its ephemeral directory.
+
+    Args:
+        molecule_file: Path to the scenario's ``molecule.yml``.
+        destroy: Function destroying the instances of the scenario config.
+        args: ``args`` dict from ``click`` command context.
+        command_args: dict of command arguments, including the target.
+        ansible_args: Tuple of arguments to pass to the `ansible-playbook` command.
+        log_file: File receiving everything the reaper writes to stdout and stderr.
+        environ: Environment of the main process.
+    """
+    os.environ.clear()
+    os.environ.update(environ)
+    with open(log_file, "w") as stream:  # noqa: PTH123
+        os.dup2(stream.fileno(), 1)
+        os.dup2(stream.fileno(), 2)
+    if not logging.getLogger().handlers:
+        logger.configure()
+    logger.set_log_level(args.get("verbose", 0), args.get("debug", False))
+
+    returncode = RC_SUCCESS
+    try:
+        c = config.Config(
+            molecule_file=molecule_file,
+            args=args,
+            command_args=command_args,
+            ansible_args=ansible_args,
+        )
+        try:
+            lock = locking.MANAGER.acquire(c.scenario.ephemeral_directory)
+        except TimeoutError:
+            LOG.warning("Timedout trying to acquire lock on %s", c.scenario.ephemeral_directory)
+            sys.exit(RC_TIMEOUT)
+        try:
+            destroy(c)
+        finally:
+            locking.MANAGER.release(lock)
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else RC_UNKNOWN_ERROR
+    sys.exit(returncode)
+
+
+def _replay_log(scenario_name: str, log_file: str) -> None:
+    """Print the buffered output of a finished scenario.
+
+    Args:
+        scenario_name: Name of the scenario the log belongs to.
+        log_file: Path to the buffered log.
+    """
+    path = Path(log_file)
+    if not path.is_file():
+        return
+    LOG.info(
+        "[info]Output of scenario [scenario]%s[/][/]",
+        scenario_name,
+        extra={"markup": True},
+    )
+    console.print(Text.from_ansi(path.read_text(errors="replace")), end="")
+
+
+def _print_summary(outcomes: list[ScenarioResult]) -> None:
+    """Log an aggregated pass/fail summary of the executed scenarios.
+
+    Args:
+        outcomes: Results returned by the workers.
+    """
+    failed = [r for r in outcomes if r.returncode != RC_SUCCESS]
+    LOG.info(
+        "Scenario summary: %d passed, %d failed",
+        len(outcomes) - len(failed),
+        len(failed),
+    )
+    for result in sorted(outcomes, key=lambda r: r.scenario_name):
+        if result.returncode == RC_SUCCESS:
+            LOG.info("  %s: passed in %.1fs", result.scenario_name, result.duration)
+        else:
+            LOG.error(
+                "  %s: failed with return code %d in %.1fs",
+                result.scenario_name,
+                result.returncode,
+                result.duration,
+            )
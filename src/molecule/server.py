@@ -0,0 +1,39 @@
+"""Molecule Daemon Server Module."""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+from molecule import api, daemon
+from molecule.shell import main as shell_main
+
+
+LOG = logging.getLogger(daemon.__name__)
+
+
+def run(args: list[str], prog_name: str) -> None:
+    """Run a command line of Molecule, as the molecule program does.
+
+    Args:
+        args: The arguments of the command line.
+        prog_name: The program name shown by the help and errors.
+    """
+    shell_main(args=args, prog_name=prog_name)  # pylint: disable=no-value-for-parameter
+
+
+def main() -> None:
+    """Run the daemon, on the socket given as argument or the default one."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    LOG.addHandler(handler)
+    LOG.setLevel(logging.INFO)
+    LOG.propagate = False
+    # Plugins are loaded once, for the commands to find them loaded.
+    api.drivers()
+    api.verifiers()
+    daemon.Daemon(sys.argv[1] if len(sys.argv) > 1 else daemon.socket_path(), run).serve()
+
+
+if __name__ == "__main__":
+    main()
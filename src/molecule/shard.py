@@ -0,0 +1,87 @@
+"""Scenario Sharding Module."""
+
+from __future__ import annotations
+
+import logging
+
+from typing import TYPE_CHECKING
+
+from molecule import ordering
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+LOG = logging.getLogger(__name__)
+
+
+def parse(value: str) -> tuple[int, int]:
+    """Parse a shard given as ``INDEX/COUNT``.
+
+    Args:
+        value: The shard.
+
+    Returns:
+        The index of the shard, counting from 1, and the number of shards.
+
+    Raises:
+        ValueError: When the shard is not valid.
+    """
+    index, _, count = value.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError:
+        msg = f"Shard '{value}' is not of the form INDEX/COUNT."
+        raise ValueError(msg) from None
+    if not 1 <= shard[0] <= shard[1]:
+        msg = f"Shard '{value}' does not have an INDEX between 1 and COUNT."
+        raise ValueError(msg)
+    return shard
+
+
+def assign(names: list[str], count: int, durations: Mapping[str, float]) -> list[list[str]]:
+    """Assign scenarios to shards of about the same total duration.
+
+    Args:
+        names: Names of the scenarios.
+        count: Number of shards.
+        durations: Estimated durations of the scenarios, by name.
+
+    Returns:
+        Names of the scenarios of every shard.
+    """
+    weights = ordering.estimates(names, durations)
+
+    shards: list[list[str]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for name in sorted(names, key=lambda name: (-weights[name], name)):
+        lightest = min(range(count), key=lambda i: (totals[i], i))
+        shards[lightest].append(name)
+        totals[lightest] += weights[name]
+    return shards
+
+
+def select(names: list[str], value: str, durations: Mapping[str, float]) -> list[str]:
+    """Return the scenarios of a shard.
+
+    Args:
+        names: Names of the selected scenarios.
+        value: The shard, as ``INDEX/COUNT``.
+        durations: Estimated durations of the scenarios, by name.
+
+    Returns:
+        Names of the scenarios of the shard.
+    """
+    index, count = parse(value)
+    shards = assign(names, count, durations)
+    selected = shards[index - 1]
+    LOG.info(
+        "Shard %s runs %d of %d scenarios%s: %s",
+        value,
+        len(selected),
+        len(names),
+        "" if any(name in durations for name in names) else ", without recorded durations",
+        ", ".join(sorted(selected)) or "none",
+    )
+    return selected
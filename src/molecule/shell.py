@@ -153,9 +153,13 @@ main.add_command(command.init.init)
 main.add_command(command.list.list)
 main.add_command(command.login.login)
 main.add_command(command.matrix.matrix)
+main.add_command(command.plan.plan)
+main.add_command(command.pool.pool)
 main.add_command(command.prepare.prepare)
 main.add_command(command.reset.reset)
+main.add_command(command.serve.serve)
 main.add_command(command.side_effect.side_effect)
+main.add_command(command.stats.stats)
 main.add_command(command.syntax.syntax)
 main.add_command(command.test.test)
 main.add_command(command.verify.verify)
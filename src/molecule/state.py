@@ -34,6 +34,8 @@ VALID_KEYS = [
     "run_uuid",
     "is_parallel",
     "molecule_yml_date_modified",
+    "fingerprints",
+    "failed_step",
 ]
 
 
@@ -109,9 +111,31 @@ class State:
     def molecule_yml_date_modified(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
         return self._data.get("molecule_yml_date_modified")
 
+    @property
+    def fingerprints(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
+        return self._data.get("fingerprints")
+
+    @property
+    def failed_step(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
+        return self._data.get("failed_step")
+
     @marshal  # type: ignore[arg-type]
-    def reset(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        self._data = self._default_data()  # type: ignore[no-untyped-call]
+    def reset(self, keep=()):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
+        """Reset the state once the instances are destroyed.
+
+        The step a sequence failed at outlives the instances.
+
+        Args:
+            keep: Actions not touching instances, whose fingerprints outlive them.
+        """
+        data = self._default_data()  # type: ignore[no-untyped-call]
+        data["fingerprints"] = {
+            action: fingerprint
+            for action, fingerprint in (self.fingerprints or {}).items()
+            if action in keep
+        }
+        data["failed_step"] = self.failed_step
+        self._data = data
 
     @marshal  # type: ignore[arg-type]
     def change_state(self, key, value):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
@@ -141,6 +165,8 @@ class State:
             "molecule_yml_date_modified": None,
             "run_uuid": self._config._run_uuid,  # noqa: SLF001
             "is_parallel": self._config.is_parallel,
+            "fingerprints": {},
+            "failed_step": None,
         }
 
     def _load_file(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
@@ -150,4 +176,4 @@ class State:
         util.write_file(self.state_file, util.safe_dump(self._data))
 
     def _get_state_file(self):  # type: ignore[no-untyped-def]  # noqa: ANN202
-        return os.path.join(self._config.scenario.ephemeral_directory, "state.yml")  # noqa: PTH118
+        return self._config.layout.state_file
@@ -0,0 +1,131 @@
+"""Scenario Suite Module."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from molecule import planner, util
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from molecule.scenario import Scenario
+
+
+LOG = logging.getLogger(__name__)
+
+SETUP_ACTIONS = frozenset(("create", "prepare"))
+
+
+class Phases(NamedTuple):
+    """A sequence, split around the actions creating and destroying instances."""
+
+    setup: list[str]
+    body: list[str]
+    teardown: list[str]
+
+
+def split(sequence: list[str]) -> Phases:
+    """Split a sequence into phases.
+
+    The setup ends with the last action creating or preparing instances, the
+    teardown is the final ``destroy``.
+
+    Args:
+        sequence: Sequence of a scenario.
+
+    Returns:
+        The phases of the sequence.
+    """
+    ends = [i + 1 for i, action in enumerate(sequence) if action in SETUP_ACTIONS]
+    start = max(ends, default=0)
+    end = len(sequence) - 1 if sequence[start:] and sequence[-1] == "destroy" else len(sequence)
+    return Phases(sequence[:start], sequence[start:end], sequence[end:])
+
+
+def member_sequence(sequence: list[str]) -> list[str]:
+    """Return the actions a scenario runs on instances of its suite.
+
+    Args:
+        sequence: Sequence of a scenario which does not own the instances.
+
+    Returns:
+        The actions of the body, preceded by the ones of the setup not
+        touching instances.
+    """
+    phases = split(sequence)
+    return [action for action in phases.setup if action in planner.LOCAL_ACTIONS] + phases.body
+
+
+def group(scenarios: list[Scenario]) -> list[list[Scenario]]:
+    """Group scenarios by suite.
+
+    Args:
+        scenarios: Scenarios, in the order to run them in.
+
+    Returns:
+        The suites, ordered by their first scenario, and scenarios not part
+        of any suite on their own.
+    """
+    groups: list[list[Scenario]] = []
+    suites: dict[str, list[Scenario]] = {}
+    for scenario in scenarios:
+        if not scenario.suite:
+            groups.append([scenario])
+        elif scenario.suite in suites:
+            suites[scenario.suite].append(scenario)
+        else:
+            suites[scenario.suite] = [scenario]
+            groups.append(suites[scenario.suite])
+    for members in suites.values():
+        _verify(members)
+    return groups
+
+
+def _verify(members: list[Scenario]) -> None:
+    platforms = members[0].config.config["platforms"]
+    for member in members[1:]:
+        if member.config.config["platforms"] != platforms:
+            msg = (
+                f"Scenarios '{members[0].name}' and '{member.name}' of suite "
+                f"'{member.suite}' do not share platforms.  Exiting."
+            )
+            util.sysexit_with_message(msg)
+
+
+@contextlib.contextmanager
+def borrow(owner: Scenario, member: Scenario) -> Iterator[None]:
+    """Lend the instances of the owner of a suite to another scenario.
+
+    Args:
+        owner: Scenario which created the instances.
+        member: Scenario borrowing them.
+
+    Yields:
+        Nothing, once the member can use the instances.
+    """
+    if member.config.state.state_file == owner.config.state.state_file:
+        # Same scenario, or ephemeral directory set for all of them.
+        yield
+        return
+
+    LOG.info("Sharing instances of scenario %s with scenario %s", owner.name, member.name)
+    instance_config = member.config.driver.instance_config
+    if os.path.isfile(owner.config.driver.instance_config):  # noqa: PTH113
+        shutil.copyfile(owner.config.driver.instance_config, instance_config)
+    for key in ("driver", "prepared", "created"):
+        member.config.state.change_state(key, getattr(owner.config.state, key))
+    try:
+        yield
+    finally:
+        # The member never destroys the instances, so must not keep them.
+        if os.path.exists(instance_config):  # noqa: PTH110
+            os.remove(instance_config)  # noqa: PTH107
+        member.config.state.reset(keep=planner.LOCAL_ACTIONS)
+        member.config.state.change_state("created", False)  # noqa: FBT003
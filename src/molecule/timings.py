@@ -0,0 +1,215 @@
+"""Action Timings Module."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from molecule import results, scenario, util
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+# Actions of sequences, the ones worth timing.
+ACTIONS = frozenset(
+    (
+        "cleanup",
+        "converge",
+        "create",
+        "dependency",
+        "destroy",
+        "idempotence",
+        "prepare",
+        "side_effect",
+        "syntax",
+        "verify",
+    ),
+)
+
+# Seconds to wait for other runs writing to the database.
+TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+    run_uuid TEXT NOT NULL,
+    project TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    action TEXT NOT NULL,
+    driver TEXT NOT NULL,
+    sequence TEXT NOT NULL,
+    started REAL NOT NULL,
+    duration REAL NOT NULL,
+    returncode INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_by_scenario ON timings (project, scenario, started);
+"""
+
+
+class Row(NamedTuple):
+    """Timing of an action of a scenario.
+
+    Attributes:
+        run_uuid: UUID of the run of the scenario.
+        scenario: Name of the scenario.
+        action: Name of the action.
+        driver: Name of the driver of the scenario.
+        sequence: Name of the sequence the action ran in.
+        started: When the action started, in seconds since the epoch.
+        duration: Wall time the action took, in seconds.
+        returncode: Exit code of the action, 0 when it succeeded.
+    """
+
+    run_uuid: str
+    scenario: str
+    action: str
+    driver: str
+    sequence: str
+    started: float
+    duration: float
+    returncode: int
+
+
+def enabled() -> bool:
+    """Return whether actions record their timings.
+
+    Returns:
+        Whether ``MOLECULE_TIMINGS`` is set to a true value.
+    """
+    return util.boolean(os.environ.get("MOLECULE_TIMINGS", "False"))
+
+
+def path() -> str:
+    """Return the path to the timings database.
+
+    Returns:
+        ``timings.db`` in the molecule cache directory.
+    """
+    return os.path.join(scenario.ephemeral_directory("molecule"), "timings.db")  # noqa: PTH118
+
+
+def project_name(project_directory: str | None = None) -> str:
+    """Return the name timings of a project are recorded under.
+
+    Args:
+        project_directory: Directory of the project, the current one by default.
+
+    Returns:
+        The base name of the project directory.
+    """
+    if project_directory is None:
+        project_directory = os.getenv("MOLECULE_PROJECT_DIRECTORY", os.getcwd())  # noqa: PTH109
+    return os.path.basename(project_directory)  # noqa: PTH119
+
+
+@contextlib.contextmanager
+def timed(config: Config, action: str) -> Iterator[None]:
+    """Record the timing of an action of a sequence, when enabled.
+
+    Args:
+        config: Config of the scenario running the action.
+        action: Name of the action.
+
+    Yields:
+        Nothing, once the action can run.
+    """
+    if action not in ACTIONS or not enabled():
+        yield
+        return
+
+    started = time.time()
+    start = time.monotonic()
+    returncode = 0
+    try:
+        yield
+    except SystemExit as e:
+        returncode = results.exit_code(e)
+        raise
+    except Exception:
+        returncode = 1
+        raise
+    finally:
+        record(
+            project_name(config.project_directory),
+            Row(
+                run_uuid=config._run_uuid,  # noqa: SLF001
+                scenario=config.scenario.name,
+                action=action,
+                driver=config.config["driver"]["name"],
+                sequence=config.subcommand,
+                started=started,
+                duration=time.monotonic() - start,
+                returncode=returncode,
+            ),
+        )
+
+
+def record(project: str, row: Row) -> None:
+    """Record the timing of an action.
+
+    Recording never fails the action: when the database cannot be written,
+    the timing is dropped.
+
+    Args:
+        project: Name of the project.
+        row: The timing.
+    """
+    file = path()
+    try:
+        with contextlib.closing(_connect(file)) as connection:  # noqa: SIM117
+            with connection:
+                connection.execute(
+                    "INSERT INTO timings (project, run_uuid, scenario, action, driver, sequence,"
+                    " started, duration, returncode) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (project, *row),
+                )
+    except (OSError, sqlite3.Error) as e:
+        LOG.debug("Unable to record timings in %s: %s", file, e)
+
+
+def rows(project: str | None = None) -> list[Row]:
+    """Return the timings of the actions of a project.
+
+    Args:
+        project: Name of the project, the current one by default.
+
+    Returns:
+        The timings, oldest first, empty without a database.
+    """
+    file = path()
+    if not os.path.exists(file):  # noqa: PTH110
+        return []
+    try:
+        with contextlib.closing(_connect(file)) as connection:
+            found = connection.execute(
+                "SELECT run_uuid, scenario, action, driver, sequence, started, duration,"
+                " returncode FROM timings WHERE project = ? ORDER BY started",
+                (project or project_name(),),
+            ).fetchall()
+    except sqlite3.Error as e:
+        LOG.warning("Unable to read timings from %s: %s", file, e)
+        return []
+    return [Row(*row) for row in found]
+
+
+def _connect(file: str) -> sqlite3.Connection:
+    """Open the timings database, creating it when missing."""
+    connection = sqlite3.connect(file, timeout=TIMEOUT)
+    try:
+        # Concurrent runs append while others read.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
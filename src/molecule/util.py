@@ -25,8 +25,8 @@ import fnmatch
 import logging
 import os
 import re
-import sys
 
+from collections import ChainMap
 from subprocess import CalledProcessError, CompletedProcess
 from typing import TYPE_CHECKING, Any, NoReturn
 
@@ -36,25 +36,21 @@ import yaml
 from ansible_compat.ports import cache
 from rich.syntax import Syntax
 
+from molecule import codec, zygote
 from molecule.app import app
+from molecule.codec import SafeDumper  # noqa: F401
 from molecule.console import console
 from molecule.constants import MOLECULE_HEADER
+from molecule.exceptions import MoleculeExit
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, MutableMapping
+    from collections.abc import Iterable, Mapping, MutableMapping
     from warnings import WarningMessage
 
 LOG = logging.getLogger(__name__)
 
 
-class SafeDumper(yaml.SafeDumper):
-    """SafeDumper YAML Class."""
-
-    def increase_indent(self, flow=False, indentless=False):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, FBT002, ARG002, D102
-        return super().increase_indent(flow, False)  # noqa: FBT003
-
-
 def print_debug(title: str, data: str) -> None:
     """Print debug information."""
     console.print(f"DEBUG: {title}:\n{data}")
@@ -95,9 +91,13 @@ def do_report() -> None:
         f.close()
 
 
-def sysexit(code: int = 1) -> NoReturn:
-    """Perform a system exit with given code, default 1."""
-    sys.exit(code)
+def sysexit(code: int = 1, message: str = "") -> NoReturn:
+    """Perform a system exit with given code, default 1.
+
+    The message explaining the exit is kept on the exception, for
+    :func:`molecule.api.run` to report it.
+    """
+    raise MoleculeExit(code, message)
 
 
 def sysexit_with_message(
@@ -116,7 +116,7 @@ def sysexit_with_message(
 
     for warn in warns:
         LOG.warning(warn.__dict__["message"].args[0])
-    sysexit(code)
+    sysexit(code, msg)
 
 
 def run_command(  # type: ignore[no-untyped-def]  # noqa: PLR0913
@@ -143,17 +143,24 @@ def run_command(  # type: ignore[no-untyped-def]  # noqa: PLR0913
         A completed process object.
     """
     args = cmd
+    # Layered environments are only flattened once a process is spawned.
+    if env is not None:
+        env = dict(env)
 
     if debug:
         print_environment_vars(env)
 
-    result = app.runtime.run(
-        args=args,
-        env=env,
-        cwd=cwd,
-        tee=True,
-        set_acp=False,
-    )
+    result = None
+    if boolean(os.environ.get("MOLECULE_ZYGOTE", "False")):
+        result = _run_in_zygote(args, env, cwd)
+    if result is None:
+        result = app.runtime.run(
+            args=args,
+            env=env,
+            cwd=cwd,
+            tee=True,
+            set_acp=False,
+        )
     if result.returncode != 0 and check:
         raise CalledProcessError(
             returncode=result.returncode,
@@ -164,6 +171,25 @@ def run_command(  # type: ignore[no-untyped-def]  # noqa: PLR0913
     return result
 
 
+def _run_in_zygote(
+    cmd: list[str],
+    env: dict[str, str] | None,
+    cwd: str | None,
+) -> CompletedProcess[str] | None:
+    """Run ``ansible-playbook`` in a child of a zygote, see :mod:`molecule.zygote`.
+
+    Returns:
+        The completed process, or ``None`` when it needs to run in a new process.
+    """
+    # The environment app.runtime.run gives commands.
+    env = {
+        **(app.runtime.environ if env is None else env),
+        "ANSIBLE_DEBUG": "0",
+        "ANSIBLE_VERBOSE_TO_STDERR": "True",
+    }
+    return zygote.run(cmd, env, cwd, str(app.runtime.version))
+
+
 def os_walk(directory, pattern, excludes=[], followlinks=False):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, FBT002, B006
     """Navigate recursively and retried files based on pattern."""
     for root, dirs, files in os.walk(directory, topdown=True, followlinks=followlinks):
@@ -230,12 +256,7 @@ def safe_dump(data: Any, explicit_start=True) -> str:  # type: ignore[no-untyped
     Returns:
         str
     """
-    return yaml.dump(
-        data,
-        Dumper=SafeDumper,
-        default_flow_style=False,
-        explicit_start=explicit_start,
-    )
+    return codec.dump(data, explicit_start=explicit_start)
 
 
 def safe_load(string) -> dict:  # type: ignore[no-untyped-def, type-arg]  # noqa: ANN001
@@ -248,7 +269,7 @@ def safe_load(string) -> dict:  # type: ignore[no-untyped-def, type-arg]  # noqa
         dict
     """
     try:
-        return yaml.safe_load(string) or {}
+        return codec.load(string) or {}
     except yaml.scanner.ScannerError as e:
         sysexit_with_message(str(e))
     return {}
@@ -323,11 +344,54 @@ def merge_dicts(a: MutableMapping, b: MutableMapping) -> MutableMapping:  # type
     return result
 
 
-def validate_parallel_cmd_args(cmd_args):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
-    """Prevents use of options incompatible with parallel mode."""
+def overlay_env(env: Mapping[str, Any], *layers: Mapping[str, Any]) -> ChainMap[str, Any]:
+    """Return an environment with the given layers on top of ``env``.
+
+    Unlike [molecule.util.merge_dicts][], neither ``env`` nor the layers of
+    previously overlaid environments are copied, lookups fall through the
+    layers and writes only go to a new, empty top layer.  Later layers take
+    precedence.
+
+    Args:
+        env: The environment to extend, usually ``os.environ``.
+        layers: Mappings of variables to add.
+
+    Returns:
+        The layered environment.
+    """
+    maps: list[Any] = [{}]
+    for layer in (*reversed(layers), env):
+        candidates: list[Any]
+        if isinstance(layer, ChainMap):
+            candidates = layer.maps
+        else:
+            # Plain layers are small, snapshot them like merge_dicts did.
+            candidates = [layer if layer is env else dict(layer)]
+        # Skip empty layers and layers already present with a higher priority.
+        maps.extend(m for m in candidates if m and all(m is not n for n in maps))
+    return ChainMap(*maps)
+
+
+def validate_parallel_cmd_args(cmd_args, suites=()):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201
+    """Prevents use of options incompatible with parallel mode.
+
+    Args:
+        cmd_args: The arguments of the command.
+        suites: The suites of the scenarios selected to run together.
+    """
     if cmd_args.get("parallel") and cmd_args.get("destroy") == "never":
         msg = 'Combining "--parallel" and "--destroy=never" is not supported'
         sysexit_with_message(msg)
+    if cmd_args.get("jobs", 1) > 1 and cmd_args.get("destroy") == "never":
+        msg = 'Combining "--jobs" and "--destroy=never" is not supported'
+        sysexit_with_message(msg)
+    if suites and (cmd_args.get("pipeline") or cmd_args.get("jobs", 1) > 1):
+        option = "--pipeline" if cmd_args.get("pipeline") else "--jobs"
+        msg = (
+            f'Combining "{option}" and scenarios of suites ({", ".join(sorted(set(suites)))}) '
+            "is not supported, run them without it or select a single scenario"
+        )
+        sysexit_with_message(msg)
 
 
 def _parallelize_platforms(config, run_uuid):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN202
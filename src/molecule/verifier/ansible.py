@@ -23,7 +23,7 @@ import logging
 import os
 
 from molecule import util
-from molecule.api import Verifier  # type: ignore[attr-defined]
+from molecule.api import Verifier
 
 
 log = logging.getLogger(__name__)
@@ -69,8 +69,7 @@ class Ansible(Verifier):
 
     @property
     def default_env(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        env = util.merge_dicts(os.environ, self._config.env)
-        return util.merge_dicts(env, self._config.provisioner.env)
+        return util.overlay_env(os.environ, self._config.env, self._config.provisioner.env)
 
     def execute(self, action_args=None):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, D102
         if not self.enabled:
@@ -20,7 +20,6 @@
 """Verifier Base Module."""
 
 import abc
-import os
 
 from molecule import util
 
@@ -78,10 +77,7 @@ class Verifier:
 
     @property
     def directory(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return os.path.join(  # noqa: PTH118
-            self._config.scenario.directory,
-            self._config.config["verifier"].get("directory", "tests"),
-        )
+        return self._config.layout.verifier_directory
 
     @property
     def options(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -92,7 +88,7 @@ class Verifier:
 
     @property
     def env(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        return util.merge_dicts(
+        return util.overlay_env(
             self.default_env,
             self._config.config["verifier"]["env"],
         )
@@ -23,8 +23,8 @@ import glob
 import logging
 import os
 
-from molecule import util
-from molecule.api import Verifier  # type: ignore[attr-defined]
+from molecule import gitignore, util
+from molecule.api import Verifier
 
 
 LOG = logging.getLogger(__name__)
@@ -128,10 +128,7 @@ class Testinfra(Verifier):
 
     @property
     def default_env(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
-        env = util.merge_dicts(os.environ, self._config.env)
-        env = util.merge_dicts(env, self._config.provisioner.env)
-
-        return env  # noqa: RET504
+        return util.overlay_env(os.environ, self._config.env, self._config.provisioner.env)
 
     @property
     def additional_files_or_dirs(self):  # type: ignore[no-untyped-def]  # noqa: ANN201, D102
@@ -194,28 +191,35 @@ class Testinfra(Verifier):
     def _get_tests(self, action_args=None):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN202
         """Walk the verifier's directory for tests and returns a list.
 
+        Tests ignored by git, e.g. in a virtualenv below the directory, are
+        skipped.
+
         Returns:
             list
         """
         if action_args:
             tests = []
             for arg in action_args:
+                directory = os.path.join(self._config.scenario.directory, arg)  # noqa: PTH118
                 args_tests = list(
                     util.os_walk(  # type: ignore[no-untyped-call]
-                        os.path.join(self._config.scenario.directory, arg),  # noqa: PTH118
+                        directory,
                         "test_*.py",
                         followlinks=True,
                     ),
                 )
-                tests.extend(args_tests)
+                tests.extend(gitignore.filter_ignored(args_tests, root=directory))
             return sorted(tests)
         return sorted(
-            list(
-                util.os_walk(  # type: ignore[no-untyped-call]
-                    self.directory,
-                    "test_*.py",
-                    followlinks=True,
+            gitignore.filter_ignored(
+                list(
+                    util.os_walk(  # type: ignore[no-untyped-call]
+                        self.directory,
+                        "test_*.py",
+                        followlinks=True,
+                    ),
                 ),
+                root=self.directory,
             )
             + self.additional_files_or_dirs,
         )
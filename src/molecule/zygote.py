@@ -0,0 +1,469 @@
+"""Ansible Zygote Module."""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib
+import json
+import logging
+import os
+import random
+import selectors
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Zygotes import this module before Ansible, so it only imports the
+# standard library and the modules of Molecule which do too, and Ansible
+# where started zygotes use it.
+from molecule import daemon, forking
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+LOG = logging.getLogger(__name__)
+# Modules imported by ansible-playbook, besides the ones its module imports.
+WARM_IMPORTS = (
+    "ansible.cli.playbook",
+    "ansible.executor.playbook_executor",
+    "ansible.executor.task_queue_manager",
+    "ansible.inventory.manager",
+    "ansible.parsing.dataloader",
+    "ansible.playbook",
+    "ansible.plugins.callback.default",
+    "ansible.plugins.connection.local",
+    "ansible.plugins.connection.ssh",
+    "ansible.plugins.inventory",
+    "ansible.plugins.loader",
+    "ansible.plugins.shell.sh",
+    "ansible.plugins.strategy.linear",
+    "ansible.template",
+    "ansible.vars.manager",
+)
+MAX_ZYGOTES = 4
+
+# Zygotes by runtime key, None for the environments running new processes.
+_zygotes: dict[str, Zygote | None] = {}
+_lock = threading.Lock()
+
+
+def run(
+    cmd: list[str],
+    env: Mapping[str, str],
+    cwd: str | None,
+    version: str,
+) -> subprocess.CompletedProcess[str] | None:
+    """Run ``ansible-playbook`` in a child of a zygote.
+
+    Args:
+        cmd: The command, starting with ``ansible-playbook``.
+        env: Environment of the command.
+        cwd: Working directory of the command, the current one by default.
+        version: Version of the Ansible found on the ``PATH``.
+
+    Returns:
+        The completed run, or ``None`` when it needs to run in a new process.
+    """
+    if not cmd or Path(cmd[0]).name != "ansible-playbook":
+        return None
+    executable = shutil.which(cmd[0], path=env.get("PATH"))
+    if executable is None:
+        return None
+    cwd = str(Path(cwd).absolute() if cwd else Path.cwd())
+    key = daemon.runtime_key(cwd, env)
+
+    with _lock:
+        zygote = _zygotes.get(key)
+        if key not in _zygotes or (zygote and not zygote.alive()):
+            if len(_zygotes) >= MAX_ZYGOTES:
+                evicted = _zygotes.pop(next(iter(_zygotes)))
+                if evicted:
+                    evicted.close()
+            zygote = _zygotes[key] = _start(_interpreter(executable, env), cwd, env, version)
+    if zygote is None:
+        return None
+    return zygote.run(cmd, [executable, *cmd[1:]], env, cwd)
+
+
+@atexit.register
+def close() -> None:
+    """Stop the zygotes."""
+    with _lock:
+        for zygote in _zygotes.values():
+            if zygote:
+                zygote.close()
+        _zygotes.clear()
+
+
+def _interpreter(executable: str, env: Mapping[str, str]) -> str:
+    """Return the Python interpreter of ansible-playbook, from its shebang, or the current one."""
+    line = b""
+    with contextlib.suppress(OSError), Path(executable).open("rb") as stream:
+        line = stream.readline(256)
+    command = line[2:].decode(errors="replace").split() if line.startswith(b"#!") else []
+    if command and Path(command[0]).name == "env":
+        command = command[1:2]
+    if not command or not Path(command[0]).name.startswith("python"):
+        return sys.executable
+    return shutil.which(command[0], path=env.get("PATH")) or sys.executable
+
+
+def _start(
+    interpreter: str,
+    cwd: str,
+    env: Mapping[str, str],
+    version: str,
+) -> Zygote | None:
+    """Start a zygote, unless it does not import the expected Ansible version."""
+    zygote = Zygote(interpreter, cwd, env)
+    if zygote.version == version:
+        return zygote
+    if zygote.version is None:
+        LOG.warning(
+            "Running ansible-playbook instead of forking it, as no zygote could start with %s: %s",
+            interpreter,
+            zygote.reason,
+        )
+    else:
+        LOG.warning(
+            "Running ansible-playbook instead of forking it, as the zygote imports "
+            "Ansible %s from %s instead of %s.",
+            zygote.version,
+            interpreter,
+            version,
+        )
+    zygote.close()
+    return None
+
+
+class Zygote:
+    """Process forking the ``ansible-playbook`` runs of an environment."""
+
+    def __init__(self, interpreter: str, cwd: str, env: Mapping[str, str]) -> None:
+        """Start a zygote, and wait for it to import Ansible.
+
+        Args:
+            interpreter: The Python interpreter of ``ansible-playbook``.
+            cwd: The working directory of its runs.
+            env: The environment of its runs.
+        """
+        self.version: str | None = None
+        # Why the zygote could not start, when it did not.
+        self.reason = ""
+        self._directory = tempfile.mkdtemp(prefix="molecule-zygote-")
+        self.path = str(Path(self._directory) / "socket")
+        # Output Ansible printed while being imported, by stream.
+        self._imported = {"stdout": "", "stderr": ""}
+        # The zygote exits once its standard input is closed.
+        with tempfile.TemporaryFile() as errors:
+            self._process = subprocess.Popen(  # noqa: S603
+                [interpreter, "-m", __name__, self.path],
+                cwd=cwd,
+                env=dict(env),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=errors,
+            )
+            ready = self._ready()
+            if ready is None:
+                errors.seek(0)
+                lines = errors.read().decode(errors="replace").strip().splitlines()
+                self.reason = lines[-1] if lines else "it exited before importing Ansible"
+                return
+        self._imported = {name: str(ready.get(name, "")) for name in self._imported}
+        self.version = ready.get("version")
+        if self.version is None:
+            self.reason = "Ansible could not be imported"
+
+    def _ready(self) -> dict[str, Any] | None:
+        """Return what the zygote reports once it imported Ansible, None when it failed."""
+        if self._process.stdout is None:
+            return None
+        with self._process.stdout:
+            line = self._process.stdout.readline()
+        with contextlib.suppress(ValueError):
+            ready = json.loads(line)
+            if isinstance(ready, dict):
+                return ready
+        return None
+
+    def alive(self) -> bool:
+        """Return whether the zygote is running."""
+        return self._process.poll() is None
+
+    def run(
+        self,
+        cmd: list[str],
+        argv: list[str],
+        env: Mapping[str, str],
+        cwd: str,
+    ) -> subprocess.CompletedProcess[str] | None:
+        """Run ``ansible-playbook`` in a child of the zygote.
+
+        Args:
+            cmd: The command, as given.
+            argv: The argument list of the child, starting with the path of
+                ``ansible-playbook``.
+            env: Environment of the child.
+            cwd: Working directory of the child.
+
+        Returns:
+            The completed run, or ``None`` when the zygote could not start it.
+        """
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        request = {"argv": argv, "cwd": cwd, "env": dict(env)}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(self.path)
+                socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], [0, out_w, err_w])
+            except OSError as e:
+                LOG.debug("Unable to reach the zygote: %s", e)
+                forking.close([out_r, err_r])
+                return None
+            finally:
+                forking.close([out_w, err_w])
+            out, err = _tee((out_r, err_r), (self._imported["stdout"], self._imported["stderr"]))
+            returncode = _wait(sock)
+
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=returncode,
+            stdout=os.linesep.join(out) + os.linesep if out else "",
+            stderr=os.linesep.join(err) + os.linesep if err else "",
+        )
+
+    def close(self) -> None:
+        """Stop the zygote, letting the runs it started finish."""
+        if self._process.stdin:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+def _tee(pipes: tuple[int, int], imported: tuple[str, str]) -> tuple[list[str], list[str]]:
+    """Print the lines of the output of a run as they come, like subprocess_tee.
+
+    Args:
+        pipes: Read ends of the stdout and stderr pipes of the run.
+        imported: Output Ansible printed on stdout and stderr while being
+            imported, which a new process would have printed first.
+
+    Returns:
+        The lines of stdout and of stderr.
+    """
+    lines: dict[int, list[str]] = {fd: [] for fd in pipes}
+    pending = dict.fromkeys(pipes, b"")
+
+    def feed(fd: int, data: bytes) -> None:
+        *complete, pending[fd] = (pending[fd] + data).split(b"\n")
+        for line in complete:
+            emit(fd, line)
+
+    def emit(fd: int, line: bytes) -> None:
+        text = line.decode("utf-8").rstrip()
+        lines[fd].append(text)
+        print(text)  # noqa: T201
+
+    for fd, output in zip(pipes, imported, strict=True):
+        feed(fd, output.encode())
+    with selectors.DefaultSelector() as selector:
+        for fd in pipes:
+            selector.register(fd, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                data = os.read(key.fd, 65536)
+                if data:
+                    feed(key.fd, data)
+                    continue
+                selector.unregister(key.fd)
+                os.close(key.fd)
+                if pending[key.fd]:
+                    emit(key.fd, pending[key.fd])
+    return lines[pipes[0]], lines[pipes[1]]
+
+
+def _wait(sock: socket.socket) -> int:
+    """Return the exit code of a run, once the zygote reports it."""
+    for line in sock.makefile("r"):
+        status, _, value = line.strip().partition(" ")
+        if status == "exit":
+            return int(value)
+    LOG.warning("The zygote stopped while running ansible-playbook.")
+    return 1
+
+
+def serve(path: str) -> None:
+    """Import Ansible, then fork the runs requested on a socket until stdin closes.
+
+    Args:
+        path: Path of the socket to listen on.
+    """
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    ready = os.dup(1)
+    imported = _warm()
+    with os.fdopen(ready, "w") as stream:
+        stream.write(json.dumps(imported) + "\n")
+
+    # Interrupts go to the runs, which report being interrupted.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    wakeup = os.pipe()
+    for fd in wakeup:
+        os.set_blocking(fd, False)
+    signal.set_wakeup_fd(wakeup[1])
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+    children: dict[int, socket.socket] = {}
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+    selector.register(wakeup[0], selectors.EVENT_READ)
+    selector.register(0, selectors.EVENT_READ)
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is server:
+                _fork(server, wakeup, children)
+            elif key.fd == 0:
+                if not os.read(0, 512):
+                    return
+            else:
+                with contextlib.suppress(BlockingIOError):
+                    while os.read(wakeup[0], 512):
+                        pass
+        for pid, conn in list(children.items()):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                with contextlib.suppress(OSError):
+                    conn.sendall(f"exit {os.waitstatus_to_exitcode(status)}\n".encode())
+                conn.close()
+                del children[pid]
+
+
+def _fork(
+    server: socket.socket,
+    wakeup: tuple[int, int],
+    children: dict[int, socket.socket],
+) -> None:
+    """Fork the run requested by the next client, keeping its connection by pid."""
+    conn, _ = server.accept()
+    try:
+        request, fds = forking.receive(conn)
+    except (OSError, ValueError):
+        conn.close()
+        return
+    pid = os.fork()
+    if not pid:
+        signal.set_wakeup_fd(-1)
+        forking.close(list(wakeup))
+        for sock in (server, conn, *children.values()):
+            sock.close()
+        _run(request, fds)
+    forking.close(fds)
+    children[pid] = conn
+
+
+def _warm() -> dict[str, str]:
+    """Import Ansible, keeping what it prints meanwhile, then silence the zygote.
+
+    Returns:
+        The version of Ansible and the output it printed, by stream.
+    """
+    imported = {}
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        for name in WARM_IMPORTS:
+            with contextlib.suppress(ImportError):
+                importlib.import_module(name)
+        with contextlib.suppress(ImportError):
+            imported["version"] = importlib.import_module("ansible.release").__version__
+            _release_local_tmp()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        os.close(devnull)
+        for name, output in (("stdout", out), ("stderr", err)):
+            output.seek(0)
+            imported[name] = output.read().decode("utf-8", errors="replace")
+    return imported
+
+
+def _release_local_tmp() -> None:
+    """Remove the local temporary directory Ansible created for the zygote.
+
+    Every run creates its own, named after its process id, and removes it
+    on exit, as a new ``ansible-playbook`` process does.
+    """
+    from ansible import constants  # type: ignore[import-untyped]  # noqa: PLC0415
+    from ansible.utils.path import cleanup_tmp_file  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    atexit.unregister(cleanup_tmp_file)
+    shutil.rmtree(constants.DEFAULT_LOCAL_TMP, ignore_errors=True)
+
+
+def _renew_local_tmp() -> None:
+    """Give a run its own local temporary directory, see _release_local_tmp."""
+    from ansible import constants  # noqa: PLC0415
+
+    constants.DEFAULT_LOCAL_TMP = constants.config.get_config_value("DEFAULT_LOCAL_TMP")
+
+
+def _run(request: dict[str, Any], fds: list[int]) -> None:
+    """Run ansible-playbook in a child of the zygote, then exit with its code."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    forking.attach(fds)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.argv = list(request["argv"])
+    random.seed()
+
+    code = 1
+    try:
+        from ansible.cli.playbook import (  # type: ignore[import-untyped]  # noqa: PLC0415
+            main as playbook_main,
+        )
+
+        _renew_local_tmp()
+        playbook_main()
+        code = 0
+    except SystemExit as e:
+        code = forking.exit_code(e)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(Exception):
+            atexit._run_exitfuncs()  # noqa: SLF001
+        with contextlib.suppress(Exception):
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(code)
+
+
+def main() -> None:
+    """Run a zygote on the socket given as argument."""
+    serve(sys.argv[1])
+
+
+if __name__ == "__main__":
+    main()
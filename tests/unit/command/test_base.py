@@ -20,15 +20,17 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from molecule import config, util
 from molecule.command import base
+from molecule.scheduler import ScenarioResult
 
 
 if TYPE_CHECKING:
@@ -347,6 +349,80 @@ def test_execute_cmdline_scenarios_exit_nodestroy(
     assert not patched_sysexit.called
 
 
+@pytest.mark.usefixtures("config_instance")
+def test_execute_cmdline_scenarios_jobs(
+    mocker: MockerFixture,
+    patched_execute_scenario: MagicMock,
+    patched_sysexit: MagicMock,
+) -> None:
+    """Ensure scenarios are handed to the scheduler when jobs is greater than one.
+
+    - the scheduler receives the selected scenarios in parallel mode
+    - the scenarios are not executed in the current process
+    - a failed scenario results in a non-zero exit
+
+    Args:
+        mocker: pytest mocker fixture.
+        patched_execute_scenario: Mocked execute_scenario function.
+        patched_sysexit: Mocked util.sysexit function.
+    """
+    mocker.patch("molecule.command.base._prerun")
+    patched_run_scenarios = mocker.patch("molecule.scheduler.run_scenarios")
+    patched_run_scenarios.return_value = [ScenarioResult("default", 2, 1.0)]
+    command_args = {"destroy": "always", "subcommand": "test", "jobs": 2}
+
+    base.execute_cmdline_scenarios(None, {}, command_args)
+
+    scenarios, jobs, _, scheduled_command_args, _ = patched_run_scenarios.call_args[0]
+    assert [s.name for s in scenarios] == ["default"]
+    assert jobs == 2  # noqa: PLR2004
+    assert scheduled_command_args["parallel"]
+    assert patched_run_scenarios.call_args[1] == {"execute": base.execute_cmdline_scenario}
+    assert not patched_execute_scenario.called
+    patched_sysexit.assert_called_once_with(2)
+
+
+@pytest.mark.parametrize(
+    ("command_args", "option"),
+    (({"jobs": 2}, "--jobs"), ({"jobs": 1, "pipeline": True}, "--pipeline")),
+)
+def test_execute_scenarios_refuses_suites(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+    command_args: dict[str, Any],
+    option: str,
+) -> None:
+    """Ensure scenarios of suites are not run concurrently.
+
+    - suites only share instances between scenarios run one after the other
+    - a single selected scenario runs without its suite
+
+    Args:
+        mocker: pytest mocker fixture.
+        caplog: pytest log capture fixture.
+        command_args: Arguments of the command.
+        option: Option running the scenarios concurrently.
+    """
+    patched_concurrently = mocker.patch("molecule.command.base._execute_concurrently")
+    patched_pipelined = mocker.patch("molecule.command.base._execute_pipelined")
+    scenario = mocker.Mock()
+    scenario.name = "default"
+    scenario.suite = "debian"
+    scenario.sequence = ["create", "destroy"]
+    scenario.config.is_parallel = False
+
+    with pytest.raises(SystemExit):
+        base.execute_scenarios([scenario], None, {}, command_args)  # type: ignore[arg-type]
+
+    assert f'Combining "{option}" and scenarios of suites (debian)' in caplog.text
+    assert not patched_concurrently.called
+    assert not patched_pipelined.called
+
+    base.execute_scenarios([scenario], "default", {}, command_args)  # type: ignore[arg-type]
+
+    assert patched_concurrently.called or patched_pipelined.called
+
+
 def test_execute_subcommand(config_instance: config.Config) -> None:
     """Ensure execute_subcommand runs normally.
 
@@ -374,6 +450,7 @@ def test_execute_scenario(mocker: MockerFixture, patched_execute_subcommand: Mag
     """
     scenario = mocker.Mock()
     scenario.sequence = ("a", "b", "c")
+    scenario.config.command_args = {}
 
     base.execute_scenario(scenario)
 
@@ -397,6 +474,7 @@ def test_execute_scenario_destroy(
     """
     scenario = mocker.Mock()
     scenario.sequence = ("a", "b", "destroy", "c")
+    scenario.config.command_args = {}
 
     base.execute_scenario(scenario)
 
@@ -404,6 +482,98 @@ def test_execute_scenario_destroy(
     assert scenario.prune.called
 
 
+@pytest.mark.parametrize("destroy", ("always", "never"))
+def test_execute_pipelined_failure(
+    mocker: MockerFixture,
+    patched_execute_subcommand: MagicMock,
+    destroy: str,
+) -> None:
+    """Ensure a failed pipelined action stops the plan.
+
+    - call spoofed scenarios whose converge fails
+    - finished scenarios are pruned, interrupted ones are cleaned up and
+      destroyed with --destroy=always only, before their lock is released
+
+    Args:
+        mocker: pytest mocker fixture.
+        patched_execute_subcommand: Mocked execute_subcommand function.
+        destroy: The destroy strategy.
+    """
+    mocker.patch("molecule.command.base._prerun")
+    patched_sysexit = mocker.patch("molecule.util.sysexit", side_effect=SystemExit)
+    scenarios = []
+    for name in ("a", "b"):
+        scenario = mocker.Mock()
+        scenario.name = name
+        scenario.sequence = ["syntax", "converge", "destroy"]
+        scenario.config.is_parallel = False
+        scenarios.append(scenario)
+
+    def execute_subcommand(c: object, action: str) -> None:
+        if c is scenarios[1].config and action == "converge":
+            raise SystemExit(2)
+        if action == "cleanup":
+            assert not scenarios[1].release_lock.called
+
+    patched_execute_subcommand.side_effect = execute_subcommand
+
+    with pytest.raises(SystemExit):
+        base._execute_pipelined(scenarios, {"destroy": destroy})
+
+    assert scenarios[0].prune.called
+    assert all(scenario.release_lock.called for scenario in scenarios)
+    cleaned_up = [c.args for c in patched_execute_subcommand.call_args_list[-2:]]
+    if destroy == "always":
+        assert cleaned_up == [(scenarios[1].config, "cleanup"), (scenarios[1].config, "destroy")]
+        patched_sysexit.assert_called_once_with()
+    else:
+        assert (scenarios[1].config, "cleanup") not in cleaned_up
+        patched_sysexit.assert_called_once_with(2)
+
+
+def test_execute_cmdline_suite(
+    mocker: MockerFixture,
+    patched_execute_subcommand: MagicMock,
+) -> None:
+    """Ensure scenarios of a suite run on instances created once.
+
+    - the first scenario runs the setup and the teardown
+    - the second one only runs the setup actions not touching instances
+
+    Args:
+        mocker: pytest mocker fixture.
+        patched_execute_subcommand: Mocked execute_subcommand function.
+    """
+    borrow = mocker.patch("molecule.suite.borrow", return_value=contextlib.nullcontext())
+    members = []
+    for name in ("a", "b"):
+        scenario = mocker.Mock()
+        scenario.name = name
+        scenario.sequence = ["dependency", "create", "converge", "verify", "destroy"]
+        members.append(scenario)
+
+    base.execute_cmdline_suite(members, {"destroy": "always"})
+
+    calls = [(c.args[0], c.args[1]) for c in patched_execute_subcommand.call_args_list]
+    a, b = members[0].config, members[1].config
+    assert calls == [
+        (a, "dependency"),
+        (a, "create"),
+        (a, "converge"),
+        (a, "verify"),
+        (b, "dependency"),
+        (b, "converge"),
+        (b, "verify"),
+        (a, "destroy"),
+    ]
+    assert [c.args for c in borrow.call_args_list] == [
+        (members[0], members[0]),
+        (members[0], members[1]),
+    ]
+    assert members[0].prune.called
+    assert members[1].prune.called
+
+
 def test_get_configs(config_instance: config.Config) -> None:
     """Ensure get_configs returns a list of config.Config instances.
 
@@ -420,6 +590,24 @@ def test_get_configs(config_instance: config.Config) -> None:
     assert isinstance(result[0], config.Config)
 
 
+def test_get_scenario_index(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Ensure get_scenario_index indexes scenarios without building configs.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Mocked config_instance fixture.
+    """
+    molecule_file = config_instance.molecule_file
+    util.write_file(molecule_file, util.safe_dump(config_instance.config))
+    patched_config = mocker.patch("molecule.config.Config")
+
+    result = base.get_scenario_index({}, {"subcommand": "test"}, ("-v",))
+
+    assert [(e.name, e.molecule_file) for e in result] == [("default", molecule_file)]
+    assert result[0].ansible_args == ("-v",)
+    assert not patched_config.called
+
+
 def test_verify_configs(config_instance: config.Config) -> None:
     """Ensure verify_configs runs normally and does not raise.
 
@@ -500,3 +688,32 @@ def test_command_completion(shell: str) -> None:
     else:
         assert result.returncode == 0
         assert "Found config file" not in result.stdout
+
+
+def test_execute_scenario_destroy_background(
+    mocker: MockerFixture,
+    patched_execute_subcommand: MagicMock,
+) -> None:
+    """Ensure the final destroy is handed to a reaper and awaited by the barrier.
+
+    Args:
+        mocker: pytest mocker fixture.
+        patched_execute_subcommand: Mocked execute_subcommand function.
+    """
+    reapers = mocker.patch("molecule.scheduler.REAPERS")
+    reapers.wait.return_value = [ScenarioResult("default", 2, 1.0)]
+    scenario = mocker.Mock()
+    scenario.sequence = ["destroy", "create", "destroy"]
+    scenario.config.command_args = {"destroy": "background"}
+
+    base.execute_scenario(scenario)
+
+    assert [c.args[1] for c in patched_execute_subcommand.call_args_list] == [
+        "destroy",
+        "create",
+    ]
+    reapers.start.assert_called_once_with(scenario, base._destroy_scenario)
+    assert not scenario.prune.called
+    with pytest.raises(SystemExit) as e:
+        base._await_reapers()
+    assert e.value.code == 2  # noqa: PLR2004
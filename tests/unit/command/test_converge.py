@@ -18,6 +18,7 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
 
@@ -26,7 +27,7 @@ from pytest import LogCaptureFixture  # noqa: PT013
 from pytest_mock import MockerFixture
 
 from molecule import config
-from molecule.command import converge
+from molecule.command import converge, side_effect
 from molecule.shell import main
 
 
@@ -51,17 +52,116 @@ def test_converge_execute(  # noqa: D103
     assert config_instance.state.converged
 
 
-def test_ansible_args_passed_to_scenarios_get_configs(mocker: MockerFixture) -> None:  # noqa: D103
-    # Scenarios patch is needed to safely invoke CliRunner
+def test_ansible_args_passed_to_scenarios_select_scenarios(mocker: MockerFixture) -> None:  # noqa: D103
+    # The selection patch is needed to safely invoke CliRunner
     # in the test environment and block scenario execution
-    mocker.patch("molecule.scenarios.Scenarios")
-    patched_get_configs = mocker.patch("molecule.command.base.get_configs")
+    mocker.patch(
+        "molecule.command.base._find_scenario_files",
+        return_value=["/role/molecule/default/molecule.yml"],
+    )
+    patched_select_scenarios = mocker.patch("molecule.command.base.select_scenarios")
 
     runner = CliRunner()
     args = ("converge", "--", "-e", "testvar=testvalue")
     ansible_args = args[2:]
     runner.invoke(main, args, obj={})
 
-    # call index [0][2] is the 3rd positional argument to get_configs,
+    # call index [0][4] is the 5th positional argument to select_scenarios,
     # which should be the tuple of parsed ansible_args from the CLI
-    assert patched_get_configs.call_args[0][2] == ansible_args
+    assert patched_select_scenarios.call_args[0][4] == ansible_args
+
+
+def test_converge_execute_skip_unchanged(
+    patched_ansible_converge: Mock,
+    config_instance: config.Config,
+) -> None:
+    """Converge only runs again once its inputs changed.
+
+    Args:
+        patched_ansible_converge: Mocked Ansible.converge method.
+        config_instance: Molecule config.
+    """
+    config_instance.command_args["skip_unchanged"] = True
+    playbook = Path(config_instance.scenario.directory, "converge.yml")
+
+    converge.Converge(config_instance).execute()
+    converge.Converge(config_instance).execute()
+
+    patched_ansible_converge.assert_called_once_with(cli_args={})
+
+    playbook.write_text("---\n- hosts: all\n")
+    converge.Converge(config_instance).execute()
+
+    assert patched_ansible_converge.call_count == 2  # noqa: PLR2004
+
+
+def test_converge_execute_skip_unchanged_after_other_changes(
+    mocker: MockerFixture,
+    patched_ansible_converge: Mock,
+    config_instance: config.Config,
+) -> None:
+    """Converges and side effects not recording their inputs invalidate the recorded ones.
+
+    Args:
+        mocker: pytest mocker fixture.
+        patched_ansible_converge: Mocked Ansible.converge method.
+        config_instance: Molecule config.
+    """
+    patched_side_effect = mocker.patch("molecule.provisioner.ansible.Ansible.side_effect")
+    playbook = Path(config_instance.scenario.directory, "converge.yml")
+    playbook.write_text("---\n")
+    Path(config_instance.scenario.directory, "side_effect.yml").write_text("---\n")
+    config_instance.command_args["skip_unchanged"] = True
+    converge.Converge(config_instance).execute()
+
+    # A plain converge of an edited playbook, which is then reverted.
+    playbook.write_text("---\n- hosts: all\n")
+    config_instance.command_args["skip_unchanged"] = False
+    converge.Converge(config_instance).execute()
+    playbook.write_text("---\n")
+    config_instance.command_args["skip_unchanged"] = True
+    converge.Converge(config_instance).execute()
+
+    assert patched_ansible_converge.call_count == 3  # noqa: PLR2004
+
+    side_effect.SideEffect(config_instance).execute()  # type: ignore[no-untyped-call]
+    converge.Converge(config_instance).execute()
+
+    patched_side_effect.assert_called_once()
+    assert patched_ansible_converge.call_count == 4  # noqa: PLR2004
+
+
+def test_converge_execute_scoped(
+    patched_ansible_converge: Mock,
+    config_instance: config.Config,
+) -> None:
+    """Converge is restricted to the scopes which changed.
+
+    Args:
+        patched_ansible_converge: Mocked Ansible.converge method.
+        config_instance: Molecule config.
+    """
+    config_instance.command_args["skip_unchanged"] = True
+    config_instance.config["provisioner"]["converge_scopes"] = [
+        {"path": "roles/web", "tags": ["web"], "limit": "webservers"},
+        {"path": "roles/db", "tags": ["db"]},
+    ]
+    web = Path(config_instance.project_directory, "roles", "web", "tasks", "main.yml")
+    db = Path(config_instance.project_directory, "roles", "db", "tasks", "main.yml")
+    for tasks in (web, db):
+        tasks.parent.mkdir(parents=True)
+        tasks.write_text("---\n")
+    converge.Converge(config_instance).execute()
+
+    web.write_text("---\n- name: Changed\n")
+    converge.Converge(config_instance).execute()
+
+    patched_ansible_converge.assert_called_with(
+        cli_args={"tags": "web", "limit": "webservers"},
+    )
+
+    web.write_text("---\n")
+    db.write_text("---\n- name: Changed\n")
+    converge.Converge(config_instance).execute()
+
+    patched_ansible_converge.assert_called_with(cli_args={"tags": "web,db"})
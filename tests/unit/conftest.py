@@ -104,6 +104,8 @@ def config_instance(
         return scenario_paths
 
     monkeypatch.setattr("molecule.command.base.filter_ignored_scenarios", _filter_ignored_scenarios)
+    # Keep the durations of runs along with the scenario rather than in the user cache.
+    monkeypatch.setenv("MOLECULE_DURATIONS_FILE", str(test_cache_path / "durations.json"))
 
     _environ = dict(os.environ)
     c = config.Config(str(molecule_file))
@@ -29,6 +29,7 @@ def _model_provisioner_section_data():  # type: ignore[no-untyped-def]  # noqa:
         "provisioner": {
             "name": "ansible",
             "log": True,
+            "platform_group_size": 1,
             "config_options": {"foo": "bar"},
             "connection_options": {"foo": "bar"},
             "options": {"foo": "bar"},
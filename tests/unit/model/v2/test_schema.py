@@ -18,6 +18,10 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import copy
+import json
+import os
+
 from pathlib import Path
 
 from molecule.model import schema_v3
@@ -28,6 +32,46 @@ def test_base_config(config):  # type: ignore[no-untyped-def]  # noqa: ANN001, A
     assert not schema_v3.validate(config)  # type: ignore[no-untyped-call]
 
 
+def test_validate_reports_all_errors(config):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, D103
+    config["provisioner"]["name"] = 0
+    config["verifier"]["name"] = 0
+
+    x = [
+        "0 is not one of ['ansible']",
+        "0 is not one of ['ansible', 'goss', 'inspec', 'testinfra']",
+    ]
+    assert x == schema_v3.validate(config)  # type: ignore[no-untyped-call]
+
+
+def test_validate_many(config):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, D103
+    invalid = copy.deepcopy(config)
+    invalid["scenario"]["name"] = 0
+
+    result = schema_v3.validate_many({"valid": config, "invalid": invalid})
+
+    assert result == {"invalid": ["0 is not of type 'string'"]}
+
+
+def test_get_validator_reloads_changed_schema(tmp_path: Path) -> None:
+    """Validators are shared until their schema file changes.
+
+    Args:
+        tmp_path: Pytest fixture for a temporary directory.
+    """
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "string"}))
+
+    validator = schema_v3.get_validator(str(schema_file))
+    assert validator is schema_v3.get_validator(str(schema_file))
+    assert not validator.is_valid(0)
+
+    schema_file.write_text(json.dumps({"type": "integer"}))
+    mtime = schema_file.stat().st_mtime_ns + 1
+    os.utime(schema_file, ns=(mtime, mtime))
+
+    assert schema_v3.get_validator(str(schema_file)).is_valid(0)
+
+
 def test_molecule_schema(resources_folder_path: Path) -> None:
     """Test the molecule schema.
 
@@ -0,0 +1,173 @@
+"""Unit tests for the platform fan-out of create and destroy."""
+
+from __future__ import annotations
+
+import os
+
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from molecule import util
+from molecule.command import create
+from molecule.provisioner import fanout
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+@pytest.fixture(autouse=True)
+def _playbooks(config_instance: config.Config) -> None:
+    for name in ("create.yml", "destroy.yml"):
+        util.write_file(os.path.join(config_instance.scenario.directory, name), "---\n")  # noqa: PTH118
+
+
+@pytest.fixture(name="_fanout_section_data")
+def fixture_fanout_section_data() -> dict[str, Any]:
+    """Provide three platforms, created one at a time.
+
+    Returns:
+        The config section data.
+    """
+    return {
+        "platforms": [{"name": "instance-1"}, {"name": "instance-2"}, {"name": "instance-3"}],
+        "provisioner": {"name": "ansible", "platform_group_size": 1},
+    }
+
+
+def _fake_create(failing: str | None = None) -> Callable[..., CompletedProcess[str]]:
+    """Return a run_command writing the instance config of its group.
+
+    Args:
+        failing: Name of an instance failing to be created.
+
+    Returns:
+        The fake run_command.
+    """
+
+    def run_command(cmd: list[str], env: dict[str, str], **_: Any) -> CompletedProcess[str]:  # noqa: ANN401
+        platforms = util.safe_load_file(env["MOLECULE_FILE"])["platforms"]
+        names = [platform["name"] for platform in platforms]
+        if failing in names:
+            return CompletedProcess(cmd, 2, stdout="")
+        util.write_file(
+            env["MOLECULE_INSTANCE_CONFIG"],
+            util.safe_dump([{"instance": name, "address": f"{name}.local"} for name in names]),
+        )
+        return CompletedProcess(cmd, 0, stdout="")
+
+    return run_command
+
+
+def test_split() -> None:
+    """Platforms are split into groups of the given size."""
+    platforms = [{"name": str(i)} for i in range(5)]
+
+    assert fanout.split(platforms, 2) == [platforms[0:2], platforms[2:4], platforms[4:]]
+
+
+def test_fan_out_without_group_size(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Playbooks run once for all platforms unless a group size is set.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config instance.
+    """
+    run = mocker.patch("molecule.provisioner.fanout.run")
+
+    assert fanout.group_size(config_instance) == 0
+    assert not fanout.fan_out(config_instance, "create.yml")
+    assert not run.called
+
+
+@pytest.mark.parametrize("config_instance", ["_fanout_section_data"], indirect=True)  # noqa: PT007
+def test_create_merges_instance_configs(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Every platform is created by a run of its own, merged in platform order.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config with three platforms.
+    """
+    run_command = mocker.patch("molecule.util.run_command", side_effect=_fake_create())
+    config_instance.action = "create"
+
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    assert run_command.call_count == 3  # noqa: PLR2004
+    assert [entry["instance"] for entry in _instance_config(config_instance)] == [
+        "instance-1",
+        "instance-2",
+        "instance-3",
+    ]
+    assert config_instance.state.created
+
+
+@pytest.mark.parametrize("config_instance", ["_fanout_section_data"], indirect=True)  # noqa: PT007
+def test_create_keeps_successful_runs(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Instances are not marked created when one run fails.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config with three platforms.
+    """
+    mocker.patch("molecule.util.run_command", side_effect=_fake_create(failing="instance-2"))
+    config_instance.action = "create"
+
+    with pytest.raises(SystemExit) as e:
+        create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    assert e.value.code == 2  # noqa: PLR2004
+    assert [entry["instance"] for entry in _instance_config(config_instance)] == [
+        "instance-1",
+        "instance-3",
+    ]
+    assert not config_instance.state.created
+
+
+@pytest.mark.parametrize("config_instance", ["_fanout_section_data"], indirect=True)  # noqa: PT007
+def test_destroy_sees_instance_config_of_its_group(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Destroy runs read the entries of their group and remove them.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config with three platforms.
+    """
+    mocker.patch("molecule.util.run_command", side_effect=_fake_create(failing="instance-2"))
+    config_instance.action = "create"
+    with pytest.raises(SystemExit):
+        config_instance.provisioner.create()
+
+    seen = []
+
+    def destroy(cmd: list[str], env: dict[str, str], **_: Any) -> CompletedProcess[str]:  # noqa: ANN401
+        path = env["MOLECULE_INSTANCE_CONFIG"]
+        seen.append(util.safe_load_file(path) if os.path.exists(path) else None)  # noqa: PTH110
+        util.write_file(path, "{}")
+        return CompletedProcess(cmd, 0, stdout="")
+
+    mocker.patch("molecule.util.run_command", side_effect=destroy)
+    config_instance.action = "destroy"
+    config_instance.provisioner.destroy()
+
+    assert sorted(entry[0]["instance"] for entry in seen if entry) == ["instance-1", "instance-3"]
+    assert _instance_config(config_instance) == []
+
+
+def _instance_config(config_instance: config.Config) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = util.safe_load_file(config_instance.driver.instance_config)
+    return entries or []
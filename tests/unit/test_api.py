@@ -19,20 +19,33 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-from molecule import api
+from __future__ import annotations
+
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import api, durations
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
 
 
 def test_api_molecule_drivers_as_attributes():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     results = api.drivers()
     assert hasattr(results, "default")
-    assert isinstance(results.default, api.Driver)  # type: ignore[attr-defined] # pylint:disable=no-member
+    assert isinstance(results.default, api.Driver)  # pylint:disable=no-member
 
 
 def test_api_drivers():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     results = api.drivers()
 
     for result in results:
-        assert isinstance(result, api.Driver)  # type: ignore[attr-defined]
+        assert isinstance(result, api.Driver)
 
     assert "default" in results
 
@@ -41,3 +54,100 @@ def test_api_verifiers():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     x = ["testinfra", "ansible"]
 
     assert all(elem in api.verifiers() for elem in x)
+
+
+RECAP = """
+PLAY RECAP *********************************************************************
+instance                   : ok=2    changed=1    unreachable=0    failed=0    skipped=0
+
+"""
+
+
+def test_api_run(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Actions are reported with their return codes and recap stats.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config.
+    """
+    mocker.patch("molecule.command.base._prerun")
+    mocker.patch(
+        "molecule.util.run_command",
+        side_effect=lambda cmd, **_: CompletedProcess(cmd, 0, stdout=RECAP),
+    )
+
+    result = api.run([config_instance.scenario.directory], "converge")
+
+    assert [action.action for action in result.actions] == [
+        "dependency",
+        "create",
+        "prepare",
+        "converge",
+    ]
+    assert result.returncode == 0
+    assert {stat.action: stat.runs for stat in durations.stats("default")} == {
+        "converge": 1,
+        "create": 1,
+        "dependency": 1,
+        "prepare": 1,
+    }
+    converge = result.scenario("default")[-1]
+    assert converge.stats == {
+        "instance": {
+            "ok": 2,
+            "changed": 1,
+            "unreachable": 0,
+            "failed": 0,
+            "skipped": 0,
+        },
+    }
+
+
+def test_api_run_action_error(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """A failed action raises an error instead of exiting.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config.
+    """
+    mocker.patch("molecule.command.base._prerun")
+    mocker.patch(
+        "molecule.util.run_command",
+        side_effect=lambda cmd, **_: CompletedProcess(cmd, 2, stdout=RECAP),
+    )
+
+    with pytest.raises(api.ActionError) as e:
+        api.run([config_instance.molecule_file], "converge")
+
+    assert e.value.code == 2  # noqa: PLR2004
+    assert e.value.action.action == "converge"
+    assert "Ansible return code was 2" in e.value.message
+    assert e.value.result.failed == [e.value.action]
+
+
+def test_api_run_config_error(config_instance: config.Config) -> None:
+    """Scenarios which cannot be selected raise an error instead of exiting.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    with pytest.raises(api.ConfigError):
+        api.run([], "test")
+
+    with pytest.raises(api.ConfigError) as e:
+        api.run([config_instance.molecule_file], "test", {"scenario_name": "missing"})
+
+    assert e.value.message == "Scenario 'missing' not found.  Exiting."
+
+
+def test_api_run_programming_error(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Errors other than the exits of Molecule are not turned into failed runs.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config.
+    """
+    mocker.patch("molecule.command.base.execute_scenarios", side_effect=KeyError("bug"))
+
+    with pytest.raises(KeyError):
+        api.run([config_instance.molecule_file], "converge")
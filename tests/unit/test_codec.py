@@ -0,0 +1,100 @@
+"""Unit tests for the YAML codec."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import yaml
+
+from molecule import codec
+from molecule.constants import MOLECULE_HEADER
+
+
+pytestmark = pytest.mark.skipif(
+    "libyaml" not in codec.BACKENDS,
+    reason="PyYAML is built without libyaml",
+)
+
+INVENTORY = {
+    "all": {
+        "hosts": {
+            f"instance-{i}": {
+                "ansible_host": f"10.0.0.{i}",
+                "ansible_port": 22,
+                "ansible_user": "molecule user",
+                "ansible_ssh_common_args": "-o 'StrictHostKeyChecking no'",
+                "weight": 0.5,
+                "enabled": True,
+                "extra": None,
+                "empty": "",
+                "nested": {"empty_list": [], "empty_dict": {}},
+            }
+            for i in range(3)
+        },
+    },
+    "ungrouped": {"vars": {}},
+}
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param(INVENTORY, id="inventory"),
+        pytest.param({"a": {"list": [1, {"b": [2, 3]}]}}, id="nested-sequence"),
+        pytest.param(["a", ["b", "c"], {"d": "e"}], id="sequence"),
+        pytest.param({"unicode": "ünï €", "tab": "a\tb"}, id="escaped"),
+        pytest.param({"text": "multi\nline", "long": "x " * 60}, id="folded"),
+        pytest.param({"": "empty key"}, id="empty-key"),
+        pytest.param("scalar", id="scalar"),
+    ),
+)
+def test_dump_is_identical_across_backends(data: Any) -> None:  # noqa: ANN401
+    """Both backends dump byte identical documents.
+
+    Args:
+        data: Data to dump.
+    """
+    expected = codec.dump(data, backend=codec.BACKENDS["python"])
+
+    assert codec.dump(data, backend=codec.BACKENDS["libyaml"]) == expected
+    assert codec.load(expected) == data
+
+
+def test_dump_indents_nested_sequences() -> None:
+    """Sequences nested in mappings are indented."""
+    assert codec.dump({"a": ["b"]}) == "---\na:\n  - b\n"
+
+
+def test_dump_state_is_yaml() -> None:
+    """The state file stays a YAML document, as older readers expect."""
+    data = {"created": True, "driver": None, "run_uuid": "x", "molecule_yml_date_modified": 1.5}
+    document = f"{MOLECULE_HEADER}\n\n{codec.dump(data)}"
+
+    assert document.startswith(f"{MOLECULE_HEADER}\n\n---\ncreated: true\n")
+    assert codec.load(document) == data
+    assert yaml.safe_load(document) == data
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    (
+        pytest.param("# comment\n\n[1, 2]\n", [1, 2], id="json"),
+        pytest.param("{a: b}\n", {"a": "b"}, id="yaml-flow"),
+        pytest.param("a:\n  - b\n", {"a": ["b"]}, id="yaml-block"),
+    ),
+)
+def test_load(document: str, expected: Any) -> None:  # noqa: ANN401
+    """JSON documents take the fast path, others are loaded as YAML.
+
+    Args:
+        document: Document to load.
+        expected: Loaded data.
+    """
+    assert codec.load(document) == expected
+
+
+def test_load_reports_python_loader_errors() -> None:
+    """Errors quote the offending line, as the pure Python loader does."""
+    with pytest.raises(yaml.scanner.ScannerError, match=r"\^"):
+        codec.load("a: b: c\n", backend=codec.BACKENDS["libyaml"])
@@ -20,11 +20,13 @@
 
 import os
 
+from typing import Any
+
 import pytest
 
 from pytest_mock import MockerFixture
 
-from molecule import config, platforms, scenario, state, util
+from molecule import config, interpolation, platforms, scenario, state, util
 from molecule.dependency import ansible_galaxy, shell
 from molecule.provisioner import ansible
 from molecule.verifier.ansible import Ansible as AnsibleVerifier
@@ -217,46 +219,51 @@ def test_reget_config(config_instance: config.Config):  # type: ignore[no-untype
     assert isinstance(config_instance._reget_config(), dict)  # type: ignore[no-untyped-call]
 
 
-def test_interpolate(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: $HOME"
-    x = f"foo: {os.environ['HOME']}"
+def test_reget_config_does_not_parse_again(  # noqa: D103
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    mocker.patch("molecule.config.MOLECULE_CONFIG_CACHE", new=False)
+    util.write_file(
+        config_instance.molecule_file,
+        util.safe_dump({"scenario": {"name": "${MOLECULE_SCENARIO_DIRECTORY}"}}),
+    )
+    document = mocker.spy(interpolation, "Document")
 
-    assert x == config_instance._interpolate(string, os.environ, "")
+    assert config_instance._get_config()["scenario"]["name"] == "$MOLECULE_SCENARIO_DIRECTORY"
+    result = config_instance._reget_config()  # type: ignore[no-untyped-call]
 
+    assert result["scenario"]["name"] == config_instance.scenario.directory
+    assert document.call_count == 1
 
-def test_interpolate_curly(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: ${HOME}"
-    x = f"foo: {os.environ['HOME']}"
 
-    assert x == config_instance._interpolate(string, os.environ, "")
+def _render(string: str) -> Any:  # noqa: ANN401
+    interpolator = interpolation.Interpolator(interpolation.TemplateWithDefaults, os.environ)
+    return interpolation.Document(string).render(interpolator)
 
 
-def test_interpolate_default(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: ${NONE-default}"
-    x = "foo: default"
+def test_interpolate():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: $HOME") == {"foo": os.environ["HOME"]}
 
-    assert x == config_instance._interpolate(string, os.environ, "")
 
+def test_interpolate_curly():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: ${HOME}") == {"foo": os.environ["HOME"]}
 
-def test_interpolate_default_colon(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: ${NONE:-default}"
-    x = "foo: default"
 
-    assert x == config_instance._interpolate(string, os.environ, "")
+def test_interpolate_default():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: ${NONE-default}") == {"foo": "default"}
 
 
-def test_interpolate_default_variable(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: ${NONE:-$HOME}"
-    x = f"foo: {os.environ['HOME']}"
+def test_interpolate_default_colon():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: ${NONE:-default}") == {"foo": "default"}
 
-    assert x == config_instance._interpolate(string, os.environ, "")
 
+def test_interpolate_default_variable():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: ${NONE:-$HOME}") == {"foo": os.environ["HOME"]}
 
-def test_interpolate_curly_default_variable(config_instance: config.Config):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
-    string = "foo: ${NONE-$HOME}"
-    x = f"foo: {os.environ['HOME']}"
 
-    assert x == config_instance._interpolate(string, os.environ, "")
+def test_interpolate_curly_default_variable():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    assert _render("foo: ${NONE-$HOME}") == {"foo": os.environ["HOME"]}
 
 
 def test_interpolate_raises_on_failed_interpolation(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
@@ -266,7 +273,7 @@ def test_interpolate_raises_on_failed_interpolation(  # type: ignore[no-untyped-
     string = "$6$8I5Cfmpr$kGZB"
 
     with pytest.raises(SystemExit) as e:
-        config_instance._interpolate(string, os.environ, "")
+        config_instance._render(config_instance.molecule_file, string, os.environ, None)
 
     assert e.value.code == 1
 
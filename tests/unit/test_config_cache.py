@@ -0,0 +1,109 @@
+"""Unit tests for the persistent config cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from molecule import config, config_cache
+from molecule.model import schema_v3
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from pytest_mock import MockerFixture
+
+
+def test_fingerprint_tracks_referenced_variables() -> None:
+    """Only variables referenced by the sources are part of the key."""
+    sources = [("molecule.yml", "driver:\n  name: ${DRIVER}\n")]
+
+    key = config_cache.fingerprint(sources, {"DRIVER": "default"}, None, None)
+
+    assert key == config_cache.fingerprint(
+        sources,
+        {"DRIVER": "default", "UNRELATED": "x"},
+        None,
+        None,
+    )
+    assert key != config_cache.fingerprint(sources, {"DRIVER": "podman"}, None, None)
+    assert key != config_cache.fingerprint(sources, {"DRIVER": "default"}, None, "MOLECULE_")
+
+
+def test_fingerprint_tracks_schemas(tmp_path: Path) -> None:
+    """Keys change along with the schemas configs are validated against.
+
+    Args:
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    sources = [("molecule.yml", "driver:\n  name: default\n")]
+    schema = tmp_path / "driver.json"
+    schema.write_text("{}")
+
+    key = config_cache.fingerprint(sources, {}, None, None, schemas=[str(schema)])
+
+    assert key == config_cache.fingerprint(sources, {}, None, None, schemas=[str(schema)])
+    assert key != config_cache.fingerprint(sources, {}, None, None)
+
+    schema.write_text('{"type": "object"}')
+
+    assert key != config_cache.fingerprint(sources, {}, None, None, schemas=[str(schema)])
+
+
+def test_store_and_load(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A stored config is returned only for the key it was stored with.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+
+    config_cache.store("molecule.yml", None, "key", {"driver": {"name": "default"}})
+
+    assert config_cache.load("molecule.yml", None, "key") == {"driver": {"name": "default"}}
+    assert config_cache.load("molecule.yml", None, "other") is None
+    assert config_cache.load("molecule.yml", "MOLECULE_", "key") is None
+
+
+def test_store_skips_lossy_configs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Configs changed by a JSON round trip are not cached.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+
+    config_cache.store("molecule.yml", None, "key", {"hosts": {1: "one"}})
+
+    assert config_cache.load("molecule.yml", None, "key") is None
+
+
+def test_warm_config_skips_validation(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    config_instance: config.Config,
+) -> None:
+    """A second config of an unchanged scenario is served from the cache.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest fixture for a temporary directory.
+        config_instance: Instance of a config.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+    validate = mocker.spy(schema_v3, "validate")
+
+    cold = config.Config(config_instance.molecule_file)
+    warm = config.Config(config_instance.molecule_file)
+
+    assert validate.call_count == 1
+    assert warm.config == cold.config
@@ -0,0 +1,99 @@
+"""Unit tests for the per-process shared config layer."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+from molecule import config, config_layer, util
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def _write_scenario(tmp_path: Path, name: str, content: str = "---\n") -> str:
+    path = tmp_path / "molecule" / name / "molecule.yml"
+    path.parent.mkdir(parents=True)
+    path.write_text(content)
+    return str(path)
+
+
+def test_base_layer_is_shared_by_scenarios(mocker: MockerFixture, tmp_path: Path) -> None:
+    """A base config is read and rendered once for all scenarios.
+
+    Args:
+        mocker: pytest mocker fixture.
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    base_config = tmp_path / "base.yml"
+    base_config.write_text("verifier:\n  name: testinfra\n")
+    render = mocker.spy(config_layer, "render")
+    args = {"base_config": [str(base_config)]}
+
+    first = config.Config(_write_scenario(tmp_path, "foo"), args=args)
+    second = config.Config(_write_scenario(tmp_path, "bar", "scenario:\n  name: baz\n"), args=args)
+
+    assert first.config["verifier"]["name"] == second.config["verifier"]["name"] == "testinfra"
+    assert first.config["scenario"]["name"] == "foo"
+    assert second.config["scenario"]["name"] == "baz"
+    assert {call.args[0] for call in render.call_args_list} == {str(base_config)}
+    # Once with the MOLECULE_ variables kept, once with them interpolated.
+    assert render.call_count == 2  # noqa: PLR2004
+
+    first.config["verifier"]["name"] = "changed"
+    assert config.Config(first.molecule_file, args=args).config["verifier"]["name"] == "testinfra"
+
+
+def test_base_layer_is_rendered_per_referenced_variable(tmp_path: Path) -> None:
+    """A base config referencing the scenario name is rendered per scenario.
+
+    Args:
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    base_config = tmp_path / "base.yml"
+    base_config.write_text("provisioner:\n  env:\n    LABEL: ${MOLECULE_SCENARIO_NAME}\n")
+    args = {"base_config": [str(base_config)]}
+
+    for name in ("foo", "bar"):
+        c = config.Config(_write_scenario(tmp_path, name), args=args)
+        assert c.config["provisioner"]["env"]["LABEL"] == name
+
+
+def test_base_layer_sets_scenario_name(tmp_path: Path) -> None:
+    """A scenario name set by a base config replaces the directory name.
+
+    Args:
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    base_config = tmp_path / "base.yml"
+    base_config.write_text("scenario:\n  name: base\n")
+
+    c = config.Config(_write_scenario(tmp_path, "foo"), args={"base_config": [str(base_config)]})
+
+    assert c.config["scenario"]["name"] == "base"
+
+
+def test_load_env_file_reloads_changed_file(mocker: MockerFixture, tmp_path: Path) -> None:
+    """The env file is only loaded again once it changed.
+
+    Args:
+        mocker: pytest mocker fixture.
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    env_file = tmp_path / ".env.yml"
+    env_file.write_text("FOO: bar\n")
+    safe_load_file = mocker.spy(util, "safe_load_file")
+
+    assert config.set_env_from_file({}, str(env_file)) == {"FOO": "bar"}
+    assert config.set_env_from_file({}, str(env_file)) == {"FOO": "bar"}
+    assert safe_load_file.call_count == 1
+
+    env_file.write_text("FOO: baz\n")
+    os.utime(env_file, ns=(1, 1))
+
+    assert config.set_env_from_file({}, str(env_file)) == {"FOO": "baz"}
+    assert safe_load_file.call_count == 2  # noqa: PLR2004
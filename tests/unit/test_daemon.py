@@ -0,0 +1,169 @@
+"""Unit tests for the daemon of Molecule commands."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import daemon
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(name="server")
+def fixture_server(tmp_path: Path) -> Iterator[str]:
+    """Run a daemon on a socket of the test.
+
+    Args:
+        tmp_path: pytest temporary directory.
+
+    Yields:
+        The path to the socket.
+    """
+    path = str(tmp_path / "daemon.sock")
+    with subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "molecule.server", path],
+        stdin=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ) as process:
+        deadline = time.monotonic() + 60
+        while not os.path.exists(path) and process.poll() is None:  # noqa: PTH110
+            assert time.monotonic() < deadline
+            time.sleep(0.1)
+        yield path
+        process.terminate()
+        process.wait()
+
+    assert not os.path.exists(path)  # noqa: PTH110
+
+
+def test_socket_path() -> None:
+    """The socket is given by the environment or is the one of the user."""
+    assert daemon.socket_path({"MOLECULE_DAEMON_SOCKET": "/x.sock"}) == "/x.sock"
+    assert daemon.socket_path({"XDG_RUNTIME_DIR": "/run/user"}) == os.path.join(  # noqa: PTH118
+        "/run/user",
+        "molecule",
+        f"daemon-{os.getuid()}.sock",
+    )
+
+
+def test_forward_without_daemon(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Commands run in the process when no daemon runs or it is disabled.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+    """
+    monkeypatch.setenv("MOLECULE_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+
+    assert daemon.forward(["molecule", "list"]) is None
+
+    (tmp_path / "missing.sock").touch()
+    monkeypatch.setenv("MOLECULE_NO_DAEMON", "1")
+
+    assert daemon.forward(["molecule", "list"]) is None
+
+    monkeypatch.delenv("MOLECULE_NO_DAEMON")
+
+    assert daemon.forward(["molecule", "serve"]) is None
+
+
+def test_runtime_key(tmp_path: Path) -> None:
+    """Runtimes are keyed by the environment and the contents of the config.
+
+    Args:
+        tmp_path: pytest temporary directory.
+    """
+    config = tmp_path / "ansible.cfg"
+    config.write_text("[defaults]\n")
+    key = daemon.runtime_key(str(tmp_path), {"PWD": "/a"})
+
+    os.utime(config, ns=(0, 0))
+    assert daemon.runtime_key(str(tmp_path), {"PWD": "/b"}) == key
+
+    config.write_text("[defaults]\nforks = 2\n")
+    assert daemon.runtime_key(str(tmp_path), {}) != key
+    assert daemon.runtime_key(str(tmp_path), {"ANSIBLE_FORKS": "2"}) != daemon.runtime_key(
+        str(tmp_path),
+        {},
+    )
+
+
+def test_preloaded(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Parsed files are only returned as long as they did not change.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+    """
+    monkeypatch.setattr(daemon, "_preloaded", {})
+    entry = tmp_path / "entry.json"
+    entry.write_text('{"a": 1}')
+    (tmp_path / "other.txt").write_text("{}")
+
+    assert daemon.preloaded(str(entry)) is None
+
+    daemon.preload(str(tmp_path))
+
+    assert daemon.preloaded(str(entry)) == {"a": 1}
+    assert daemon.preloaded(str(tmp_path / "other.txt")) is None
+
+    entry.write_text('{"a": 22}')
+
+    assert daemon.preloaded(str(entry)) is None
+
+    daemon.preload(str(tmp_path))
+
+    assert daemon.preloaded(str(entry)) == {"a": 22}
+
+
+def test_socket_is_private(server: str) -> None:
+    """Only the user running the daemon may connect to it.
+
+    Args:
+        server: The socket of the daemon.
+    """
+    assert not os.stat(server).st_mode & 0o077  # noqa: PTH116
+
+
+@pytest.mark.parametrize("args", (["--version"], ["nosuchcommand"]))
+def test_forwarded_command_matches_direct_run(
+    monkeypatch: pytest.MonkeyPatch,
+    server: str,
+    args: list[str],
+) -> None:
+    """A command run through the daemon has the output and exit code of a direct run.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        server: The socket of the daemon.
+        args: Arguments of the command.
+    """
+    monkeypatch.setenv("MOLECULE_DAEMON_SOCKET", server)
+    monkeypatch.delenv("MOLECULE_NO_DAEMON", raising=False)
+
+    def run(**env: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(  # noqa: S603
+            [sys.executable, "-m", "molecule", *args],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            env={**os.environ, **env},
+            check=False,
+        )
+
+    forwarded = run()
+    direct = run(MOLECULE_NO_DAEMON="1")
+
+    assert forwarded.returncode == direct.returncode
+    assert forwarded.stdout == direct.stdout
+    assert forwarded.stderr == direct.stderr
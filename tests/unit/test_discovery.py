@@ -0,0 +1,103 @@
+"""Unit tests for the cached scenario discovery."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wcmatch import glob
+
+from molecule import discovery
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture(name="tree")
+def fixture_tree(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Create a checkout with scenarios, whose directories were modified long ago.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest fixture for a temporary directory.
+
+    Returns:
+        The root of the checkout, which is the current directory.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+    root = tmp_path / "checkout"
+    for path in (
+        "molecule/default/molecule.yml",
+        "roles/foo/molecule/default/molecule.yml",
+        ".hidden/molecule/bar/molecule.yml",
+        ".git/molecule/baz/molecule.yml",
+        "roles/foo/tasks/main.yml",
+    ):
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("---\n")
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (1, 1))
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.mark.usefixtures("tree")
+@pytest.mark.parametrize(
+    "glob_str",
+    ("molecule/*/molecule.yml", "**/molecule/*/molecule.yml", "{roles,molecule}/**/*.yml"),
+)
+def test_walk_matches_glob(glob_str: str) -> None:
+    """The walk finds what wcmatch finds, except in .git directories.
+
+    Args:
+        glob_str: Glob to match.
+    """
+    expected = [
+        path for path in glob.glob(glob_str, flags=discovery.FLAGS) if not path.startswith(".git/")
+    ]
+
+    assert sorted(discovery.walk(glob_str)[0]) == sorted(expected)
+
+
+def test_find_revalidates_cache(mocker: MockerFixture, tree: Path) -> None:
+    """Unchanged directories are only stat-ed, a changed one triggers a walk.
+
+    Args:
+        mocker: pytest mocker fixture.
+        tree: Root of the checkout.
+    """
+    walk = mocker.spy(discovery, "walk")
+    glob_str = "**/molecule/*/molecule.yml"
+
+    expected = sorted(discovery.find(glob_str))
+    assert sorted(discovery.find(glob_str)) == expected
+    assert walk.call_count == 1
+
+    (tree / "roles/foo/molecule/new").mkdir()
+    (tree / "roles/foo/molecule/new/molecule.yml").write_text("---\n")
+
+    assert "roles/foo/molecule/new/molecule.yml" in discovery.find(glob_str)
+    assert walk.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("tree")
+def test_find_does_not_cache_racy_walks(mocker: MockerFixture) -> None:
+    """Results are not stored while directories are being modified.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+    os.utime("molecule")
+    walk = mocker.spy(discovery, "walk")
+
+    discovery.find("molecule/*/molecule.yml")
+    discovery.find("molecule/*/molecule.yml")
+
+    assert walk.call_count == 2  # noqa: PLR2004
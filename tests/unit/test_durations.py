@@ -0,0 +1,142 @@
+"""Unit tests for the durations of actions."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import durations, timings
+from molecule.results import ActionResult, RunResult
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="_durations_file", autouse=True)
+def fixture_durations_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep the durations in a temporary file.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+    """
+    monkeypatch.setenv("MOLECULE_DURATIONS_FILE", str(tmp_path / "durations.json"))
+
+
+def _record(*, scenario: str, action: str, duration: float, returncode: int = 0) -> None:
+    durations.record("test", RunResult([ActionResult(scenario, action, returncode, duration, {})]))
+
+
+def test_stats() -> None:
+    """Percentiles only count the last durations of actions which succeeded."""
+    for duration in range(1, durations.ACTION_SAMPLES + 3):
+        _record(scenario="default", action="converge", duration=float(duration))
+    _record(scenario="default", action="converge", duration=100.0, returncode=2)
+    _record(scenario="default", action="create", duration=3.0)
+    _record(scenario="other", action="create", duration=5.0)
+
+    assert durations.stats() == [
+        durations.Stat("default", "converge", durations.ACTION_SAMPLES + 2, 1, 12.5, 21.05),
+        durations.Stat("default", "create", 1, 0, 3.0, 3.0),
+        durations.Stat("other", "create", 1, 0, 5.0, 5.0),
+    ]
+    assert [stat.scenario for stat in durations.stats("other")] == ["other"]
+    assert durations.stats("missing") == []
+
+
+def test_movers() -> None:
+    """Movers compare the last two successful runs of every action."""
+    _record(scenario="default", action="converge", duration=1.0)
+    _record(scenario="default", action="converge", duration=2.0)
+    _record(scenario="default", action="converge", duration=30.0, returncode=2)
+    _record(scenario="default", action="create", duration=5.0)
+    _record(scenario="default", action="create", duration=9.0)
+    _record(scenario="default", action="verify", duration=4.0)
+    _record(scenario="default", action="verify", duration=3.0)
+    _record(scenario="other", action="create", duration=1.0)
+
+    assert durations.movers() == [
+        durations.Mover("default", "create", 5.0, 9.0),
+        durations.Mover("default", "converge", 1.0, 2.0),
+    ]
+    assert durations.movers()[0].change == 4.0  # noqa: PLR2004
+
+
+def test_failed_scenarios_are_left_out_of_estimates() -> None:
+    """The actions of a failed scenario are reported, but it is not estimated."""
+    durations.record(
+        "test",
+        RunResult(
+            [
+                ActionResult("good", "converge", 0, 2.0, {}),
+                ActionResult("bad", "create", 0, 1.0, {}),
+                ActionResult("bad", "converge", 2, 1.0, {}),
+            ],
+        ),
+    )
+
+    assert durations.load("test") == {"good": 2.0}
+    assert [
+        (stat.scenario, stat.action, stat.runs, stat.failures) for stat in durations.stats()
+    ] == [
+        ("bad", "converge", 0, 1),
+        ("bad", "create", 1, 0),
+        ("good", "converge", 1, 0),
+    ]
+
+
+def _record_runs(count: int) -> None:
+    for _ in range(count):
+        _record(scenario="default", action="converge", duration=1.0)
+
+
+def test_concurrent_runs_keep_their_durations() -> None:
+    """Runs recording at once wait for each other rather than drop durations."""
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_record_runs, args=(10,)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [stat.runs for stat in durations.stats()] == [40]
+
+
+def test_durations_of_timings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """With MOLECULE_TIMINGS set, durations are read from the timings of the actions.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+    """
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("MOLECULE_TIMINGS", "1")
+    _record(scenario="json", action="converge", duration=1.0)
+    for run_uuid, scenario, action, sequence, duration, returncode in (
+        ("1", "a", "create", "test", 1.0, 0),
+        ("1", "a", "converge", "test", 2.0, 0),
+        ("2", "a", "create", "test", 1.0, 0),
+        ("2", "a", "converge", "test", 4.0, 0),
+        ("3", "b", "converge", "test", 3.0, 2),
+        ("4", "a", "converge", "converge", 9.0, 0),
+    ):
+        timings.record(
+            timings.project_name(),
+            timings.Row(run_uuid, scenario, action, "default", sequence, 0.0, duration, returncode),
+        )
+
+    assert durations.load("test") == {"a": 4.0}
+    assert durations.load("converge") == {"a": 9.0}
+    assert [
+        (stat.scenario, stat.action, stat.runs, stat.failures) for stat in durations.stats()
+    ] == [
+        ("a", "converge", 3, 0),
+        ("a", "create", 2, 0),
+        ("b", "converge", 0, 1),
+    ]
+    assert durations.movers() == [durations.Mover("a", "converge", 4.0, 9.0)]
@@ -0,0 +1,43 @@
+"""Unit tests for the helpers of forked commands."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+
+import pytest
+
+from molecule import forking
+
+
+def test_receive() -> None:
+    """Requests are received along with the three streams of their client."""
+    client, server = socket.socketpair()
+    r, w = os.pipe()
+    with client, server:
+        socket.send_fds(client, [json.dumps({"argv": ["x"]}).encode() + b"\n"], [r, w, w])
+        request, fds = forking.receive(server)
+        forking.close(fds)
+
+        assert request == {"argv": ["x"]}
+        assert len(fds) == 3  # noqa: PLR2004
+
+        socket.send_fds(client, [b"{}\n"], [r])
+        with pytest.raises(ValueError, match="standard streams"):
+            forking.receive(server)
+    forking.close([r, w])
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    ((None, 0), (0, 0), (3, 3), ("failed", 1)),
+)
+def test_exit_code(code: str | int | None, expected: int) -> None:
+    """Exits give the code the interpreter would exit with.
+
+    Args:
+        code: Code of the exit.
+        expected: Exit code of the interpreter.
+    """
+    assert forking.exit_code(SystemExit(code)) == expected
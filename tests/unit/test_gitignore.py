@@ -0,0 +1,155 @@
+"""Unit tests for the in-process gitignore matching."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import gitignore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+PATHS = (
+    "build/out.txt",
+    "src/build/out.txt",
+    "docs/build/out.txt",
+    "a.log",
+    "keep.log",
+    "logs/debug.log",
+    "logs/keep.log",
+    "deep/x/y/z.tmp",
+    "deep/x/keep.tmp",
+    "anchored/file",
+    "sub/anchored/file",
+    "name with space",
+    "#hash",
+    "vendor/lib/molecule/default/molecule.yml",
+    "roles/foo/molecule/default/molecule.yml",
+    "roles/foo/local/molecule/default/molecule.yml",
+    "q1.txt",
+    "q10.txt",
+    "c1.bin",
+    "cx.bin",
+)
+ROOT_GITIGNORE = """\
+# comment
+build/
+!docs/build/
+*.log
+!keep.log
+deep/**/*.tmp
+/anchored
+name\\ with\\ space
+\\#hash
+vendor
+q?.txt
+c[0-9].bin
+"""
+NESTED_GITIGNORE = """\
+local/
+"""
+
+
+@pytest.fixture(name="work_tree")
+def fixture_work_tree(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Create a git work tree with ignore rules and files.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest fixture for a temporary directory.
+
+    Returns:
+        The root of the work tree, which is the current directory.
+    """
+    if not shutil.which("git"):
+        pytest.skip("git is not installed")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "home" / ".config"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    root = tmp_path / "repo"
+    root.mkdir()
+    subprocess.run(["git", "init", "-q", str(root)], check=True)  # noqa: S603, S607
+    (root / ".gitignore").write_text(ROOT_GITIGNORE)
+    (root / "roles" / "foo").mkdir(parents=True)
+    (root / "roles" / "foo" / ".gitignore").write_text(NESTED_GITIGNORE)
+    (root / ".git" / "info").mkdir(exist_ok=True)
+    (root / ".git" / "info" / "exclude").write_text("*.bak\n")
+    for path in (*PATHS, "x.bak"):
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("")
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.mark.usefixtures("work_tree")
+def test_is_ignored_agrees_with_git() -> None:
+    """The rules ignore exactly what git check-ignore reports."""
+    paths = [*PATHS, "x.bak", "roles", "build", "docs/build"]
+
+    expected = gitignore.check_ignore(paths)
+
+    assert expected
+    assert {path for path in paths if gitignore.is_ignored(path)} == expected
+
+
+def test_filter_ignored_runs_git_only_for_candidates(
+    mocker: MockerFixture,
+    work_tree: Path,
+) -> None:
+    """Git is only asked about paths matched by a rule.
+
+    Args:
+        mocker: pytest mocker fixture.
+        work_tree: Root of the work tree.
+    """
+    check_ignore = mocker.spy(gitignore, "check_ignore")
+
+    paths = ["roles/foo/molecule/default/molecule.yml", "a.log"]
+    assert gitignore.filter_ignored(paths[:1]) == paths[:1]
+    assert not check_ignore.called
+
+    # Tracked files are not ignored.
+    subprocess.run(["git", "add", "-f", "a.log"], check=True)  # noqa: S607
+    assert gitignore.filter_ignored(paths) == paths
+    check_ignore.assert_called_once_with(["a.log"])
+
+    (work_tree / ".gitignore").write_text("roles/\n")
+    assert gitignore.filter_ignored(paths) == ["a.log"]
+
+
+@pytest.mark.usefixtures("work_tree")
+def test_filter_ignored_root() -> None:
+    """Paths found in an explicitly given ignored directory are kept."""
+    paths = ["vendor/lib/a.tmp", "vendor/lib/b.txt"]
+
+    assert gitignore.filter_ignored(paths) == []
+    assert gitignore.filter_ignored(paths, root="vendor") == paths
+    assert gitignore.filter_ignored(["deep/x/y/z.tmp"], root="deep/x") == []
+
+
+@pytest.mark.usefixtures("work_tree")
+def test_unsupported_patterns_fall_back_to_git(mocker: MockerFixture) -> None:
+    """Ignore files with unsupported patterns are left to git.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+    with open(".gitignore", "a", encoding="utf-8") as stream:  # noqa: PTH123
+        stream.write("[[:digit:]]*.txt\n")
+    os.utime(".gitignore", (1, 1))
+    check_ignore = mocker.spy(gitignore, "check_ignore")
+
+    with pytest.raises(gitignore.Unsupported):
+        gitignore.is_ignored("1.txt")
+    assert gitignore.filter_ignored(["1.txt", "q1.txt"]) == []
+    check_ignore.assert_called_once_with(["1.txt", "q1.txt"])
@@ -0,0 +1,163 @@
+"""Unit tests for incremental runs."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import incremental, planner, util
+from molecule.command import base
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+def _write_playbook(config_instance: config.Config, name: str, content: str) -> None:
+    path = os.path.join(config_instance.scenario.directory, name)  # noqa: PTH118
+    util.write_file(path, content)
+
+
+def _record_all(config_instance: config.Config) -> None:
+    for action in config_instance.scenario.sequence:
+        incremental.record(config_instance, action, incremental.compute(config_instance, action))
+
+
+def _actions(config_instance: config.Config, skipped: set[int]) -> list[str]:
+    return [
+        action
+        for step, action in enumerate(config_instance.scenario.sequence)
+        if step not in skipped
+    ]
+
+
+def test_compute(config_instance: config.Config) -> None:
+    """Instances do not depend on the playbooks running the role.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    create = incremental.compute(config_instance, "create")
+    converge = incremental.compute(config_instance, "converge")
+
+    _write_playbook(config_instance, "converge.yml", "---\n- hosts: all\n")
+
+    assert incremental.compute(config_instance, "create") == create
+    assert incremental.compute(config_instance, "converge") != converge
+
+
+def test_skipped_reuses_instances(config_instance: config.Config) -> None:
+    """Instances still created with unchanged inputs are not recreated.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    _record_all(config_instance)
+    sequence = config_instance.scenario.sequence
+
+    assert not incremental.skipped(config_instance, sequence)
+
+    config_instance.state.change_state("created", True)  # noqa: FBT003
+
+    assert _actions(config_instance, incremental.skipped(config_instance, sequence)) == [
+        "dependency",
+        "syntax",
+        "converge",
+        "idempotence",
+        "side_effect",
+        "verify",
+        "cleanup",
+        "destroy",
+    ]
+
+
+def test_skipped_resumes(config_instance: config.Config) -> None:
+    """Steps before the failed one are skipped until one changed.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    _record_all(config_instance)
+    sequence = config_instance.scenario.sequence
+    config_instance.state.change_state("created", True)  # noqa: FBT003
+    config_instance.state.change_state("failed_step", sequence.index("verify"))
+
+    assert _actions(config_instance, incremental.skipped(config_instance, sequence)) == [
+        "verify",
+        "cleanup",
+        "destroy",
+    ]
+
+    _write_playbook(config_instance, "converge.yml", "---\n- hosts: all\n")
+
+    assert _actions(config_instance, incremental.skipped(config_instance, sequence)) == [
+        "syntax",
+        "converge",
+        "idempotence",
+        "side_effect",
+        "verify",
+        "cleanup",
+        "destroy",
+    ]
+
+
+def test_reset_keeps_local_fingerprints(config_instance: config.Config) -> None:
+    """Destroying instances forgets the fingerprints of actions touching them.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    _record_all(config_instance)
+    config_instance.state.change_state("failed_step", 6)
+
+    config_instance.state.reset(keep=planner.LOCAL_ACTIONS)
+
+    assert set(config_instance.state.fingerprints) == {"dependency", "syntax"}
+    assert config_instance.state.failed_step == 6  # noqa: PLR2004
+
+
+def test_execute_scenario_resumes(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """An incremental run resumes from the action which failed.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config.
+    """
+    config_instance.command_args["incremental"] = True
+    config_instance.command_args["destroy"] = "never"
+    scenario = config_instance.scenario
+    mocker.patch.object(scenario, "prune")
+    execute_subcommand = mocker.patch("molecule.command.base.execute_subcommand")
+
+    failures = [SystemExit(1)]
+
+    def run(c: config.Config, action: str) -> None:
+        if action == "create":
+            c.state.change_state("created", True)  # noqa: FBT003
+        if action == "verify" and failures:
+            raise failures.pop()
+
+    execute_subcommand.side_effect = run
+
+    with pytest.raises(SystemExit):
+        base.execute_scenario(scenario)
+
+    assert config_instance.state.failed_step == scenario.sequence.index("verify")
+
+    execute_subcommand.reset_mock()
+    base.execute_scenario(scenario)
+
+    assert [call.args[1] for call in execute_subcommand.call_args_list] == [
+        "verify",
+        "cleanup",
+        "destroy",
+    ]
+    assert config_instance.state.failed_step is None
@@ -128,3 +128,38 @@ verifier:
 """.strip()
 
     assert x == _instance.interpolate(data)
+
+
+def test_referenced_variables():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    s = "$FOO ${BAR} ${BAZ:-default} ${QUX-$DEFAULT} $$ESCAPED"
+
+    assert interpolation.referenced_variables(s) == {"FOO", "BAR", "BAZ", "QUX", "DEFAULT"}
+
+
+def test_document_render(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, PT019, D103
+    document = interpolation.Document(
+        """
+# ${this is a comment}
+foo: ${FOO}
+quoted: "${MISSING:-1}"
+plain: ${MISSING:-1}
+escaped: $${FOO}
+name: ${MOLECULE_SCENARIO_NAME}
+""",
+    )
+
+    x = {
+        "foo": "foo",
+        "quoted": "1",
+        "plain": 1,
+        "escaped": "${FOO}",
+        "name": "$MOLECULE_SCENARIO_NAME",
+    }
+    assert x == document.render(_instance, "MOLECULE_")
+
+    x["name"] = "default"
+    assert x == document.render_kept(_instance)
+
+
+def test_document_render_empty(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN201, PT019, D103
+    assert interpolation.Document("").render(_instance) == {}
@@ -0,0 +1,69 @@
+"""Unit tests for the layout of scenarios."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+from molecule import layout
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+def test_resolve(config_instance: config.Config, test_cache_path: Path) -> None:
+    """Paths of the scenario derive from its ephemeral directory.
+
+    Args:
+        config_instance: Molecule config.
+        test_cache_path: The ephemeral directory of the test.
+    """
+    paths = layout.resolve(config_instance)
+
+    assert paths.ephemeral_directory == str(test_cache_path)
+    assert paths.inventory_file == str(test_cache_path / "inventory" / "ansible_inventory.yml")
+    assert config_instance.config_file == str(test_cache_path / "molecule.yml")
+    assert config_instance.provisioner.config_file == str(test_cache_path / "ansible.cfg")
+    assert config_instance.driver.instance_config == str(test_cache_path / "instance_config.yml")
+    assert config_instance.state.state_file == str(test_cache_path / "state.yml")
+    assert config_instance.verifier.directory == os.path.join(  # noqa: PTH118
+        config_instance.scenario.directory,
+        "tests",
+    )
+
+
+def test_layout_resolved_once_per_action(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Paths and playbooks are looked up again only once the action changed.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Molecule config.
+    """
+    config_instance.action = "converge"
+    resolve = mocker.spy(layout, "resolve")
+    exists = mocker.spy(os.path, "exists")
+
+    assert config_instance.provisioner.playbooks.converge
+    lookups = exists.call_count
+    for _ in range(3):
+        assert config_instance.config_file
+        assert config_instance.provisioner.inventory_file
+        assert config_instance.provisioner.playbooks.converge
+
+    assert resolve.call_count == 1
+    assert exists.call_count == lookups
+
+    config_instance.action = "verify"
+    assert config_instance.provisioner.playbooks.converge
+
+    assert resolve.call_count == 2  # noqa: PLR2004
+    assert exists.call_count == 2 * lookups
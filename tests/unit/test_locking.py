@@ -0,0 +1,139 @@
+"""Unit tests for the locks of ephemeral directories."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import locking
+from molecule.scenario import Scenario
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from molecule import config
+
+
+# The property itself, as test_cache_path replaces it.
+EPHEMERAL_DIRECTORY = Scenario.ephemeral_directory
+HOLD = """
+import fcntl, sys, time
+with open(sys.argv[1], "w") as stream:
+    fcntl.lockf(stream, fcntl.LOCK_EX)
+    print("locked", flush=True)
+    time.sleep(60)
+"""
+
+
+@pytest.fixture(name="holder")
+def fixture_holder(tmp_path: Path) -> Iterator[subprocess.Popen[str]]:
+    """Hold the lock of a directory in another process.
+
+    Args:
+        tmp_path: pytest temporary directory.
+
+    Yields:
+        The process holding the lock.
+    """
+    with subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", HOLD, str(tmp_path / locking.LOCK_FILE)],
+        stdout=subprocess.PIPE,
+        text=True,
+    ) as process:
+        assert process.stdout
+        assert process.stdout.readline() == "locked\n"
+        yield process
+        process.kill()
+
+
+def test_manager_counts_holders(tmp_path: Path) -> None:
+    """A directory stays locked until every scenario holding it released it.
+
+    Args:
+        tmp_path: pytest temporary directory.
+    """
+    manager = locking.LockManager()
+    lock = manager.acquire(str(tmp_path))
+
+    assert manager.acquire(str(tmp_path)) is lock
+
+    manager.release(lock)
+
+    assert lock.locked
+
+    manager.release(lock)
+
+    assert not lock.locked
+    assert manager.stats.acquired == 1
+
+
+@pytest.mark.parametrize("threaded", (False, True))
+def test_manager_times_out(
+    tmp_path: Path,
+    holder: subprocess.Popen[str],
+    threaded: bool,  # noqa: FBT001
+) -> None:
+    """Waiting for a lock held by another process stops at the deadline.
+
+    Args:
+        tmp_path: pytest temporary directory.
+        holder: The process holding the lock.
+        threaded: Whether to wait from a thread other than the main one.
+    """
+    manager = locking.LockManager(timeout=0.2)
+
+    with ThreadPoolExecutor(1) as executor:
+        waiting = executor.submit(manager.acquire, str(tmp_path)) if threaded else None
+        with pytest.raises(TimeoutError):
+            waiting.result() if waiting else manager.acquire(str(tmp_path))
+
+    assert manager.stats.acquired == 0
+
+    holder.kill()
+    holder.wait()
+    manager.timeout = 5
+    lock = manager.acquire(str(tmp_path))
+
+    assert lock.locked
+    assert manager.stats.acquired == 1
+    manager.release(lock)
+
+
+def test_scenario_releases_lock(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    config_instance: config.Config,
+) -> None:
+    """A scenario locks its ephemeral directory once, until it ends.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+        config_instance: Molecule config.
+    """
+    monkeypatch.setattr(Scenario, "ephemeral_directory", EPHEMERAL_DIRECTORY)
+    monkeypatch.setenv("MOLECULE_EPHEMERAL_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("MOLECULE_PARALLEL", "1")
+    scenario = config_instance.scenario
+    path = scenario.ephemeral_directory
+    lock = scenario._lock
+    scenario.ephemeral_directory  # noqa: B018
+
+    assert lock
+    assert lock.locked
+    assert scenario._lock is lock
+
+    scenario.release_lock()
+    scenario.ephemeral_directory  # noqa: B018
+
+    assert not lock.locked
+    assert scenario._lock is None
+    assert locking.MANAGER.acquire(path) is lock
+    locking.MANAGER.release(lock)
@@ -0,0 +1,72 @@
+"""Unit tests for the ordering of scenarios."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import pytest
+
+from molecule import ordering
+from molecule.command import base
+
+
+if TYPE_CHECKING:
+    from molecule import config
+
+
+class _Scenario(NamedTuple):
+    name: str
+    directory: str
+
+
+SCENARIOS = [_Scenario(name, f"molecule/{name}") for name in ("c", "a", "d", "b")]
+
+
+def _names(scenarios: list[_Scenario]) -> list[str]:
+    return [scenario.name for scenario in scenarios]
+
+
+def test_sort_by_directory() -> None:
+    """Scenarios run by directory by default."""
+    assert _names(ordering.sort(SCENARIOS, "directory")) == ["a", "b", "c", "d"]
+
+
+def test_sort_longest_first() -> None:
+    """Scenarios run longest first, the ones without durations counting as the mean."""
+    recorded = {"a": 1.0, "b": 9.0, "c": 5.0}
+
+    assert _names(ordering.sort(SCENARIOS, "lpt", recorded)) == ["b", "c", "d", "a"]
+    # Without durations, scenarios keep the directory order.
+    assert _names(ordering.sort(SCENARIOS, "lpt")) == ["a", "b", "c", "d"]
+
+
+def test_sort_random() -> None:
+    """Shuffles of the same seed give the same order."""
+    shuffled = ordering.sort(SCENARIOS, "random", seed=1)
+
+    assert sorted(_names(shuffled)) == ["a", "b", "c", "d"]
+    assert ordering.sort(list(reversed(SCENARIOS)), "random", seed=1) == shuffled
+
+
+def test_sort_unknown_order() -> None:
+    """Unknown orders are refused."""
+    with pytest.raises(ValueError, match="'size'"):
+        ordering.sort(SCENARIOS, "size")
+
+
+@pytest.mark.parametrize("order", ordering.ORDERS)
+def test_select_scenarios_in_order(config_instance: config.Config, order: str) -> None:
+    """Scenarios are selected in every order.
+
+    Args:
+        config_instance: Molecule config.
+        order: Order of the scenarios.
+    """
+    scenarios = base.select_scenarios(
+        [config_instance.molecule_file],
+        None,
+        {},
+        {"subcommand": "test", "order": order},
+    )
+
+    assert [scenario.name for scenario in scenarios] == ["default"]
@@ -0,0 +1,98 @@
+"""Unit tests for the execution planner."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from molecule import planner
+
+
+SEQUENCE = ["dependency", "destroy", "syntax", "create", "converge", "destroy"]
+
+
+def _names(nodes: list[planner.Node], positions: tuple[int, ...]) -> list[str]:
+    return [str(nodes[i]) for i in positions]
+
+
+def test_build_moves_local_actions_ahead() -> None:
+    """Actions not touching instances run first, in sequence order."""
+    nodes = planner.build({"a": SEQUENCE}, parallel=False)
+
+    assert [node.action for node in nodes] == [
+        "dependency",
+        "syntax",
+        "destroy",
+        "create",
+        "converge",
+        "destroy",
+    ]
+
+
+def test_build_shares_instances() -> None:
+    """Outside of parallel mode, instances are used by one scenario at a time."""
+    nodes = planner.build({"a": SEQUENCE, "b": SEQUENCE}, parallel=False)
+    by_name = {str(node): node for node in reversed(nodes)}
+
+    assert _names(nodes, by_name["b:dependency"].needs) == ["a:dependency"]
+    assert _names(nodes, by_name["b:syntax"].needs) == ["b:dependency"]
+    assert _names(nodes, by_name["b:destroy"].needs) == ["a:destroy", "b:syntax"]
+    assert by_name["b:syntax"].stage == 2  # noqa: PLR2004
+    assert by_name["a:converge"].stage == 4  # noqa: PLR2004
+    assert by_name["b:create"].resources == ("ephemeral:b", "instances")
+
+
+def test_build_parallel() -> None:
+    """In parallel mode, scenarios only wait for each other to download."""
+    nodes = planner.build({"a": SEQUENCE, "b": SEQUENCE}, parallel=True)
+    by_name = {str(node): node for node in reversed(nodes)}
+
+    assert _names(nodes, by_name["b:create"].needs) == ["b:destroy"]
+    assert by_name["b:converge"].stage == by_name["a:converge"].stage + 1
+    assert by_name["b:create"].resources == ("ephemeral:b", "instances:b")
+
+
+def test_execute_overlaps_scenarios() -> None:
+    """Scenario b is prepared while the instances of scenario a are converged."""
+    nodes = planner.build({"a": SEQUENCE, "b": SEQUENCE}, parallel=False)
+    b_syntax_done = threading.Event()
+    order = []
+    finished: list[str] = []
+
+    def run(node: planner.Node) -> None:
+        if str(node) == "a:converge":
+            assert b_syntax_done.wait(5)
+        order.append(str(node))
+        if str(node) == "b:syntax":
+            b_syntax_done.set()
+
+    outcome = planner.execute(nodes, run, 2, finished.append)
+
+    assert outcome == planner.Outcome([], [])
+    assert order.index("b:syntax") < order.index("a:converge")
+    assert order.index("a:converge") < order.index("b:create")
+    assert finished == ["a", "b"]
+
+
+@pytest.mark.parametrize("parallel", (False, True))
+def test_execute_stops_on_failure(parallel: bool) -> None:  # noqa: FBT001
+    """No node starts after a failure, started scenarios are interrupted.
+
+    Args:
+        parallel: Whether scenarios run in parallel mode.
+    """
+    nodes = planner.build({"a": SEQUENCE, "b": SEQUENCE, "c": SEQUENCE}, parallel=parallel)
+    ran = []
+
+    def run(node: planner.Node) -> None:
+        ran.append(str(node))
+        if str(node) == "a:converge":
+            raise SystemExit(2)
+
+    outcome = planner.execute(nodes, run, 1, lambda _: None)
+
+    assert [(str(node), e.code) for node, e in outcome.failures] == [("a:converge", 2)]
+    assert ran.count("a:destroy") == 1
+    assert "a" in outcome.interrupted
+    assert all(name in outcome.interrupted for name in {n.split(":")[0] for n in ran})
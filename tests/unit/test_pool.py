@@ -0,0 +1,279 @@
+"""Unit tests for the instance pool of the default driver."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from molecule import pool, util
+from molecule.command import create, destroy
+from molecule.scenario import ephemeral_directory
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+class FakePlaybooks:
+    """Stand-in for ansible-playbook, keeping track of live instances."""
+
+    def __init__(self) -> None:
+        """Initialize the fake playbooks."""
+        self.live: set[str] = set()
+        self.runs: list[str] = []
+        self.addresses = True
+
+    def __call__(self, cmd: list[str], env: dict[str, str], **_: Any) -> CompletedProcess[str]:  # noqa: ANN401
+        """Run a playbook.
+
+        Args:
+            cmd: The ansible-playbook command.
+            env: Its environment.
+            _: Other arguments of run_command.
+
+        Returns:
+            The completed playbook.
+        """
+        playbook = os.path.basename(cmd[-1])  # noqa: PTH119
+        self.runs.append(playbook)
+        path = env["MOLECULE_INSTANCE_CONFIG"]
+        if playbook == "create.yml":
+            names = [p["name"] for p in util.safe_load_file(env["MOLECULE_FILE"])["platforms"]]
+            self.live.update(names)
+            instances = [{"instance": name} for name in names]
+            if self.addresses:
+                for instance in instances:
+                    instance["address"] = f"{instance['instance']}.local"
+            util.write_file(path, util.safe_dump(instances))
+        elif playbook == "destroy.yml":
+            self.live.difference_update(i["instance"] for i in util.safe_load_file(path) or [])
+            util.write_file(path, "{}")
+        return CompletedProcess(cmd, 0, stdout="")
+
+
+@pytest.fixture(name="_pool_section_data")
+def fixture_pool_section_data() -> dict[str, Any]:
+    """Provide a pool of two sets of instances, expiring after a minute.
+
+    Returns:
+        The config section data.
+    """
+    return {
+        "driver": {"name": "default", "options": {"managed": True, "pool": {"size": 2, "ttl": 60}}},
+    }
+
+
+@pytest.fixture(name="playbooks")
+def fixture_playbooks(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    config_instance: config.Config,
+    test_cache_path: Path,
+) -> FakePlaybooks:
+    """Run fake playbooks, with an ephemeral directory per config.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        config_instance: Molecule config.
+        test_cache_path: Directory of the test.
+
+    Returns:
+        The fake playbooks.
+    """
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(test_cache_path / "cache"))
+    monkeypatch.setattr(
+        "molecule.scenario.Scenario.ephemeral_directory",
+        property(
+            lambda s: ephemeral_directory(
+                str(test_cache_path / s.config._run_uuid / s.name)
+                if s.config.is_parallel
+                else str(test_cache_path / "scenario" / s.name),
+            ),
+        ),
+    )
+    config_instance.scenario._setup()
+    for name in ("create.yml", "prepare.yml", "destroy.yml"):
+        util.write_file(os.path.join(config_instance.scenario.directory, name), "---\n")  # noqa: PTH118
+    fake = FakePlaybooks()
+    mocker.patch("molecule.util.run_command", side_effect=fake)
+    return fake
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+def test_create_leases_pooled_instances(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+) -> None:
+    """Instances created ahead are handed out under the names of the platforms.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+    """
+    p = pool.Pool(config_instance)
+
+    assert p.fill() == 2  # noqa: PLR2004
+    assert len(playbooks.live) == 4  # noqa: PLR2004
+    assert playbooks.runs == ["create.yml", "prepare.yml"] * 2
+
+    config_instance.action = "create"
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    instances = util.safe_load_file(config_instance.driver.instance_config)
+    assert [i["instance"] for i in instances] == ["instance-1", "instance-2"]
+    assert all(i["address"] in {f"{n}.local" for n in playbooks.live} for i in instances)
+    assert config_instance.state.created
+    assert config_instance.state.prepared
+    assert len(playbooks.runs) == 4  # noqa: PLR2004
+    assert len(p.entries()) == 1
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+@pytest.mark.parametrize("addresses", (True, False))
+def test_leased_hosts_connect_to_pooled_instances(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+    addresses: bool,  # noqa: FBT001
+) -> None:
+    """The inventory names hosts after the platforms and connects to live instances.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+        addresses: Whether the create playbook records addresses.
+    """
+    playbooks.addresses = addresses
+    pool.Pool(config_instance).fill()
+    config_instance.action = "create"
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    hosts = config_instance.provisioner.inventory["all"]["hosts"]
+    live = {f"{name}.local" for name in playbooks.live} if addresses else playbooks.live
+
+    assert sorted(hosts) == ["instance-1", "instance-2"]
+    assert all(host["ansible_host"] in live for host in hosts.values())
+    assert len({host["ansible_host"] for host in hosts.values()}) == 2  # noqa: PLR2004
+    for name, host in hosts.items():
+        assert host["ansible_host"].startswith(f"{name}-")
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+@pytest.mark.parametrize("converged", (False, True))
+def test_destroy_returns_instances(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+    converged: bool,  # noqa: FBT001
+) -> None:
+    """Instances go back to the pool unless converged, which destroys them.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+        converged: Whether the scenario converged the instances.
+    """
+    p = pool.Pool(config_instance)
+    p.fill()
+    config_instance.action = "create"
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+    config_instance.state.change_state("converged", converged)
+
+    config_instance.action = "destroy"
+    destroy.Destroy(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    assert not os.path.exists(config_instance.driver.instance_config)  # noqa: PTH110
+    assert not config_instance.state.created
+    assert len(p.entries()) == (1 if converged else 2)
+    assert len(playbooks.live) == (2 if converged else 4)
+    assert playbooks.runs.count("destroy.yml") == (1 if converged else 0)
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+def test_create_without_pooled_instances(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+) -> None:
+    """Instances are created as usual while the pool is empty.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+    """
+    config_instance.action = "create"
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    assert playbooks.live == {"instance-1", "instance-2"}
+
+    config_instance.action = "destroy"
+    destroy.Destroy(config_instance).execute()  # type: ignore[no-untyped-call]
+
+    assert not playbooks.live
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+def test_expired_instances_are_destroyed(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+) -> None:
+    """Instances older than the TTL are destroyed, then replaced by fill.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+    """
+    p = pool.Pool(config_instance)
+    p.fill()
+    expired = p.entries()[0]
+    path = p.directory / f"{expired.run_uuid}.json"
+    path.write_text(json.dumps(expired._replace(created=time.time() - 120)._asdict()))
+
+    assert p.prune() == 1
+    assert [e.run_uuid for e in p.entries()] == [p.entries()[0].run_uuid]
+    assert not any(name.endswith(expired.run_uuid) for name in playbooks.live)
+    assert p.fill() == 1
+    assert p.drain() == 2  # noqa: PLR2004
+    assert not playbooks.live
+
+
+@pytest.mark.parametrize("config_instance", ["_pool_section_data"], indirect=True)  # noqa: PT007
+def test_lost_leases_are_reclaimed(
+    config_instance: config.Config,
+    playbooks: FakePlaybooks,
+) -> None:
+    """Sets leased by a process which is gone are destroyed once no scenario holds them.
+
+    Args:
+        config_instance: Molecule config.
+        playbooks: The fake playbooks.
+    """
+    p = pool.Pool(config_instance)
+    p.fill()
+    config_instance.action = "create"
+    create.Create(config_instance).execute()  # type: ignore[no-untyped-call]
+    with subprocess.Popen([sys.executable, "-c", ""]) as process:
+        process.wait()
+    (leased,) = p.directory.glob("*.leased")
+    leased.rename(leased.with_name(leased.name.replace(f".{os.getpid()}.", f".{process.pid}.")))
+
+    assert p.reclaim() == 0
+
+    lease_file = os.path.join(config_instance.scenario.ephemeral_directory, pool.LEASE_FILE)  # noqa: PTH118
+    os.remove(lease_file)  # noqa: PTH107
+
+    assert p.reclaim() == 1
+    assert not list(p.directory.glob("*.leased"))
+    assert len(playbooks.live) == 2  # noqa: PLR2004
+    assert len(p.entries()) == 1
@@ -0,0 +1,48 @@
+"""Unit tests for the results of runs."""
+
+from __future__ import annotations
+
+import pytest
+
+from molecule import results
+
+
+OUTPUT = """
+PLAY [Converge] ****************************************************************
+
+TASK [Gathering Facts] *********************************************************
+ok: [instance-1]
+
+PLAY RECAP *********************************************************************
+\x1b[0;33minstance-1\x1b[0m    : \x1b[0;32mok=2   \x1b[0m changed=1    unreachable=0    failed=0
+instance-2    : ok=1    changed=0    unreachable=1    failed=0
+
+"""
+
+
+def test_parse_recap() -> None:
+    """The recap is parsed by host, without the colors of the output."""
+    assert results.parse_recap(OUTPUT) == {
+        "instance-1": {"ok": 2, "changed": 1, "unreachable": 0, "failed": 0},
+        "instance-2": {"ok": 1, "changed": 0, "unreachable": 1, "failed": 0},
+    }
+    assert not results.parse_recap("ok: [instance-1]\n")
+
+
+def test_action_records_stats_and_failures() -> None:
+    """Actions are recorded with the recaps of their playbooks, only while recording."""
+    with results.action("default", "converge"):
+        results.add_output(OUTPUT)
+
+    with results.recording() as recorder:
+        with results.action("default", "converge"):
+            results.add_output(OUTPUT)
+            results.add_output(OUTPUT)
+        with pytest.raises(SystemExit), results.action("default", "verify"):
+            raise SystemExit(2)
+
+    converge, verify = recorder.result().actions
+    assert converge.returncode == 0
+    assert converge.stats["instance-1"]["ok"] == 4  # noqa: PLR2004
+    assert verify.returncode == 2  # noqa: PLR2004
+    assert recorder.result().returncode == 2  # noqa: PLR2004
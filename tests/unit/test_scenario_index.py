@@ -0,0 +1,114 @@
+"""Unit tests for the lazy scenario index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import scenario_index, scenarios
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def _write_scenario(tmp_path: Path, directory: str, content: str) -> str:
+    path = tmp_path / "molecule" / directory / "molecule.yml"
+    path.parent.mkdir(parents=True)
+    path.write_text(content)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    (
+        pytest.param("driver:\n  name: default\n", "dir", id="directory"),
+        pytest.param("scenario:\n  name: foo\n", "foo", id="plain"),
+        pytest.param("---\nscenario:  # comment\n  name: 'foo' # x\n", "foo", id="quoted"),
+        pytest.param(
+            "scenario:\n  test_sequence:\n    - name: bar\n  name: foo\n",
+            "foo",
+            id="nested",
+        ),
+        pytest.param("scenario:\n  name: ${NAME}\n", None, id="interpolated"),
+        pytest.param("scenario: {name: foo}\n", None, id="flow"),
+        pytest.param("scenario:\n  name: 1.0\n", None, id="not-a-string"),
+        pytest.param("scenario:\n  <<: *defaults\n", None, id="merge-key"),
+    ),
+)
+def test_read_scenario_name(tmp_path: Path, content: str, expected: str | None) -> None:
+    """Names are read from plain block style configs only.
+
+    Args:
+        tmp_path: pytest fixture for a temporary directory.
+        content: Content of the scenario's config.
+        expected: Expected name.
+    """
+    molecule_file = _write_scenario(tmp_path, "dir", content)
+
+    assert scenario_index.read_scenario_name(molecule_file) == expected
+
+
+def test_read_scenario_name_from_base_config(tmp_path: Path) -> None:
+    """A base config sets the name unless the scenario's config overrides it.
+
+    Args:
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    base_config = tmp_path / "base.yml"
+    base_config.write_text("scenario:\n  name: base\n")
+    plain = _write_scenario(tmp_path, "plain", "driver:\n  name: default\n")
+    named = _write_scenario(tmp_path, "named", "scenario:\n  name: foo\n")
+
+    assert scenario_index.read_scenario_name(plain, [str(base_config)]) == "base"
+    assert scenario_index.read_scenario_name(named, [str(base_config)]) == "foo"
+
+
+def test_index_builds_config_only_when_name_is_unknown(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """Only scenarios with an interpolated name get their config built.
+
+    Args:
+        mocker: pytest mocker fixture.
+        tmp_path: pytest fixture for a temporary directory.
+    """
+    patched_config = mocker.patch("molecule.config.Config")
+    patched_config.return_value.scenario.name = "rendered"
+    plain = _write_scenario(tmp_path, "plain", "driver:\n  name: default\n")
+    interpolated = _write_scenario(tmp_path, "interp", "scenario:\n  name: ${NAME}\n")
+
+    entries = scenario_index.index([plain, interpolated], {}, {})
+
+    assert [e.name for e in entries] == ["plain", "rendered"]
+    patched_config.assert_called_once_with(
+        molecule_file=interpolated,
+        args={},
+        command_args={},
+        ansible_args=(),
+    )
+
+
+def test_scenarios_build_selected_configs_on_iteration(mocker: MockerFixture) -> None:
+    """Scenarios only builds the selected configs, when they are iterated.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+    patched_load = mocker.patch.object(scenario_index.IndexedScenario, "load")
+    entries = [
+        scenario_index.IndexedScenario(name, f"/molecule/{name}/molecule.yml", {}, {})
+        for name in ("foo", "bar")
+    ]
+
+    s = scenarios.Scenarios(entries, "bar")
+    assert not patched_load.called
+
+    result = list(s)
+
+    assert result == [patched_load.return_value]
+    patched_load.assert_called_once_with()
@@ -0,0 +1,174 @@
+"""Unit tests for the concurrent scenario scheduler."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from molecule import scheduler
+from molecule.console import console
+from molecule.constants import RC_TIMEOUT
+from molecule.text import strip_ansi_escape
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _fake_worker(  # noqa: PLR0913
+    scenario_name: str,
+    molecule_file: str,  # noqa: ARG001
+    *,
+    execute: Any,  # noqa: ANN401, ARG001
+    args: dict[str, Any],  # noqa: ARG001
+    command_args: dict[str, Any],  # noqa: ARG001
+    ansible_args: tuple[str, ...],  # noqa: ARG001
+    log_file: str,
+    environ: dict[str, str],  # noqa: ARG001
+) -> scheduler.ScenarioResult:
+    Path(log_file).write_text(f"output of {scenario_name}\n")
+    returncode = 2 if scenario_name == "bad" else 0
+    return scheduler.ScenarioResult(scenario_name, returncode, 0.1)
+
+
+@pytest.fixture(name="_patched_pool")
+def fixture_patched_pool(mocker: MockerFixture) -> None:
+    """Run workers in threads of the test process.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+
+    def thread_pool(max_workers: int, mp_context: Any) -> ThreadPoolExecutor:  # noqa: ANN401, ARG001
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    mocker.patch("molecule.scheduler.ProcessPoolExecutor", thread_pool)
+    mocker.patch("molecule.scheduler._run_worker", _fake_worker)
+
+
+@pytest.mark.usefixtures("_patched_pool")
+def test_run_scenarios(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    """Ensure every scenario runs, its log is replayed and a summary is logged.
+
+    Args:
+        mocker: pytest mocker fixture.
+        caplog: pytest caplog fixture.
+    """
+    scenarios = []
+    for name in ("good", "bad"):
+        scenario = mocker.Mock()
+        scenario.name = name
+        scenarios.append(scenario)
+
+    caplog.set_level(logging.INFO)
+    with console.capture() as capture:
+        results = scheduler.run_scenarios(
+            scenarios,
+            2,
+            {},
+            {"subcommand": "test"},
+            execute=mocker.Mock(),
+        )
+    output = strip_ansi_escape(capture.get())  # type: ignore[no-untyped-call]
+
+    assert sorted(r.scenario_name for r in results) == ["bad", "good"]
+    assert {r.scenario_name: r.returncode for r in results} == {"good": 0, "bad": 2}
+    assert "output of good" in output
+    assert "output of bad" in output
+    assert "1 passed, 1 failed" in caplog.text
+    assert "bad: failed with return code 2" in caplog.text
+
+
+def _fake_reaper(  # noqa: PLR0913
+    molecule_file: str,
+    *,
+    destroy: Any,  # noqa: ANN401, ARG001
+    args: dict[str, Any],  # noqa: ARG001
+    command_args: dict[str, Any],  # noqa: ARG001
+    ansible_args: tuple[str, ...],  # noqa: ARG001
+    log_file: str,
+    environ: dict[str, str],  # noqa: ARG001
+) -> None:
+    Path(log_file).write_text(f"destroyed {molecule_file}\n")
+    sys.exit(3 if molecule_file == "bad" else 0)
+
+
+def _scenario(mocker: MockerFixture, name: str, instance: str) -> Any:  # noqa: ANN401
+    scenario = mocker.Mock()
+    scenario.name = name
+    scenario.config.molecule_file = name
+    scenario.config.command_args = {"destroy": "background"}
+    scenario.config.platforms.instances = [{"name": instance}]
+    return scenario
+
+
+def test_reapers(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    """Reapers destroy in other processes, and are awaited by the barrier.
+
+    Args:
+        mocker: pytest mocker fixture.
+        caplog: pytest caplog fixture.
+    """
+    # Forked reapers run the fake target of the test process.
+    mocker.patch(
+        "molecule.scheduler.multiprocessing.get_context",
+        return_value=multiprocessing.get_context("fork"),
+    )
+    mocker.patch("molecule.scheduler._run_reaper", _fake_reaper)
+    reapers = scheduler.Reapers()
+    good = _scenario(mocker, "good", "instance")
+    bad = _scenario(mocker, "bad", "other")
+
+    reapers.start(good, mocker.Mock())
+    reapers.start(bad, mocker.Mock())
+    log_directory = Path(reapers._reapers[0].log_file).parent
+    caplog.set_level(logging.INFO)
+    with console.capture() as capture:
+        reapers.wait_for(_scenario(mocker, "next", "instance"))
+
+    assert "Waiting for scenario good" in caplog.text
+    assert "Waiting for scenario bad" not in caplog.text
+    assert "destroyed good" in strip_ansi_escape(capture.get())  # type: ignore[no-untyped-call]
+
+    with console.capture():
+        results = reapers.wait()
+
+    assert {r.scenario_name: r.returncode for r in results} == {"good": 0, "bad": 3}
+    assert not Path(log_directory).exists()
+    assert not reapers.wait()
+
+
+def test_run_reaper_lock_timeout(mocker: MockerFixture, tmp_path: Path) -> None:
+    """A reaper which cannot lock the ephemeral directory exits with a timeout.
+
+    Args:
+        mocker: pytest mocker fixture.
+        tmp_path: pytest temporary directory.
+    """
+    mocker.patch("molecule.scheduler.os.dup2")
+    mocker.patch("molecule.scheduler.logger")
+    mocker.patch("molecule.scheduler.config.Config")
+    mocker.patch("molecule.scheduler.locking.MANAGER.acquire", side_effect=TimeoutError)
+    destroy = mocker.Mock()
+
+    with pytest.raises(SystemExit) as e:
+        scheduler._run_reaper(
+            "molecule.yml",
+            destroy=destroy,
+            args={},
+            command_args={},
+            ansible_args=(),
+            log_file=str(tmp_path / "reaper.log"),
+            environ=dict(os.environ),
+        )
+
+    assert e.value.code == RC_TIMEOUT
+    assert not destroy.called
@@ -0,0 +1,109 @@
+"""Unit tests for the sharding of scenarios."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import durations, shard
+from molecule.command import base
+from molecule.results import ActionResult, RunResult
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from molecule import config
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (("1/1", (1, 1)), ("2/4", (2, 4))),
+)
+def test_parse(value: str, expected: tuple[int, int]) -> None:
+    """Shards are given as INDEX/COUNT, counting from 1.
+
+    Args:
+        value: The shard.
+        expected: Its index and count.
+    """
+    assert shard.parse(value) == expected
+
+
+@pytest.mark.parametrize("value", ("2", "a/2", "0/2", "3/2", "1/0"))
+def test_parse_invalid(value: str) -> None:
+    """Shards outside of the shard count are refused.
+
+    Args:
+        value: The shard.
+    """
+    with pytest.raises(ValueError, match=value):
+        shard.parse(value)
+
+
+def test_assign_balances_durations() -> None:
+    """Shards take about the same time rather than having the same count."""
+    recorded = {"a": 50.0, "b": 10.0, "c": 10.0, "d": 10.0, "e": 10.0, "f": 10.0}
+
+    assert shard.assign(list("abcdef"), 2, recorded) == [["a"], ["b", "c", "d", "e", "f"]]
+    assert shard.assign(list("fedcba"), 2, recorded) == [["a"], ["b", "c", "d", "e", "f"]]
+
+
+def test_assign_without_durations() -> None:
+    """Scenarios without durations split into shards of equal counts."""
+    shards = shard.assign(list("abcde"), 2, {})
+
+    assert shards == [["a", "c", "e"], ["b", "d"]]
+    # Scenarios without durations count as the mean of the others.
+    assert shard.assign(list("abc"), 2, {"a": 2.0, "b": 4.0}) == [["b"], ["c", "a"]]
+
+
+def test_durations(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The durations of scenarios which did not fail are recorded by sequence.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+    """
+    monkeypatch.setenv("MOLECULE_DURATIONS_FILE", str(tmp_path / "durations.json"))
+
+    assert durations.load("test") == {}
+
+    for duration in range(1, durations.SAMPLES + 3):
+        durations.record(
+            "test",
+            RunResult(
+                [
+                    ActionResult("a", "create", 0, 1.0, {}),
+                    ActionResult("a", "converge", 0, duration, {}),
+                    ActionResult("b", "converge", 2, 1.0, {}),
+                ],
+            ),
+        )
+
+    assert durations.load("test") == {"a": 1.0 + sum(range(3, 8)) / durations.SAMPLES}
+    assert durations.load("converge") == {}
+
+
+@pytest.mark.parametrize(("value", "expected"), (("1/2", ["default"]), ("2/2", [])))
+def test_select_scenarios_of_shard(
+    config_instance: config.Config,
+    value: str,
+    expected: list[str],
+) -> None:
+    """Only the scenarios of the shard are selected.
+
+    Args:
+        config_instance: Molecule config.
+        value: The shard.
+        expected: Names of the scenarios of the shard.
+    """
+    scenarios = base.select_scenarios(
+        [config_instance.molecule_file],
+        "default",
+        {},
+        {"subcommand": "test", "shard": value},
+    )
+
+    assert [scenario.name for scenario in scenarios] == expected
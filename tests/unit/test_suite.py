@@ -0,0 +1,139 @@
+"""Unit tests for scenario suites."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from molecule import config, suite, util
+from molecule.scenario import ephemeral_directory
+from tests.unit.conftest import write_molecule_file
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from molecule.scenario import Scenario
+
+
+def test_split(config_instance: config.Config) -> None:
+    """The test sequence is split around create, prepare and the final destroy.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    phases = suite.split(config_instance.scenario.sequence)
+
+    assert phases.setup == ["dependency", "cleanup", "destroy", "syntax", "create", "prepare"]
+    assert phases.body == ["converge", "idempotence", "side_effect", "verify", "cleanup"]
+    assert phases.teardown == ["destroy"]
+
+
+def test_split_without_create() -> None:
+    """Sequences not creating instances have no setup."""
+    assert suite.split(["dependency", "cleanup", "destroy"]) == (
+        [],
+        ["dependency", "cleanup"],
+        ["destroy"],
+    )
+
+
+def test_member_sequence(config_instance: config.Config) -> None:
+    """Other scenarios of a suite only keep the setup actions not touching instances.
+
+    Args:
+        config_instance: Molecule config.
+    """
+    assert suite.member_sequence(config_instance.scenario.sequence) == [
+        "dependency",
+        "syntax",
+        "converge",
+        "idempotence",
+        "side_effect",
+        "verify",
+        "cleanup",
+    ]
+
+
+def _scenario(
+    mocker: MockerFixture,
+    name: str,
+    suite_name: str | None,
+    platform: str,
+) -> Scenario:
+    scenario = mocker.Mock()
+    scenario.name = name
+    scenario.suite = suite_name
+    scenario.config.config = {"platforms": [{"name": platform}]}
+    return cast("Scenario", scenario)
+
+
+def test_group(mocker: MockerFixture) -> None:
+    """Suites are grouped at the position of their first scenario.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+    a, b, c, d = (
+        _scenario(mocker, "a", "x", "instance"),
+        _scenario(mocker, "b", None, "instance"),
+        _scenario(mocker, "c", "x", "instance"),
+        _scenario(mocker, "d", "y", "other"),
+    )
+
+    assert suite.group([a, b, c, d]) == [[a, c], [b], [d]]
+
+
+def test_group_requires_shared_platforms(mocker: MockerFixture) -> None:
+    """Scenarios of a suite must declare the same platforms.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+    scenarios = [_scenario(mocker, "a", "x", "instance"), _scenario(mocker, "b", "x", "other")]
+
+    with pytest.raises(SystemExit):
+        suite.group(scenarios)
+
+
+def test_borrow(
+    monkeypatch: pytest.MonkeyPatch,
+    config_instance: config.Config,
+    molecule_data: dict[str, object],
+    test_cache_path: Path,
+) -> None:
+    """Another scenario uses the instances while borrowing them only.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        config_instance: Molecule config of the scenario owning the instances.
+        molecule_data: Molecule data of the config.
+        test_cache_path: Directory of the config.
+    """
+    monkeypatch.setattr(
+        "molecule.scenario.Scenario.ephemeral_directory",
+        property(lambda scenario: ephemeral_directory(str(test_cache_path / scenario.name))),
+    )
+    molecule_file = test_cache_path / "molecule" / "other" / "molecule.yml"
+    molecule_file.parent.mkdir(parents=True)
+    write_molecule_file(str(molecule_file), {**molecule_data, "scenario": {"name": "other"}})
+    member = config.Config(str(molecule_file)).scenario
+    owner = config_instance.scenario
+    entries = [{"instance": "instance-1", "address": "10.0.0.1"}]
+    util.write_file(config_instance.driver.instance_config, util.safe_dump(entries))
+    config_instance.state.change_state("created", True)  # noqa: FBT003
+    config_instance.state.change_state("driver", "default")
+
+    with suite.borrow(owner, member):
+        assert member.config.state.created
+        assert member.config.state.driver == "default"
+        assert util.safe_load_file(member.config.driver.instance_config) == entries
+
+    assert not member.config.state.created
+    assert not os.path.exists(member.config.driver.instance_config)  # noqa: PTH110
+    assert owner.config.state.created
@@ -0,0 +1,101 @@
+"""Unit tests for the timings of actions."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import timings
+from molecule.command import base
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+@pytest.fixture(name="database")
+def fixture_database(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> str:
+    """Keep the timings database in a temporary cache directory.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest temporary directory.
+
+    Returns:
+        Path to the timings database.
+    """
+    monkeypatch.delenv("MOLECULE_EPHEMERAL_DIRECTORY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return str(tmp_path / "molecule" / "timings.db")
+
+
+@pytest.mark.usefixtures("patched_config_validate")
+@pytest.mark.parametrize("enabled", (True, False))
+def test_actions_record_timings(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    database: str,
+    config_instance: config.Config,
+    enabled: bool,  # noqa: FBT001
+) -> None:
+    """Actions record a row with their driver and run only when MOLECULE_TIMINGS is set.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        database: Path to the timings database.
+        config_instance: Molecule config.
+        enabled: Whether timings are recorded.
+    """
+    monkeypatch.setenv("MOLECULE_TIMINGS", str(enabled))
+    mocker.patch("molecule.provisioner.ansible.Ansible.syntax", side_effect=SystemExit(2))
+
+    with pytest.raises(SystemExit):
+        base.execute_subcommand(config_instance, "syntax")
+
+    assert os.path.exists(database) == enabled  # noqa: PTH110
+    rows = timings.rows(timings.project_name(config_instance.project_directory))
+    assert [row._replace(started=0.0, duration=0.0) for row in rows] == (
+        [
+            timings.Row(
+                config_instance._run_uuid,
+                "default",
+                "syntax",
+                "default",
+                config_instance.subcommand,
+                0.0,
+                0.0,
+                2,
+            ),
+        ]
+        if enabled
+        else []
+    )
+
+
+def test_rows(database: str) -> None:  # noqa: ARG001
+    """Rows are read back oldest first, for their project only.
+
+    Args:
+        database: Path to the timings database.
+    """
+    for started in (2.0, 1.0):
+        timings.record(
+            "project",
+            timings.Row("uuid", "default", "converge", "podman", "test", started, 3.0, 0),
+        )
+    timings.record(
+        "other",
+        timings.Row("uuid", "default", "converge", "default", "test", 0.0, 1.0, 0),
+    )
+
+    assert [row.started for row in timings.rows("project")] == [1.0, 2.0]
+    assert {row.driver for row in timings.rows("project")} == {"podman"}
+    assert timings.rows("missing") == []
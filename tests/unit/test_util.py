@@ -119,6 +119,37 @@ def test_sysexit_with_message_and_custom_code(caplog: pytest.LogCaptureFixture):
     assert "foo" in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("cmd_args", "suites", "refused"),
+    (
+        ({"jobs": 2}, ["debian"], True),
+        ({"pipeline": True}, ["debian", "debian"], True),
+        ({"jobs": 2}, [], False),
+        ({"jobs": 1}, ["debian"], False),
+    ),
+)
+def test_validate_parallel_cmd_args_suites(
+    caplog: pytest.LogCaptureFixture,
+    cmd_args: dict[str, Any],
+    suites: list[str],
+    refused: bool,  # noqa: FBT001
+) -> None:
+    """Scenarios of suites are not run concurrently.
+
+    Args:
+        caplog: pytest log capture fixture.
+        cmd_args: Arguments of the command.
+        suites: Suites of the selected scenarios.
+        refused: Whether the command is refused.
+    """
+    if refused:
+        with pytest.raises(SystemExit):
+            util.validate_parallel_cmd_args(cmd_args, suites)  # type: ignore[no-untyped-call]
+        assert "scenarios of suites (debian) is not supported" in caplog.text
+    else:
+        util.validate_parallel_cmd_args(cmd_args, suites)  # type: ignore[no-untyped-call]
+
+
 def test_run_command():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     cmd = ["ls"]
     x = util.run_command(cmd)
@@ -341,3 +372,17 @@ def test_abs_path_with_empty_path() -> None:
 )
 def test_merge_dicts(a, b, x) -> None:  # type: ignore[no-untyped-def]  # noqa: ANN001, D103
     assert x == util.merge_dicts(a, b)
+
+
+def test_overlay_env() -> None:  # noqa: D103
+    base = {"FOO": "base", "BAR": "base"}
+    env = util.overlay_env(base, {"FOO": "first"}, {"BAZ": "second"})
+    nested = util.overlay_env(base, {"BAR": "nested"}, env, {"QUX": "last"})
+
+    assert env == {"FOO": "first", "BAR": "base", "BAZ": "second"}
+    assert nested == {"FOO": "first", "BAR": "base", "BAZ": "second", "QUX": "last"}
+    assert sum(m is base for m in nested.maps) == 1
+
+    nested["FOO"] = "written"
+    assert env["FOO"] == "first"
+    assert base == {"FOO": "base", "BAR": "base"}
@@ -0,0 +1,158 @@
+"""Unit tests for forking ansible-playbook from a zygote."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import zygote
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+PLAYBOOK = """---
+- hosts: localhost
+  gather_facts: false
+  tasks:
+    - ansible.builtin.debug:
+        msg: forked
+    - ansible.builtin.fail:
+      when: fail | default(false) | bool
+"""
+
+
+@pytest.fixture(name="zygotes", autouse=True)
+def fixture_zygotes() -> Iterator[None]:
+    """Stop the zygotes started by a test."""
+    yield
+    zygote.close()
+
+
+def test_interpreter(tmp_path: Path) -> None:
+    """The interpreter comes from the shebang, when it runs Python.
+
+    Args:
+        tmp_path: pytest temporary directory.
+    """
+    script = tmp_path / "ansible-playbook"
+    env = {"PATH": str(Path(sys.executable).parent)}
+    python = Path(sys.executable).name
+
+    script.write_text(f"#!/usr/bin/env {python}\n")
+    assert zygote._interpreter(str(script), env) == shutil.which(python, path=env["PATH"])
+
+    script.write_text("#!/bin/sh\n")
+    assert zygote._interpreter(str(script), env) == sys.executable
+
+    assert zygote._interpreter(str(tmp_path / "missing"), env) == sys.executable
+
+
+def test_tee(capsys: pytest.CaptureFixture[str]) -> None:
+    """Output is printed line by line after the output of the import.
+
+    Args:
+        capsys: pytest stdout and stderr capture fixture.
+    """
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    os.write(out_w, b"one\ntwo  \npartial")
+    os.write(err_w, b"warning\n")
+    os.close(out_w)
+    os.close(err_w)
+
+    stdout, stderr = zygote._tee((out_r, err_r), ("imported\n", ""))
+
+    assert stdout == ["imported", "one", "two", "partial"]
+    assert stderr == ["warning"]
+    assert sorted(capsys.readouterr().out.splitlines()) == sorted(stdout + stderr)
+
+
+def test_run_without_molecule(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Runs are left to a new process, with a warning, when no zygote can start.
+
+    Args:
+        tmp_path: pytest temporary directory.
+        caplog: pytest caplog fixture.
+    """
+    python = tmp_path / "python3"
+    python.write_text("#!/bin/sh\necho \"No module named 'molecule'\" >&2\nexit 1\n")
+    playbook = tmp_path / "ansible-playbook"
+    playbook.write_text(f"#!{python}\n")
+    for script in (python, playbook):
+        script.chmod(0o755)
+    cmd = ["ansible-playbook", "--version"]
+
+    with caplog.at_level(logging.WARNING):
+        result = zygote.run(cmd, {"PATH": str(tmp_path)}, str(tmp_path), "0")
+
+    assert result is None
+    assert f"no zygote could start with {python}: No module named 'molecule'" in caplog.text
+
+
+def test_run_ignores_other_commands() -> None:
+    """Only ansible-playbook is forked."""
+    assert zygote.run(["ansible-galaxy", "--version"], os.environ, None, "0") is None
+    assert zygote.run([], os.environ, None, "0") is None
+
+
+@pytest.mark.skipif(not shutil.which("ansible-playbook"), reason="needs ansible-playbook")
+@pytest.mark.parametrize(
+    "args",
+    (["pb.yml"], ["pb.yml", "-e", "fail=true"], ["missing.yml"], ["--bogus"]),
+    ids=("ok", "failed", "missing", "bad-option"),
+)
+def test_run_matches_subprocess(tmp_path: Path, args: list[str]) -> None:
+    """A forked run has the output and return code of a new process.
+
+    Args:
+        tmp_path: pytest temporary directory.
+        args: Arguments of ansible-playbook.
+    """
+    # Imported here as it is only needed when Ansible is installed.
+    from ansible.release import __version__  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    (tmp_path / "pb.yml").write_text(PLAYBOOK)
+    env = {**os.environ, "ANSIBLE_NOCOLOR": "1", "ANSIBLE_LOCAL_TEMP": str(tmp_path / "tmp")}
+    cmd = ["ansible-playbook", *args]
+
+    direct = subprocess.run(  # noqa: S603
+        cmd,
+        cwd=tmp_path,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    forked = zygote.run(cmd, env, str(tmp_path), __version__)
+
+    def lines(output: str) -> list[str]:
+        return [line.rstrip() for line in output.splitlines()]
+
+    assert forked is not None
+    assert forked.returncode == direct.returncode
+    assert lines(forked.stdout) == lines(direct.stdout)
+    assert lines(forked.stderr) == lines(direct.stderr)
+
+
+@pytest.mark.skipif(not shutil.which("ansible-playbook"), reason="needs ansible-playbook")
+def test_run_version_mismatch(tmp_path: Path) -> None:
+    """Runs are left to a new process when the zygote imports another Ansible.
+
+    Args:
+        tmp_path: pytest temporary directory.
+    """
+    cmd = ["ansible-playbook", "--version"]
+
+    assert zygote.run(cmd, os.environ, str(tmp_path), "0.0.0") is None
+    assert list(zygote._zygotes.values()) == [None]
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare the YAML backends of the codec on a large inventory.
+
+Usage: python tools/bench_codec.py [--hosts N] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from molecule import codec
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def create_inventory(hosts: int) -> dict[str, Any]:
+    """Create the inventory.
+
+    Args:
+        hosts: Number of hosts.
+
+    Returns:
+        The inventory.
+    """
+    return {
+        "all": {
+            "hosts": {
+                f"instance-{i}": {
+                    "ansible_host": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                    "ansible_port": 22,
+                    "ansible_user": "molecule",
+                    "ansible_private_key_file": f"/home/molecule/.ssh/instance-{i}",
+                    "ansible_ssh_common_args": "-o UserKnownHostsFile=/dev/null",
+                    "molecule_ephemeral_directory": "/home/molecule/.cache/molecule/role/default",
+                    "python_interpreter": "/usr/bin/python3",
+                }
+                for i in range(hosts)
+            },
+            "vars": {"molecule_no_log": False},
+        },
+        "children": {
+            f"group{g}": {"hosts": {f"instance-{i}": {} for i in range(g, hosts, 10)}}
+            for g in range(10)
+        },
+    }
+
+
+def measure(name: str, func: Callable[[], object], rounds: int) -> None:
+    """Print the best time out of several calls.
+
+    Args:
+        name: Label of the measurement.
+        func: Function to time.
+        rounds: Number of calls.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:28} {best * 1000:10.1f} ms")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    inventory = create_inventory(args.hosts)
+    document = codec.dump(inventory, backend=codec.BACKENDS["python"])
+    print(f"{args.hosts} hosts, {len(document) // 1024} KiB")  # noqa: T201
+
+    for backend in codec.BACKENDS.values():
+        if codec.dump(inventory, backend=backend) != document:
+            sys.exit(f"The {backend.name} backend dumps another document.")
+        dump = partial(codec.dump, inventory, backend=backend)
+        load = partial(codec.load, document, backend=backend)
+        measure(f"dump, {backend.name}", dump, args.rounds)
+        measure(f"load, {backend.name}", load, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
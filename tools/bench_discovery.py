@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure scenario discovery of ``molecule list`` on a synthetic checkout.
+
+Usage: python tools/bench_discovery.py [--files N] [--scenarios N] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wcmatch import glob
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+LIST_GLOB = "**/molecule/*/molecule.yml"
+
+
+def create_tree(root: Path, files: int, scenarios: int) -> None:
+    """Create the synthetic checkout.
+
+    Args:
+        root: Directory to create the checkout in.
+        files: Approximate number of files to create.
+        scenarios: Number of scenarios among them.
+    """
+    per_role = 10
+    for i in range(files // per_role):
+        if i % 3 == 0:
+            role = root / ".git" / "objects" / f"{i % 256:02x}" / f"{i}"
+        elif i % 3 == 1:
+            role = root / "collections" / "ansible_collections" / f"ns{i % 50}" / f"role{i}"
+        else:
+            role = root / "roles" / f"role{i}"
+        for d in ("tasks", "handlers", "defaults", "templates"):
+            (role / d).mkdir(parents=True, exist_ok=True)
+        for j in range(per_role):
+            (role / ("tasks", "handlers", "defaults", "templates")[j % 4] / f"f{j}.yml").touch()
+    for i in range(scenarios):
+        scenario = root / "roles" / f"role{i * 3 + 2}" / "molecule" / f"scenario{i}"
+        scenario.mkdir(parents=True)
+        (scenario / "molecule.yml").write_text(f"---\nscenario:\n  name: scenario{i}\n")
+    # Checkouts are usually not being modified while molecule runs.
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (1, 1))
+
+
+def measure(name: str, func: Callable[[], object], rounds: int) -> None:
+    """Print the best time out of several calls.
+
+    Args:
+        name: Label of the measurement.
+        func: Function to time.
+        rounds: Number of calls.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:28} {best * 1000:10.1f} ms")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--scenarios", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="molecule-bench-") as tmp:
+        os.environ["XDG_CACHE_HOME"] = os.path.join(tmp, "cache")  # noqa: PTH118
+        os.environ.pop("MOLECULE_EPHEMERAL_DIRECTORY", None)
+        root = Path(tmp) / "checkout"
+        create_tree(root, args.files, args.scenarios)
+        os.chdir(root)
+
+        # Imported once the cache location is set.
+        from molecule import discovery  # noqa: PLC0415
+        from molecule.command import base  # noqa: PLC0415
+
+        def list_discovery() -> None:
+            base.get_scenario_index({}, {"subcommand": "list"}, glob_str=LIST_GLOB)
+
+        print(f"{args.files} files, {args.scenarios} scenarios")  # noqa: T201
+        measure(
+            "wcmatch glob",
+            lambda: glob.glob(LIST_GLOB, flags=discovery.FLAGS),
+            args.rounds,
+        )
+
+        discovery.MOLECULE_DISCOVERY_CACHE = False
+        measure("list discovery, no cache", list_discovery, args.rounds)
+        discovery.MOLECULE_DISCOVERY_CACHE = True
+
+        def cold() -> None:
+            for entry in Path(os.environ["XDG_CACHE_HOME"]).glob("molecule/.discovery_cache/*"):
+                entry.unlink()
+            list_discovery()
+
+        measure("list discovery, cold cache", cold, args.rounds)
+        list_discovery()
+        measure("list discovery, warm cache", list_discovery, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Compare environment composition with merge_dicts and overlay_env.
+
+Usage: python tools/bench_env.py [--vars N] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+import tracemalloc
+
+from typing import TYPE_CHECKING, Any
+
+from molecule import util
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+MOLECULE_ENV = {f"MOLECULE_VAR_{i}": f"/path/to/value/{i}" for i in range(15)}
+ANSIBLE_ENV = {
+    "ANSIBLE_CONFIG": "/path/to/ansible.cfg",
+    "ANSIBLE_ROLES_PATH": "/a:/b:/c",
+    "ANSIBLE_COLLECTIONS_PATH": "/a:/b:/c",
+    "ANSIBLE_LIBRARY": "/a:/b",
+    "ANSIBLE_FILTER_PLUGINS": "/a:/b",
+}
+USER_ENV = {"FOO": "bar"}
+
+
+def compose(merge: Callable[..., Mapping[str, Any]], environ: Mapping[str, str]) -> dict[str, Any]:
+    """Compose the verifier environment with the given merge function.
+
+    Args:
+        merge: Function merging two mappings.
+        environ: The process environment.
+
+    Returns:
+        The flattened environment.
+    """
+    provisioner_default = merge(merge(environ, ANSIBLE_ENV), MOLECULE_ENV)
+    provisioner = merge(provisioner_default, USER_ENV)
+    verifier_default = merge(merge(environ, MOLECULE_ENV), provisioner)
+    verifier = merge(verifier_default, USER_ENV)
+    return dict(merge(verifier, USER_ENV))
+
+
+def measure(
+    name: str,
+    merge: Callable[..., Mapping[str, Any]],
+    environ: Mapping[str, str],
+    rounds: int,
+) -> None:
+    """Print time and peak allocation of composing the environment.
+
+    Args:
+        name: Label of the measurement.
+        merge: Function merging two mappings.
+        environ: The process environment.
+        rounds: Number of repetitions used for timing.
+    """
+    seconds = timeit.timeit(lambda: compose(merge, environ), number=rounds)
+    tracemalloc.start()
+    compose(merge, environ)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:12} {seconds / rounds * 1e6:10.1f} us/compose {peak / 1024:10.1f} KiB peak")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vars", type=int, default=100, help="variables added to os.environ")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    for i in range(args.vars):
+        os.environ[f"BENCH_ENV_VAR_{i}"] = "x" * 64
+    print(f"{len(os.environ)} variables in the process environment")  # noqa: T201
+    measure("merge_dicts", util.merge_dicts, os.environ, args.rounds)
+    measure("overlay_env", util.overlay_env, os.environ, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
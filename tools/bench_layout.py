@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Count the filesystem calls made by ``molecule converge``.
+
+Usage: python tools/bench_layout.py [--platforms N] [--top N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import tempfile
+
+from pathlib import Path
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+CALLS = ("stat", "lstat", "access", "listdir", "scandir")
+
+
+def create_scenario(root: Path, platforms: int) -> None:
+    """Create a role with a scenario of the default driver.
+
+    Args:
+        root: Directory of the role.
+        platforms: Number of platforms of the scenario.
+    """
+    scenario = root / "molecule" / "default"
+    scenario.mkdir(parents=True)
+    (root / "tasks").mkdir()
+    (root / "tasks" / "main.yml").write_text("---\n- ansible.builtin.debug:\n")
+    names = "".join(f"  - name: instance-{i}\n" for i in range(platforms))
+    (scenario / "molecule.yml").write_text(
+        f"---\nprerun: false\nrole_name_check: 2\nplatforms:\n{names}",
+    )
+    for name in ("create.yml", "prepare.yml", "converge.yml", "destroy.yml"):
+        (scenario / name).write_text("---\n- hosts: localhost\n  gather_facts: false\n")
+
+
+def count(func: Callable[[], object]) -> collections.Counter[tuple[str, str]]:
+    """Count the filesystem calls made by a function.
+
+    Args:
+        func: Function to run.
+
+    Returns:
+        Number of calls by function name and path.
+    """
+    calls: collections.Counter[tuple[str, str]] = collections.Counter()
+
+    def wrap(name: str) -> Callable[..., Any]:
+        original = getattr(os, name)
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            calls[name, str(args[0]) if args else "."] += 1
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    patches = [mock.patch.object(os, name, wrap(name)) for name in CALLS]
+    for patch in patches:
+        patch.start()
+    try:
+        func()
+    finally:
+        for patch in patches:
+            patch.stop()
+    return calls
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--platforms", type=int, default=2)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="molecule-bench-") as tmp:
+        os.environ["XDG_CACHE_HOME"] = os.path.join(tmp, "cache")  # noqa: PTH118
+        os.environ.pop("MOLECULE_EPHEMERAL_DIRECTORY", None)
+        root = Path(tmp) / "role"
+        create_scenario(root, args.platforms)
+        os.chdir(root)
+
+        # Imported once the cache location is set.
+        from molecule.command import base  # noqa: PLC0415
+
+        def converge() -> None:
+            # Forget the instances, so that create and prepare run again.
+            for state_file in Path(tmp, "cache").glob("molecule/*/*/state.yml"):
+                state_file.unlink()
+            with mock.patch(
+                "molecule.util.run_command",
+                side_effect=lambda cmd, **_: CompletedProcess(cmd, 0, stdout=""),
+            ):
+                base.execute_cmdline_scenarios(
+                    "default",
+                    {},
+                    {"subcommand": "converge"},
+                )
+
+        # The first run also warms the caches of configs and discovery.
+        converge()
+        calls = count(converge)
+
+    totals: collections.Counter[str] = collections.Counter()
+    for (name, _), n in calls.items():
+        totals[name] += n
+    print(f"{args.platforms} platforms, {sum(totals.values())} filesystem calls")  # noqa: T201
+    for name in CALLS:
+        print(f"  {name:10} {totals[name]:6}")  # noqa: T201
+    print("most frequent:")  # noqa: T201
+    for (name, path), n in calls.most_common(args.top):
+        print(f"  {n:6} {name:8} {os.path.relpath(path, tmp)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Compare running ``ansible-playbook`` in new processes with forking it from a zygote.
+
+Usage: python tools/bench_zygote.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+
+PLAYBOOKS = (
+    "cleanup",
+    "converge",
+    "create",
+    "destroy",
+    "prepare",
+    "side_effect",
+    "verify",
+)
+
+
+def create_scenario(root: Path) -> None:
+    """Create a role with a scenario of the default driver.
+
+    Args:
+        root: Directory of the role.
+    """
+    scenario = root / "molecule" / "default"
+    scenario.mkdir(parents=True)
+    (root / "tasks").mkdir()
+    (root / "tasks" / "main.yml").write_text("---\n- ansible.builtin.debug:\n")
+    (scenario / "molecule.yml").write_text(
+        "---\nprerun: false\nrole_name_check: 2\nplatforms:\n  - name: instance\n",
+    )
+    for name in PLAYBOOKS:
+        (scenario / f"{name}.yml").write_text(
+            "---\n- hosts: localhost\n  gather_facts: false\n"
+            f"  tasks:\n    - ansible.builtin.debug:\n        msg: {name}\n",
+        )
+
+
+def time_test(root: Path, env: dict[str, str]) -> tuple[float, int]:
+    """Run ``molecule test`` in a role.
+
+    Args:
+        root: Directory of the role.
+        env: Environment of the run.
+
+    Returns:
+        The wall time of the run, in seconds, and the number of playbooks it ran.
+    """
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-m", "molecule", "test"],
+        cwd=root,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.monotonic() - start
+    if result.returncode:
+        sys.exit(f"molecule test failed:\n{result.stdout}{result.stderr}")
+    return elapsed, result.stdout.count("PLAY RECAP")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="molecule-bench-") as tmp:
+        root = Path(tmp) / "role"
+        create_scenario(root)
+        env = {
+            **os.environ,
+            "XDG_CACHE_HOME": os.path.join(tmp, "cache"),  # noqa: PTH118
+            "MOLECULE_NO_DAEMON": "1",
+        }
+        env.pop("MOLECULE_EPHEMERAL_DIRECTORY", None)
+        env.pop("MOLECULE_ZYGOTE", None)
+
+        # The first run also warms the caches of configs and discovery.
+        time_test(root, env)
+        timings = {}
+        for name, extra in (("new processes", {}), ("zygote", {"MOLECULE_ZYGOTE": "1"})):
+            runs = [time_test(root, {**env, **extra}) for _ in range(args.runs)]
+            timings[name] = statistics.median(elapsed for elapsed, _ in runs)
+            playbooks = runs[0][1]
+
+    print(f"molecule test, {playbooks} playbooks, median of {args.runs} runs")  # noqa: T201
+    for name, elapsed in timings.items():
+        print(f"  {name:14} {elapsed:6.2f}s  {elapsed / playbooks:5.2f}s per playbook")  # noqa: T201
+    print(f"  speedup        {timings['new processes'] / timings['zygote']:6.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()